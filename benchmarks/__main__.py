@@ -0,0 +1,164 @@
+"""
+Run the benchmark suite and compare runs across commits.
+
+    python -m benchmarks run [-k PATTERN] [-o results.json]
+    python -m benchmarks compare BASELINE.json CURRENT.json [--threshold 0.10]
+
+`run` imports every `benchmarks/bench_*.py` module, calls its `run()` and
+writes one JSON document holding every metric. All metrics are lower-is-better
+(nanoseconds, milliseconds, bytes or rates), so `compare` reports a metric as
+a regression when it grew by more than the threshold, and exits with status 1
+if any did.
+"""
+
+import argparse
+import importlib
+import json
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import benchmarks
+
+
+def discover(pattern: str | None = None) -> list[str]:
+    """
+    Return the names of the benchmark modules, optionally filtered by substring.
+
+    Args:
+        pattern (str | None, optional): Substring a module name must contain.
+
+    Returns:
+        list[str]: Fully qualified module names, sorted.
+    """
+    return sorted(
+        f"benchmarks.{module.name}"
+        for module in pkgutil.iter_modules(benchmarks.__path__)
+        if module.name.startswith("bench_")
+        and (pattern is None or pattern in module.name)
+    )
+
+
+def _commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def run_suite(pattern: str | None = None) -> dict[str, Any]:
+    """
+    Run every matching benchmark module and collect its metrics.
+
+    Args:
+        pattern (str | None, optional): Substring filter on module names.
+
+    Returns:
+        dict[str, Any]: {"meta": {...}, "results": {module: {metric: value}}}.
+    """
+    results: dict[str, dict[str, float]] = {}
+    for name in discover(pattern):
+        print(f"running {name}", file=sys.stderr)
+        started = time.perf_counter()
+        results[name.removeprefix("benchmarks.")] = importlib.import_module(name).run()
+        print(f"  done in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return {
+        "meta": {
+            "commit": _commit(),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any]
+) -> list[tuple[str, str, float, float, float]]:
+    """
+    Return every metric present in both runs with its relative change.
+
+    Args:
+        baseline (dict[str, Any]): An earlier `run_suite` document.
+        current (dict[str, Any]): A later `run_suite` document.
+
+    Returns:
+        list[tuple[str, str, float, float, float]]: (module, metric, baseline
+        value, current value, relative change) for each shared metric.
+    """
+    rows = []
+    for module, metrics in current["results"].items():
+        previous = baseline["results"].get(module, {})
+        for metric, value in metrics.items():
+            if metric not in previous:
+                continue
+            before = previous[metric]
+            change = (value - before) / before if before else 0.0
+            rows.append((module, metric, before, value, change))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.split("\n\n")[0]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite and emit JSON")
+    run_parser.add_argument(
+        "-k", dest="pattern", help="only run modules containing PATTERN"
+    )
+    run_parser.add_argument(
+        "-o", "--output", type=Path, help="write JSON here instead of stdout"
+    )
+
+    compare_parser = commands.add_parser(
+        "compare", help="flag regressions between two runs"
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative increase treated as a regression (default: 0.10)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        document = json.dumps(run_suite(args.pattern), indent=2)
+        if args.output is None:
+            print(document)
+        else:
+            args.output.write_text(document + "\n")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    regressions = 0
+    for module, metric, before, after, change in compare(baseline, current):
+        flag = "REGRESSION" if change > args.threshold else ""
+        regressions += bool(flag)
+        print(
+            f"{module:<24} {metric:<48} {before:>14,.1f} {after:>14,.1f} "
+            f"{change:>+8.1%} {flag}"
+        )
+    print(f"{regressions} regression(s) above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
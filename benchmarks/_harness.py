@@ -0,0 +1,67 @@
+"""
+Small timing and allocation helpers shared by the benchmark modules.
+
+Every benchmark module exposes `run() -> dict[str, float]` returning metric
+names mapped to values where lower is better, and can be executed directly:
+
+    python -m benchmarks.bench_interning
+"""
+
+import gc
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+
+def time_ns(func: Callable[[], Any], *, number: int = 100_000, repeat: int = 5) -> float:
+    """
+    Return the best observed time per call of `func`, in nanoseconds.
+
+    Args:
+        func (Callable[[], Any]): A zero-argument callable to time.
+        number (int): Calls per measurement.
+        repeat (int): Number of measurements; the fastest one is kept.
+
+    Returns:
+        float: Nanoseconds per call.
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def allocated_bytes(func: Callable[[], Any]) -> tuple[int, int]:
+    """
+    Return the bytes still allocated and the peak bytes allocated by `func`.
+
+    The return value of `func` is kept alive until the snapshot is taken, so
+    callers can measure the footprint of the objects it builds.
+
+    Args:
+        func (Callable[[], Any]): A zero-argument callable to measure.
+
+    Returns:
+        tuple[int, int]: (retained bytes, peak bytes).
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        keep = func()
+        current, peak = tracemalloc.get_traced_memory()
+        del keep
+    finally:
+        tracemalloc.stop()
+    return current - before, peak - before
+
+
+def report(metrics: dict[str, float]) -> None:
+    """
+    Print metrics as an aligned two-column table.
+
+    Args:
+        metrics (dict[str, float]): Metric names mapped to values.
+    """
+    width = max(map(len, metrics), default=0)
+    for name, value in metrics.items():
+        print(f"{name:<{width}}  {value:>14,.1f}")
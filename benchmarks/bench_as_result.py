@@ -0,0 +1,106 @@
+"""
+Per-call overhead of as_result against a hand-written try/except, per function kind.
+
+Each "manual" row wraps the same body in the try/except that as_result
+generates, so the difference is the cost of the decorator itself.
+"""
+
+import asyncio
+
+from benchmarks._harness import report, time_ns
+from result.utils.helpers import as_result, result_fail, result_ok
+
+NUMBER = 20_000
+
+
+def _parse(text: str) -> int:
+    return int(text)
+
+
+def _manual(text: str):
+    try:
+        return result_ok(int(text))
+    except ValueError as exception:
+        return result_fail(exception)
+
+
+async def _parse_async(text: str) -> int:
+    return int(text)
+
+
+async def _manual_async(text: str):
+    try:
+        return result_ok(int(text))
+    except ValueError as exception:
+        return result_fail(exception)
+
+
+def _parse_gen(text: str):
+    yield int(text)
+
+
+def _manual_gen(text: str):
+    try:
+        for item in _parse_gen(text):
+            yield result_ok(item)
+    except ValueError as exception:
+        yield result_fail(exception)
+
+
+async def _parse_agen(text: str):
+    yield int(text)
+
+
+async def _manual_agen(text: str):
+    try:
+        async for item in _parse_agen(text):
+            yield result_ok(item)
+    except ValueError as exception:
+        yield result_fail(exception)
+
+
+def _drive(factory, text: str) -> float:
+    """Time NUMBER awaits of factory(text) inside one event loop, in ns per call."""
+
+    async def loop() -> None:
+        for _ in range(NUMBER):
+            await factory(text)
+
+    return time_ns(lambda: asyncio.run(loop()), number=1) / NUMBER
+
+
+def _drive_agen(factory, text: str) -> float:
+    async def loop() -> None:
+        for _ in range(NUMBER):
+            async for _ in factory(text):
+                pass
+
+    return time_ns(lambda: asyncio.run(loop()), number=1) / NUMBER
+
+
+def run() -> dict[str, float]:
+    metrics: dict[str, float] = {}
+    sync = as_result(ValueError)(_parse)
+    coroutine = as_result(ValueError)(_parse_async)
+    generator = as_result(ValueError)(_parse_gen)
+    async_generator = as_result(ValueError)(_parse_agen)
+    for outcome, text in (("ok", "1"), ("fail", "x")):
+        metrics[f"sync {outcome} manual ns"] = time_ns(lambda: _manual(text), number=NUMBER)
+        metrics[f"sync {outcome} as_result ns"] = time_ns(lambda: sync(text), number=NUMBER)
+        metrics[f"coroutine {outcome} manual ns"] = _drive(_manual_async, text)
+        metrics[f"coroutine {outcome} as_result ns"] = _drive(coroutine, text)
+        metrics[f"generator {outcome} manual ns"] = time_ns(
+            lambda: list(_manual_gen(text)), number=NUMBER
+        )
+        metrics[f"generator {outcome} as_result ns"] = time_ns(
+            lambda: list(generator(text)), number=NUMBER
+        )
+        metrics[f"async generator {outcome} manual ns"] = _drive_agen(_manual_agen, text)
+        metrics[f"async generator {outcome} as_result ns"] = _drive_agen(
+            async_generator, text
+        )
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
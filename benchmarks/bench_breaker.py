@@ -0,0 +1,55 @@
+"""
+Cost of circuit_breaker in the closed state, and calling throughput during a
+simulated outage where every call to the dependency stalls for 2 ms before
+failing (a slow timeout), with and without a breaker in front of it.
+"""
+
+import time
+
+from benchmarks._harness import report, time_ns
+from result.utils.breaker import circuit_breaker
+from result.utils.helpers import as_result
+
+_OUTAGE_CALLS = 500
+_STALL = 0.002
+
+
+@as_result(ValueError)
+def _parse(text: str) -> int:
+    return int(text)
+
+
+_guarded_parse = circuit_breaker()(_parse)
+
+
+@as_result(OSError)
+def _down() -> None:
+    time.sleep(_STALL)
+    raise OSError("connection timed out")
+
+
+_guarded_down = circuit_breaker(100, min_calls=20, reset_after=60)(_down)
+
+
+def _per_call_us(call) -> float:
+    started = time.perf_counter()
+    for _ in range(_OUTAGE_CALLS):
+        call()
+    return (time.perf_counter() - started) / _OUTAGE_CALLS * 1e6
+
+
+def run() -> dict[str, float]:
+    plain = time_ns(lambda: _parse("12"))
+    guarded = time_ns(lambda: _guarded_parse("12"))
+    return {
+        "as_result call ns": plain,
+        "as_result + closed breaker call ns": guarded,
+        "closed breaker overhead ns": guarded - plain,
+        "outage call, no breaker us": _per_call_us(_down),
+        "outage call, breaker us": _per_call_us(_guarded_down),
+        "open breaker rejected call ns": time_ns(_guarded_down),
+    }
+
+
+if __name__ == "__main__":
+    report(run())
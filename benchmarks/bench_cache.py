@@ -0,0 +1,57 @@
+"""
+Cost of cached_result on hits and misses against functools.lru_cache, and
+how many computations async coalescing saves for a burst of identical calls.
+"""
+
+import asyncio
+from functools import lru_cache
+
+from benchmarks._harness import report, time_ns
+from result.utils.cache import cached_result
+from result.utils.helpers import as_result
+
+BURST = 1_000
+
+
+@as_result(KeyError)
+def _lookup(key: int) -> int:
+    return key * 2
+
+
+_lru = lru_cache(maxsize=128)(_lookup)
+_cached = cached_result(128)(_lookup)
+_cached_ttl = cached_result(128, ok_ttl=60, fail_ttl=5)(_lookup)
+_uncached_keys = iter(range(10**12))
+
+
+def _burst() -> float:
+    computations = 0
+
+    @cached_result()
+    async def fetch(key: int):
+        nonlocal computations
+        computations += 1
+        await asyncio.sleep(0.001)
+        return await asyncio.sleep(0, _lookup(key))
+
+    async def main() -> None:
+        await asyncio.gather(*(fetch(key % 10) for key in range(BURST)))
+
+    asyncio.run(main())
+    return computations
+
+
+def run() -> dict[str, float]:
+    _lru(1), _cached(1), _cached_ttl(1)
+    return {
+        "uncached call ns": time_ns(lambda: _lookup(1)),
+        "lru_cache hit ns": time_ns(lambda: _lru(1)),
+        "cached_result hit ns": time_ns(lambda: _cached(1)),
+        "cached_result(ok_ttl) hit ns": time_ns(lambda: _cached_ttl(1)),
+        "cached_result miss + evict ns": time_ns(lambda: _cached(next(_uncached_keys))),
+        f"async burst of {BURST} over 10 keys computations": _burst(),
+    }
+
+
+if __name__ == "__main__":
+    report(run())
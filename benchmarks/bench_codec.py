@@ -0,0 +1,70 @@
+"""
+Size and throughput of result.codec against pickle protocol 5, for a list of
+results and for a ResultArray batch.
+
+Pickling a list lets pickle memoise the Ok/Fail class reference, so its
+per-item overhead is small. The codec pays a five-byte frame header plus
+whatever the payload codec adds per value.
+"""
+
+import pickle
+
+from benchmarks._harness import report, time_ns
+from result.base import ResultArray
+from result.codec import (
+    JSON,
+    PICKLE,
+    decode_array,
+    decode_many,
+    encode_array,
+    encode_many,
+)
+from result.utils.helpers import result_fail, result_ok
+
+COUNT = 100_000
+
+RESULTS = [
+    result_fail(f"invalid row {index}") if index % 10 == 0 else result_ok(index * 1000)
+    for index in range(COUNT)
+]
+ARRAY = ResultArray(RESULTS, typecode="q")
+
+
+def _ms(func) -> float:
+    return time_ns(func, number=1, repeat=5) / 1e6
+
+
+def run() -> dict[str, float]:
+    metrics: dict[str, float] = {}
+    cases = {
+        "pickle(protocol=5) list": (
+            lambda: pickle.dumps(RESULTS, protocol=5),
+            pickle.loads,
+        ),
+        "codec JSON list": (
+            lambda: encode_many(RESULTS, JSON),
+            lambda data: decode_many(data, JSON),
+        ),
+        "codec PICKLE list": (
+            lambda: encode_many(RESULTS, PICKLE),
+            lambda data: decode_many(data, PICKLE),
+        ),
+        "pickle(protocol=5) ResultArray columns": (
+            lambda: pickle.dumps((ARRAY._oks, ARRAY._fails, ARRAY._bitmap), protocol=5),
+            pickle.loads,
+        ),
+        "codec ResultArray batch": (
+            lambda: encode_array(ARRAY, JSON),
+            lambda data: decode_array(data, JSON),
+        ),
+    }
+    for name, (dump, load) in cases.items():
+        data = dump()
+        metrics[f"{name} x{COUNT} bytes"] = len(data)
+        metrics[f"{name} x{COUNT} encode ms"] = _ms(dump)
+        metrics[f"{name} x{COUNT} decode ms"] = _ms(lambda: load(data))
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
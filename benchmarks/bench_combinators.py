@@ -0,0 +1,58 @@
+"""
+Five-step chains with Ok/Fail combinators against the guard-and-rewrap idiom.
+
+The idiom rows guard every step with is_fail and rebuild the next result,
+which is what callers wrote before map / and_then existed. Payloads are kept
+above the interned small-int range so both sides allocate the same Ok objects.
+"""
+
+from benchmarks._harness import report, time_ns
+from result.base import Fail, Ok
+from result.guards import is_fail
+from result.utils.helpers import result_fail, result_ok
+
+
+def _increment(value: int) -> int:
+    return value + 1
+
+
+def _checked(value: int):
+    return Ok(value) if value < 1_000_000 else Fail("too large")
+
+
+def _chain(result):
+    return (
+        result.map(_increment)
+        .and_then(_checked)
+        .map(_increment)
+        .map_err(str.upper)
+        .and_then(_checked)
+    )
+
+
+def _idiom(result):
+    if not is_fail(result):
+        result = result_ok(_increment(result.value))
+    if not is_fail(result):
+        result = _checked(result.value)
+    if not is_fail(result):
+        result = result_ok(_increment(result.value))
+    if is_fail(result):
+        result = result_fail(str.upper(result.value))
+    if not is_fail(result):
+        result = _checked(result.value)
+    return result
+
+
+def run() -> dict[str, float]:
+    ok, fail = Ok(1_000), Fail("error")
+    return {
+        "5-step chain from Ok combinators ns": time_ns(lambda: _chain(ok)),
+        "5-step chain from Ok idiom ns": time_ns(lambda: _idiom(ok)),
+        "5-step chain from Fail combinators ns": time_ns(lambda: _chain(fail)),
+        "5-step chain from Fail idiom ns": time_ns(lambda: _idiom(fail)),
+    }
+
+
+if __name__ == "__main__":
+    report(run())
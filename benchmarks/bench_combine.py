@@ -0,0 +1,52 @@
+"""
+Peak memory and latency of result_combine against the streaming variants.
+
+Inputs are generators, so the only memory measured is what each combinator
+keeps while consuming them.
+"""
+
+from collections import deque
+
+from benchmarks._harness import allocated_bytes, report, time_ns
+from result.utils.helpers import (
+    result_combine,
+    result_combine_chunked,
+    result_combine_iter,
+    result_ok,
+)
+
+COUNT = 200_000
+CHUNK = 1_000
+
+
+def _source():
+    return (result_ok(index) for index in range(COUNT))
+
+
+def _drain_iter() -> None:
+    deque(result_combine_iter(_source()), maxlen=0)
+
+
+def _drain_chunked() -> None:
+    deque(result_combine_chunked(_source(), CHUNK), maxlen=0)
+
+
+def run() -> dict[str, float]:
+    return {
+        f"result_combine x{COUNT} peak bytes": allocated_bytes(
+            lambda: result_combine(_source())
+        )[1],
+        f"result_combine_iter x{COUNT} peak bytes": allocated_bytes(_drain_iter)[1],
+        f"result_combine_chunked({CHUNK}) x{COUNT} peak bytes": allocated_bytes(
+            _drain_chunked
+        )[1],
+        f"result_combine x{COUNT} ms": time_ns(lambda: result_combine(_source()), number=1)
+        / 1e6,
+        f"result_combine_iter x{COUNT} ms": time_ns(_drain_iter, number=1) / 1e6,
+        f"result_combine_chunked({CHUNK}) x{COUNT} ms": time_ns(_drain_chunked, number=1)
+        / 1e6,
+    }
+
+
+if __name__ == "__main__":
+    report(run())
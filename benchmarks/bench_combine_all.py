@@ -0,0 +1,63 @@
+"""
+Latency and memory of result_combine_all / result_partition against a
+hand-written loop that collects errors and their positions into lists.
+
+A fifth of the inputs fail, as in a typical validation batch.
+"""
+
+from benchmarks._harness import allocated_bytes, report, time_ns
+from result.guards.base import is_fail
+from result.utils.helpers import (
+    result_combine_all,
+    result_fail,
+    result_ok,
+    result_partition,
+)
+
+COUNT = 100_000
+CAP = 100
+
+RESULTS = [
+    result_fail(f"bad {index}") if index % 5 == 0 else result_ok(index * 1000)
+    for index in range(COUNT)
+]
+
+
+def _manual() -> tuple[list[int], list[str], list[int]]:
+    values, errors, indices = [], [], []
+    for index, result in enumerate(RESULTS):
+        if is_fail(result):
+            errors.append(result.value)
+            indices.append(index)
+        else:
+            values.append(result.value)
+    return values, errors, indices
+
+
+def run() -> dict[str, float]:
+    return {
+        f"manual loop x{COUNT} ms": time_ns(_manual, number=1, repeat=10) / 1e6,
+        f"result_partition x{COUNT} ms": time_ns(
+            lambda: result_partition(RESULTS), number=1, repeat=10
+        )
+        / 1e6,
+        f"result_combine_all x{COUNT} ms": time_ns(
+            lambda: result_combine_all(RESULTS), number=1, repeat=10
+        )
+        / 1e6,
+        f"result_combine_all(max_errors={CAP}) x{COUNT} ms": time_ns(
+            lambda: result_combine_all(RESULTS, CAP), number=1, repeat=10
+        )
+        / 1e6,
+        f"manual loop x{COUNT} retained bytes": allocated_bytes(_manual)[0],
+        f"result_partition x{COUNT} retained bytes": allocated_bytes(
+            lambda: result_partition(RESULTS)
+        )[0],
+        f"result_combine_all(max_errors={CAP}) x{COUNT} retained bytes": allocated_bytes(
+            lambda: result_combine_all(RESULTS, CAP)
+        )[0],
+    }
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,64 @@
+"""
+Core Result operations: construction, guards, combining, unwrapping,
+as_result, pattern matching and iteration-unpacking.
+"""
+
+from benchmarks._harness import report, time_ns
+from result.base import Fail, Ok
+from result.guards import is_fail, is_ok, is_result
+from result.utils.helpers import (
+    as_result,
+    result_combine,
+    result_fail,
+    result_ok,
+    unwrap_or,
+    value_or,
+)
+
+COMBINE_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+def _match(result) -> object:
+    match result:
+        case Ok(value):
+            return value
+        case Fail(error):
+            return error
+
+
+def _unpack(result) -> object:
+    (value,) = result
+    return value
+
+
+def run() -> dict[str, float]:
+    ok, fail = result_ok(1000), result_fail("error")
+    parse = as_result(ValueError)(int)
+    metrics: dict[str, float] = {
+        "result_ok(1000) ns": time_ns(lambda: result_ok(1000)),
+        "result_ok(None) ns": time_ns(lambda: result_ok(None)),
+        'result_fail("error") ns': time_ns(lambda: result_fail("error")),
+        "is_ok ns": time_ns(lambda: is_ok(ok)),
+        "is_fail ns": time_ns(lambda: is_fail(fail)),
+        "is_result ns": time_ns(lambda: is_result(ok)),
+        "value_or(Ok) ns": time_ns(lambda: value_or(ok, 0)),
+        "value_or(Fail) ns": time_ns(lambda: value_or(fail, 0)),
+        "unwrap_or(Ok) ns": time_ns(lambda: unwrap_or(ok, 0)),
+        "unwrap_or(object) ns": time_ns(lambda: unwrap_or(None, 0)),
+        "as_result success ns": time_ns(lambda: parse("1")),
+        "as_result failure ns": time_ns(lambda: parse("x"), number=20_000),
+        "match Ok ns": time_ns(lambda: _match(ok)),
+        "match Fail ns": time_ns(lambda: _match(fail)),
+        "unpack Ok ns": time_ns(lambda: _unpack(ok)),
+    }
+    for size in COMBINE_SIZES:
+        results = [Ok(index) for index in range(size)]
+        number = max(1, 100_000 // size)
+        metrics[f"result_combine({size}) ns/item"] = (
+            time_ns(lambda: result_combine(results), number=number, repeat=3) / size
+        )
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
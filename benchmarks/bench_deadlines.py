@@ -0,0 +1,79 @@
+"""
+Per-call cost of deadline-aware as_result: with no deadline in effect (runs
+inline), with a sync timeout (runs on a worker thread), and with a coroutine
+timeout (runs under an asyncio timeout scope), plus how long a caller waits
+on a call that overruns a 10 ms timeout.
+"""
+
+import asyncio
+import threading
+import time
+
+from benchmarks._harness import report, time_ns
+from result.utils.helpers import as_result
+
+
+@as_result(ValueError)
+def _parse(text: str) -> int:
+    return int(text)
+
+
+@as_result(ValueError, deadline=True)
+def _parse_deadline(text: str) -> int:
+    return int(text)
+
+
+@as_result(ValueError, timeout=1.0)
+def _parse_timeout(text: str) -> int:
+    return int(text)
+
+
+@as_result(ValueError)
+async def _aparse(text: str) -> int:
+    return int(text)
+
+
+@as_result(ValueError, timeout=1.0)
+async def _aparse_timeout(text: str) -> int:
+    return int(text)
+
+
+def _async_ns(func, calls: int = 20_000) -> float:
+    async def loop() -> float:
+        started = time.perf_counter_ns()
+        for _ in range(calls):
+            await func("12")
+        return (time.perf_counter_ns() - started) / calls
+
+    return asyncio.run(loop())
+
+
+def _overrun_wait_ms() -> float:
+    release = threading.Event()
+
+    @as_result(ValueError, timeout=0.01)
+    def stuck() -> None:
+        release.wait(5)
+
+    started = time.perf_counter()
+    stuck()
+    elapsed = time.perf_counter() - started
+    release.set()
+    return elapsed * 1e3
+
+
+def run() -> dict[str, float]:
+    return {
+        "as_result call ns": time_ns(lambda: _parse("12")),
+        "deadline=True, no deadline set ns": time_ns(lambda: _parse_deadline("12")),
+        "timeout=, sync worker thread ns": time_ns(
+            lambda: _parse_timeout("12"), number=5_000
+        ),
+        "async as_result call ns": _async_ns(_aparse),
+        "async timeout= call ns": _async_ns(_aparse_timeout),
+        "wait on 10 ms overrun ms": _overrun_wait_ms(),
+    }
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,56 @@
+"""
+Variant dispatch cost: exact-type/tag checks against the former ABC path.
+
+The "abc" rows reproduce the previous implementations, which relied on
+isinstance(x, _Result) and the isOk() / isFail() methods.
+"""
+
+from benchmarks._harness import report, time_ns
+from result.base import Fail, Ok, _Result
+from result.guards import is_fail, is_ok, is_result
+from result.utils.helpers import unwrap_or, value_or
+
+
+def _abc_is_result(result: object) -> bool:
+    return isinstance(result, _Result)
+
+
+def _abc_is_fail(result) -> bool:
+    return result.isFail()
+
+
+def _abc_value_or(result, default):
+    if not isinstance(result, _Result):
+        raise TypeError(result)
+    if not _abc_is_fail(result):
+        return result.value
+    return default
+
+
+def _abc_unwrap_or(result, default):
+    if isinstance(result, _Result):
+        return result.value
+    return default
+
+
+def run() -> dict[str, float]:
+    ok, fail, other = Ok(1), Fail("error"), object()
+    return {
+        "is_result(Ok) abc ns": time_ns(lambda: _abc_is_result(ok)),
+        "is_result(Ok) tag ns": time_ns(lambda: is_result(ok)),
+        "is_result(object) abc ns": time_ns(lambda: _abc_is_result(other)),
+        "is_result(object) tag ns": time_ns(lambda: is_result(other)),
+        "is_fail(Fail) abc ns": time_ns(lambda: _abc_is_fail(fail)),
+        "is_fail(Fail) tag ns": time_ns(lambda: is_fail(fail)),
+        "is_ok(Ok) tag ns": time_ns(lambda: is_ok(ok)),
+        "value_or(Fail) abc ns": time_ns(lambda: _abc_value_or(fail, 0)),
+        "value_or(Fail) tag ns": time_ns(lambda: value_or(fail, 0)),
+        "unwrap_or(Ok) abc ns": time_ns(lambda: _abc_unwrap_or(ok, 0)),
+        "unwrap_or(Ok) tag ns": time_ns(lambda: unwrap_or(ok, 0)),
+        "Ok == Fail abc ns": time_ns(lambda: isinstance(fail, Ok) and ok.value == fail.value),
+        "Ok == Fail tag ns": time_ns(lambda: ok == fail),
+    }
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,66 @@
+"""
+Latency and peak task count of gather_results against asyncio.gather
+followed by result_combine, for a batch where one early item fails while the
+rest are slow.
+"""
+
+import asyncio
+
+from benchmarks._harness import report, time_ns
+from result.utils.aio import gather_results
+from result.utils.helpers import result_combine, result_fail, result_ok
+
+COUNT = 2_000
+FAIL_AT = 10
+LIMIT = 100
+
+# Live coroutines (one per task), tracked with counters because
+# asyncio.all_tasks() is itself O(tasks).
+_live = 0
+_peak = 0
+
+
+async def _call(index: int):
+    global _live, _peak
+    _live += 1
+    _peak = max(_peak, _live)
+    try:
+        if index == FAIL_AT:
+            await asyncio.sleep(0.001)
+            return result_fail(f"item {index}")
+        await asyncio.sleep(0.02)
+        return result_ok(index)
+    finally:
+        _live -= 1
+
+
+async def _with_gather():
+    return result_combine(await asyncio.gather(*map(_call, range(COUNT))))
+
+
+async def _with_gather_results(limit: int | None):
+    return await gather_results(map(_call, range(COUNT)), limit=limit)
+
+
+def _measure(make) -> tuple[float, int]:
+    global _live, _peak
+    _live = _peak = 0
+    elapsed = time_ns(lambda: asyncio.run(make()), number=1, repeat=3)
+    return elapsed / 1e6, _peak
+
+
+def run() -> dict[str, float]:
+    metrics: dict[str, float] = {}
+    for name, make in (
+        ("asyncio.gather + result_combine", _with_gather),
+        ("gather_results", lambda: _with_gather_results(None)),
+        (f"gather_results(limit={LIMIT})", lambda: _with_gather_results(LIMIT)),
+    ):
+        ms, peak = _measure(make)
+        metrics[f"{name} x{COUNT} ms"] = ms
+        metrics[f"{name} x{COUNT} peak tasks"] = peak
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,45 @@
+"""
+Hash collisions and dict throughput for mixed Ok/Fail keys.
+
+The "legacy" rows reproduce the previous untagged hash, hash((True, value)),
+which was shared by Ok and Fail, as the baseline.
+"""
+
+from benchmarks._harness import report, time_ns
+from result.base import Fail, Ok
+
+COUNT = 100_000
+
+
+def _collision_rate(hashes: list[int]) -> float:
+    return 1 - len(set(hashes)) / len(hashes)
+
+
+def run() -> dict[str, float]:
+    keys = [Ok(i) for i in range(COUNT)] + [Fail(i) for i in range(COUNT)]
+    legacy_hashes = [hash((True, key.value)) for key in keys]
+    metrics: dict[str, float] = {
+        "collision rate legacy %": _collision_rate(legacy_hashes) * 100,
+        "collision rate tagged %": _collision_rate([hash(key) for key in keys]) * 100,
+    }
+
+    def insert_fresh() -> dict:
+        fresh = [Ok(i) for i in range(COUNT)] + [Fail(i) for i in range(COUNT)]
+        return dict.fromkeys(fresh)
+
+    def insert_hashed() -> dict:
+        return dict.fromkeys(keys)
+
+    per_key = 2 * COUNT
+    metrics["build + dict insert ns/key"] = time_ns(insert_fresh, number=1) / per_key
+    metrics["dict insert, cached hash ns/key"] = time_ns(insert_hashed, number=1) / per_key
+
+    payload = tuple(range(1_000))
+    big = Ok(payload)
+    metrics["hash 1000-tuple payload legacy ns"] = time_ns(lambda: hash((True, payload)))
+    metrics["hash 1000-tuple payload cached ns"] = time_ns(lambda: hash(big))
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
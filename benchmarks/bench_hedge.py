@@ -0,0 +1,95 @@
+"""
+Tail latency of a simulated replica call with and without hedging.
+
+Each attempt takes 2 ms, except 5% of attempts (chosen by a seeded RNG)
+which stall for 40 ms. Hedging after 5 ms with two attempts cuts the p99
+from the stall time to about the threshold plus one fast attempt, at the
+cost of the extra attempts reported below.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Callable
+
+from benchmarks._harness import report
+from result.base import Ok
+from result.utils.hedge import hedged
+
+_CALLS = 300
+_FAST = 0.002
+_SLOW = 0.040
+_SLOW_RATE = 0.05
+_AFTER = 0.005
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+
+def _delays(seed: int) -> Callable[[], float]:
+    rng = random.Random(seed)
+    return lambda: _SLOW if rng.random() < _SLOW_RATE else _FAST
+
+
+def _measure(call: Callable[[], Any]) -> list[float]:
+    samples = []
+    for _ in range(_CALLS):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1e3)
+    return samples
+
+
+def _sync_metrics() -> dict[str, float]:
+    delay = _delays(1)
+    attempts = [0]
+
+    def replica() -> Any:
+        attempts[0] += 1
+        time.sleep(delay())
+        return Ok(None)
+
+    plain = _measure(replica)
+    attempts[0] = 0
+    call = hedged(replica, after=_AFTER, max_attempts=2)
+    fast = _measure(call)
+    return {
+        "sync plain p50 ms": _percentile(plain, 50),
+        "sync plain p99 ms": _percentile(plain, 99),
+        "sync hedged p50 ms": _percentile(fast, 50),
+        "sync hedged p99 ms": _percentile(fast, 99),
+        "sync hedged attempts per call": attempts[0] / _CALLS,
+    }
+
+
+def _async_metrics() -> dict[str, float]:
+    delay = _delays(2)
+
+    async def replica() -> Any:
+        await asyncio.sleep(delay())
+        return Ok(None)
+
+    async def measure(call: Callable[[], Any]) -> list[float]:
+        samples = []
+        for _ in range(_CALLS):
+            started = time.perf_counter()
+            await call()
+            samples.append((time.perf_counter() - started) * 1e3)
+        return samples
+
+    plain = asyncio.run(measure(replica))
+    fast = asyncio.run(measure(hedged(replica, after=_AFTER, max_attempts=2)))
+    return {
+        "async plain p99 ms": _percentile(plain, 99),
+        "async hedged p99 ms": _percentile(fast, 99),
+    }
+
+
+def run() -> dict[str, float]:
+    return {**_sync_metrics(), **_async_metrics()}
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,90 @@
+"""
+Cold import time of the result package, measured with `python -X importtime`.
+
+Each statement runs in a fresh interpreter. The reported value is the median,
+over several runs, of the summed cumulative time of every top-level import
+the statement triggers beyond interpreter start-up.
+
+    python -m benchmarks.bench_import          # print timings
+    python -m benchmarks.bench_import --check  # exit 1 if a budget is exceeded
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+from benchmarks._harness import report
+
+RUNS = 7
+
+# Budgets in milliseconds. They are deliberately loose so that slow CI hosts
+# pass, while still catching an eager import of the helpers or a heavy new
+# dependency sneaking into the package root.
+BUDGET_MS: dict[str, float] = {
+    "import result": 8.0,
+    "from result import Ok": 50.0,
+    "from result import as_result": 60.0,
+}
+
+
+def _importtime(statement: str) -> list[tuple[str, int]]:
+    """Return (module, cumulative microseconds) for each top-level import."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ,
+    )
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line.split("|")
+        # Nested imports are indented by two spaces per level.
+        if name.startswith("  ") or not cumulative_us.strip().isdigit():
+            continue
+        entries.append((name.strip(), int(cumulative_us)))
+    return entries
+
+
+def _import_ms(statement: str) -> float:
+    startup = {name for name, _ in _importtime("pass")}
+    return (
+        sum(us for name, us in _importtime(statement) if name not in startup) / 1000
+    )
+
+
+def run() -> dict[str, float]:
+    return {
+        f"{statement} ms": statistics.median(_import_ms(statement) for _ in range(RUNS))
+        for statement in BUDGET_MS
+    }
+
+
+def check(metrics: dict[str, float]) -> list[str]:
+    """
+    Return a message for every statement whose import time exceeds its budget.
+
+    Args:
+        metrics (dict[str, float]): The output of run().
+
+    Returns:
+        list[str]: One message per exceeded budget.
+    """
+    return [
+        f"{statement}: {metrics[f'{statement} ms']:.1f} ms > budget {budget:.1f} ms"
+        for statement, budget in BUDGET_MS.items()
+        if metrics[f"{statement} ms"] > budget
+    ]
+
+
+if __name__ == "__main__":
+    results = run()
+    report(results)
+    if "--check" in sys.argv[1:]:
+        failures = check(results)
+        for failure in failures:
+            print(failure, file=sys.stderr)
+        sys.exit(1 if failures else 0)
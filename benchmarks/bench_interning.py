@@ -0,0 +1,39 @@
+"""
+Allocation and latency of result_ok / result_fail with interned payloads.
+
+The "direct" rows construct the dataclasses the way result_ok did before
+interning and are the baseline for the "result_ok" / "result_fail" rows.
+"""
+
+from benchmarks._harness import allocated_bytes, report, time_ns
+from result.base import Fail, Ok
+from result.utils.helpers import register_fail_sentinel, result_fail, result_ok
+
+COUNT = 100_000
+
+
+def run() -> dict[str, float]:
+    register_fail_sentinel("not_found")
+    metrics: dict[str, float] = {}
+
+    for label, value in (("None", None), ("True", True), ("7", 7)):
+        metrics[f"Ok({label}) direct ns"] = time_ns(lambda: Ok(value))
+        metrics[f"result_ok({label}) ns"] = time_ns(lambda: result_ok(value))
+    metrics["result_ok(1000) uninterned ns"] = time_ns(lambda: result_ok(1000))
+    metrics['Fail("not_found") direct ns'] = time_ns(lambda: Fail("not_found"))
+    metrics['result_fail("not_found") ns'] = time_ns(lambda: result_fail("not_found"))
+
+    metrics[f"Ok(None) direct x{COUNT} bytes"] = allocated_bytes(
+        lambda: [Ok(None) for _ in range(COUNT)]
+    )[0]
+    metrics[f"result_ok() x{COUNT} bytes"] = allocated_bytes(
+        lambda: [result_ok() for _ in range(COUNT)]
+    )[0]
+    metrics[f'result_fail("not_found") x{COUNT} bytes'] = allocated_bytes(
+        lambda: [result_fail("not_found") for _ in range(COUNT)]
+    )[0]
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
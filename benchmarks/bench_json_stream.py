@@ -0,0 +1,82 @@
+"""
+Peak memory and time of the streaming JSON encoder/decoder for 1M results,
+against converting every result to a dict and using json.dumps / json.loads.
+
+Encoding writes to a sink that discards its input, and decoding reads from
+a file on disk, so only what each approach holds in memory is measured.
+"""
+
+import json
+import os
+import tempfile
+
+from benchmarks._harness import allocated_bytes, report, time_ns
+from result.base import Fail, Ok
+from result.json_stream import dump, iter_load
+
+COUNT = 1_000_000
+
+
+class _Sink:
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def _results():
+    for index in range(COUNT):
+        yield Fail(f"row {index} invalid") if index % 10 == 0 else Ok(index)
+
+
+def _dicts_dumps() -> None:
+    _Sink().write(
+        json.dumps(
+            [
+                {"ok": result.value} if result._is_ok else {"err": result.value}
+                for result in _results()
+            ]
+        )
+    )
+
+
+def _stream_dump() -> None:
+    dump(_results(), _Sink())
+
+
+def _dicts_loads(path: str):
+    def load() -> None:
+        with open(path) as fp:
+            for item in json.load(fp):
+                Ok(item["ok"]) if "ok" in item else Fail(item["err"])
+
+    return load
+
+
+def _stream_load(path: str):
+    def load() -> None:
+        with open(path) as fp:
+            for _ in iter_load(fp):
+                pass
+
+    return load
+
+
+def run() -> dict[str, float]:
+    metrics: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results.json")
+        with open(path, "w") as fp:
+            dump(_results(), fp)
+        metrics[f"payload x{COUNT} bytes"] = os.path.getsize(path)
+        for name, func in (
+            ("dicts + json.dumps", _dicts_dumps),
+            ("json_stream.dump", _stream_dump),
+            ("json.load + dicts", _dicts_loads(path)),
+            ("json_stream.iter_load", _stream_load(path)),
+        ):
+            metrics[f"{name} x{COUNT} ms"] = time_ns(func, number=1, repeat=2) / 1e6
+            metrics[f"{name} x{COUNT} peak bytes"] = allocated_bytes(func)[1]
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
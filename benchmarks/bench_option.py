@@ -0,0 +1,50 @@
+"""
+Cache-lookup style "maybe a value" with Some/Nothing against the Ok/Fail workaround.
+
+The workaround rows encode a miss as Fail("missing"), as callers did before
+Option existed.
+"""
+
+from benchmarks._harness import allocated_bytes, report, time_ns
+from result.base import Fail, Ok
+from result.guards import is_fail, is_some
+from result.nothing import Nothing
+from result.option import Some
+
+COUNT = 100_000
+CACHE = {"hit": 1}
+
+
+def _lookup_option(key: str):
+    value = CACHE.get(key)
+    return Nothing if value is None else Some(value)
+
+
+def _lookup_result(key: str):
+    value = CACHE.get(key)
+    return Fail("missing") if value is None else Ok(value)
+
+
+def run() -> dict[str, float]:
+    metrics: dict[str, float] = {}
+    for key in ("hit", "miss"):
+        metrics[f"{key} Some/Nothing lookup+unwrap_or ns"] = time_ns(
+            lambda: _lookup_option(key).unwrap_or(0)
+        )
+        metrics[f"{key} Ok/Fail lookup+guard ns"] = time_ns(
+            lambda: 0 if is_fail(result := _lookup_result(key)) else result.value
+        )
+        metrics[f"{key} Some/Nothing lookup+guard ns"] = time_ns(
+            lambda: option.value if is_some(option := _lookup_option(key)) else 0
+        )
+    metrics[f"miss Nothing x{COUNT} bytes"] = allocated_bytes(
+        lambda: [_lookup_option("miss") for _ in range(COUNT)]
+    )[0]
+    metrics[f"miss Fail x{COUNT} bytes"] = allocated_bytes(
+        lambda: [_lookup_result("miss") for _ in range(COUNT)]
+    )[0]
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,59 @@
+"""
+Throughput of result_map on an I/O-bound (sleep-based) workload against a
+plain sequential loop, plus how quickly fail_fast stops a failing batch.
+"""
+
+import time
+from collections import deque
+
+from benchmarks._harness import report, time_ns
+from result.utils.helpers import as_result
+from result.utils.parallel import result_map
+
+COUNT = 200
+DELAY = 0.001
+
+
+@as_result(ValueError)
+def _io_call(index: int) -> int:
+    time.sleep(DELAY)
+    if index == COUNT // 10:
+        raise ValueError(index)
+    return index
+
+
+def _sequential() -> None:
+    deque(map(_io_call, range(COUNT)), maxlen=0)
+
+
+def _parallel(max_in_flight: int, fail_fast: bool = False):
+    def call() -> None:
+        deque(
+            result_map(
+                _io_call, range(COUNT), max_in_flight=max_in_flight, fail_fast=fail_fast
+            ),
+            maxlen=0,
+        )
+
+    return call
+
+
+def run() -> dict[str, float]:
+    metrics = {
+        f"sequential x{COUNT} ({DELAY * 1e3:g}ms sleep) ms": time_ns(
+            _sequential, number=1, repeat=3
+        )
+        / 1e6
+    }
+    for in_flight in (8, 32, 128):
+        metrics[f"result_map(max_in_flight={in_flight}) x{COUNT} ms"] = (
+            time_ns(_parallel(in_flight), number=1, repeat=3) / 1e6
+        )
+    metrics[f"result_map(max_in_flight=32, fail_fast) x{COUNT} ms"] = (
+        time_ns(_parallel(32, fail_fast=True), number=1, repeat=3) / 1e6
+    )
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,82 @@
+"""
+Scaling of result_map_processes on a CPU-bound workload from one worker up
+to the number of usable CPUs, against a sequential loop, and the effect of
+automatic chunking against one item per task.
+
+Pools are started and warmed up before timing, so process start-up is not
+measured.
+"""
+
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from os import process_cpu_count
+
+from benchmarks._harness import report, time_ns
+from result.base import ErrorRecord
+from result.utils.helpers import as_result, result_fail, result_ok
+from result.utils.parallel import result_map_processes
+
+COUNT = 2_000
+WORK = 2_000
+
+
+@as_result(ValueError)
+def _cpu_call(seed: int) -> int:
+    total = seed
+    for step in range(WORK):
+        total = (total * 31 + step) % 1_000_003
+    return total
+
+
+def _sequential() -> None:
+    deque(map(_cpu_call, range(COUNT)), maxlen=0)
+
+
+def _worker_counts() -> list[int]:
+    cpus = process_cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def run() -> dict[str, float]:
+    metrics = {
+        "pickled Ok(int) bytes": len(pickle.dumps(result_ok(1_000), 5)),
+        "pickled Fail(ErrorRecord) bytes": len(
+            pickle.dumps(
+                result_fail(ErrorRecord.from_exception(ValueError("bad input"))), 5
+            )
+        ),
+        f"sequential x{COUNT} ms": time_ns(_sequential, number=1, repeat=3) / 1e6,
+    }
+    for workers in _worker_counts():
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            deque(executor.map(abs, range(workers * 4)), maxlen=0)
+
+            def mapped(chunksize: int | None = None) -> None:
+                deque(
+                    result_map_processes(
+                        _cpu_call,
+                        range(COUNT),
+                        executor,
+                        max_workers=workers,
+                        chunksize=chunksize,
+                    ),
+                    maxlen=0,
+                )
+
+            metrics[f"result_map_processes({workers} workers) x{COUNT} ms"] = (
+                time_ns(mapped, number=1, repeat=3) / 1e6
+            )
+            metrics[
+                f"result_map_processes({workers} workers, chunksize=1) x{COUNT} ms"
+            ] = (time_ns(lambda: mapped(1), number=1, repeat=3) / 1e6)
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
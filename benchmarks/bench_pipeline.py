@@ -0,0 +1,54 @@
+"""
+A ten-step ingestion chain: compiled pipeline against calling the steps in turn.
+
+The "chained" rows call each as_result step and unwrap it with a guard, which
+allocates an intermediate Ok per step and is what pipeline replaces.
+"""
+
+from benchmarks._harness import report, time_ns
+from result.guards import is_fail
+from result.utils.compose import pipeline
+from result.utils.helpers import as_result, result_ok
+
+STEPS = 10
+
+
+@as_result(ValueError)
+def _step(value: int) -> int:
+    if value < 0:
+        raise ValueError(value)
+    return value + 1_000
+
+
+def _chained(value: int):
+    for _ in range(STEPS):
+        result = _step(value)
+        if is_fail(result):
+            return result
+        value = result.value
+    return result_ok(value)
+
+
+def run() -> dict[str, float]:
+    compiled = pipeline(*[_step] * STEPS)
+    timed = pipeline(*[_step] * STEPS, timed=True)
+    records = list(range(1_000, 11_000))
+    return {
+        f"{STEPS}-step chained calls ns": time_ns(lambda: _chained(1_000)),
+        f"{STEPS}-step pipeline ns": time_ns(lambda: compiled(1_000)),
+        f"{STEPS}-step pipeline timed ns": time_ns(lambda: timed(1_000)),
+        f"{STEPS}-step chained calls, first step fails ns": time_ns(
+            lambda: _chained(-1), number=20_000
+        ),
+        f"{STEPS}-step pipeline, first step fails ns": time_ns(
+            lambda: compiled(-1), number=20_000
+        ),
+        f"{STEPS}-step pipeline batch x{len(records)} ms": time_ns(
+            lambda: list(compiled.batch(records)), number=1
+        )
+        / 1e6,
+    }
+
+
+if __name__ == "__main__":
+    report(run())
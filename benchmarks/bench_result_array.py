@@ -0,0 +1,45 @@
+"""
+Memory footprint and bulk-operation cost of ResultArray against a list of results.
+"""
+
+from benchmarks._harness import allocated_bytes, report, time_ns
+from result.base import Fail, Ok, ResultArray
+from result.utils.helpers import result_combine
+
+COUNT = 1_000_000
+
+
+def _results() -> list:
+    return [Ok(i) if i % 100 else Fail(i) for i in range(COUNT)]
+
+
+def run() -> dict[str, float]:
+    results = _results()
+    packed = ResultArray(results, typecode="q")
+    oks = [r for r in results if r._is_ok]
+    packed_oks = ResultArray(oks, typecode="q")
+    return {
+        f"list of Ok/Fail x{COUNT} bytes": allocated_bytes(_results)[0],
+        f"ResultArray(q) x{COUNT} bytes": allocated_bytes(
+            lambda: ResultArray(_results(), typecode="q")
+        )[0],
+        f"is_ok mask list x{COUNT} ms": time_ns(
+            lambda: [r._is_ok for r in results], number=1
+        )
+        / 1e6,
+        f"is_ok mask ResultArray x{COUNT} ms": time_ns(packed.is_ok, number=1) / 1e6,
+        f"result_combine all-Ok list x{len(oks)} ms": time_ns(
+            lambda: result_combine(oks), number=1
+        )
+        / 1e6,
+        f"combine all-Ok ResultArray x{len(oks)} ms": time_ns(
+            packed_oks.combine, number=1
+        )
+        / 1e6,
+        f"value_or ResultArray x{COUNT} ms": time_ns(lambda: packed.value_or(0), number=1)
+        / 1e6,
+    }
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,83 @@
+"""
+Five dependent steps written with result_do against the hand-written
+early-return chain it replaces, which checks each step with is_fail.
+"""
+
+import asyncio
+
+from benchmarks._harness import report, time_ns
+from result.base import Fail, Ok
+from result.guards import is_fail
+from result.utils.helpers import result_do, result_do_async, result_ok
+
+NUMBER = 20_000
+
+
+def _step(value: int):
+    return Ok(value + 1_000) if value >= 0 else Fail("negative")
+
+
+def _guarded(value: int):
+    first = _step(value)
+    if is_fail(first):
+        return first
+    second = _step(first.value)
+    if is_fail(second):
+        return second
+    third = _step(second.value)
+    if is_fail(third):
+        return third
+    fourth = _step(third.value)
+    if is_fail(fourth):
+        return fourth
+    fifth = _step(fourth.value)
+    if is_fail(fifth):
+        return fifth
+    return result_ok(fifth.value)
+
+
+@result_do
+def _do(value: int):
+    first = yield _step(value)
+    second = yield _step(first)
+    third = yield _step(second)
+    fourth = yield _step(third)
+    fifth = yield _step(fourth)
+    return fifth
+
+
+async def _guarded_async(value: int):
+    return _guarded(value)
+
+
+@result_do_async
+async def _do_async(value: int):
+    first = yield _step(value)
+    second = yield _step(first)
+    third = yield _step(second)
+    fourth = yield _step(third)
+    fifth = yield _step(fourth)
+    yield Ok(fifth)
+
+
+def _drive(factory, value: int) -> float:
+    async def loop() -> None:
+        for _ in range(NUMBER):
+            await factory(value)
+
+    return time_ns(lambda: asyncio.run(loop()), number=1) / NUMBER
+
+
+def run() -> dict[str, float]:
+    return {
+        "5 steps guard chain ns": time_ns(lambda: _guarded(1_000)),
+        "5 steps result_do ns": time_ns(lambda: _do(1_000)),
+        "first step fails guard chain ns": time_ns(lambda: _guarded(-1)),
+        "first step fails result_do ns": time_ns(lambda: _do(-1)),
+        "5 steps async guard chain ns": _drive(_guarded_async, 1_000),
+        "5 steps result_do_async ns": _drive(_do_async, 1_000),
+    }
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,35 @@
+"""
+Per-call cost of an as_result function with telemetry never enabled,
+enabled then disabled, sampled at 1% and at 100%.
+"""
+
+from benchmarks._harness import report, time_ns
+from result import telemetry
+from result.utils.helpers import as_result
+
+
+@as_result(ValueError)
+def _parse(text: str) -> int:
+    return int(text)
+
+
+def _call() -> None:
+    _parse("12")
+
+
+def run() -> dict[str, float]:
+    metrics = {"as_result call, telemetry off ns": time_ns(_call)}
+    try:
+        telemetry.enable(sample_rate=0.01)
+        metrics["as_result call, telemetry 1% ns"] = time_ns(_call)
+        telemetry.enable(sample_rate=1.0)
+        metrics["as_result call, telemetry 100% ns"] = time_ns(_call)
+    finally:
+        telemetry.disable()
+        telemetry.reset()
+    metrics["as_result call, telemetry disabled again ns"] = time_ns(_call)
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
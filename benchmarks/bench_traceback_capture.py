@@ -0,0 +1,60 @@
+"""
+Memory retained by Fail results under each as_result traceback capture policy.
+
+The failing function holds a 4 KiB local, which a retained traceback keeps
+alive. The RSS rows make one million failing calls while holding the most
+recent 10,000 results, and report RSS growth between the first and last
+quarter of the run, which should stay near zero.
+"""
+
+import resource
+import sys
+from collections import deque
+
+from benchmarks._harness import allocated_bytes, report
+from result.utils.helpers import as_result
+
+HELD = 10_000
+CALLS = 1_000_000
+
+
+def _fail(size: int) -> None:
+    payload = bytearray(size)  # kept alive by a retained traceback
+    raise ValueError("failed")
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # ru_maxrss is a high-water mark in KiB (bytes on macOS), still usable for growth.
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _rss_growth(capture: str) -> float:
+    wrapped = as_result(ValueError, capture=capture)(_fail)
+    held: deque = deque(maxlen=HELD)
+    checkpoint = CALLS // 4
+    start = 0
+    for call in range(CALLS):
+        held.append(wrapped(4096))
+        if call == checkpoint:
+            start = _rss_bytes()
+    return _rss_bytes() - start
+
+
+def run() -> dict[str, float]:
+    metrics: dict[str, float] = {}
+    for capture in ("full", "summary", "none"):
+        wrapped = as_result(ValueError, capture=capture)(_fail)
+        retained, _ = allocated_bytes(lambda: [wrapped(4096) for _ in range(HELD)])
+        metrics[f"{capture}: retained bytes per held Fail"] = retained / HELD
+    for capture in ("summary", "none"):
+        metrics[f"{capture}: RSS growth over {CALLS} calls bytes"] = _rss_growth(capture)
+    return metrics
+
+
+if __name__ == "__main__":
+    report(run())
@@ -1,39 +1,160 @@
-from .base import Fail as FailClass, Ok as OkClass, Result
-from .guards import is_ok, is_fail, is_result
-from .utils.helpers import (
-    result_fail,
-    result_ok,
-    result_combine,
-    as_result,
-    as_result_all,
-    unwrap_or,
-    value_or,
-    result_equality,
-)
-from .types import Either, ResultCombine, Result, Ok, Fail
+"""
+Public API of the result package.
+
+Names are resolved lazily on first access (PEP 562), so importing the package
+only loads the submodules that the requested names live in.
+"""
+
+from ._lazy import lazy_attributes
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .base import Fail as FailClass, Ok as OkClass, ResultArray, ErrorBatch, ErrorRecord
+    from .errors import CircuitOpen, DeadlineExceeded, DeadlineWorkersBusy
+    from .option import Some as SomeClass, Nothing
+    from .guards import is_ok, is_fail, is_result, is_some, is_nothing
+    from .utils.helpers import (
+        result_fail,
+        result_ok,
+        result_combine,
+        result_combine_iter,
+        result_combine_chunked,
+        result_combine_all,
+        result_partition,
+        as_result,
+        as_result_all,
+        unwrap_or,
+        value_or,
+        result_equality,
+        register_fail_sentinel,
+        traceback_summary,
+        result_do,
+        result_do_async,
+    )
+    from .utils.compose import Pipeline, pipeline
+    from .utils.parallel import result_map, result_map_processes
+    from .utils.aio import gather_results
+    from .utils.cache import CacheStats, cached_result
+    from .utils.hedge import hedged
+    from .utils.breaker import circuit_breaker
+    from .utils.deadlines import deadline, time_remaining
+    from .types import Either, ResultCombine, Result, Ok, Fail, Some, Option
+
+# Public name -> (module relative to this package, attribute in that module).
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    # concrete classes
+    "OkClass": (".base", "Ok"),
+    "FailClass": (".base", "Fail"),
+    "ResultArray": (".base", "ResultArray"),
+    "ErrorBatch": (".base", "ErrorBatch"),
+    "ErrorRecord": (".base", "ErrorRecord"),
+    "CircuitOpen": (".errors", "CircuitOpen"),
+    "DeadlineExceeded": (".errors", "DeadlineExceeded"),
+    "DeadlineWorkersBusy": (".errors", "DeadlineWorkersBusy"),
+    "SomeClass": (".option", "Some"),
+    "Nothing": (".nothing", "Nothing"),
+    "NothingClass": (".nothing", "NothingClass"),
+    # guards
+    "is_ok": (".guards.base", "is_ok"),
+    "is_fail": (".guards.base", "is_fail"),
+    "is_result": (".guards.base", "is_result"),
+    "is_some": (".guards.base", "is_some"),
+    "is_nothing": (".guards.base", "is_nothing"),
+    # helpers
+    "result_fail": (".utils.helpers", "result_fail"),
+    "result_ok": (".utils.helpers", "result_ok"),
+    "result_combine": (".utils.helpers", "result_combine"),
+    "result_combine_iter": (".utils.helpers", "result_combine_iter"),
+    "result_combine_chunked": (".utils.helpers", "result_combine_chunked"),
+    "result_combine_all": (".utils.helpers", "result_combine_all"),
+    "result_partition": (".utils.helpers", "result_partition"),
+    "as_result": (".utils.helpers", "as_result"),
+    "as_result_all": (".utils.helpers", "as_result_all"),
+    "unwrap_or": (".utils.helpers", "unwrap_or"),
+    "value_or": (".utils.helpers", "value_or"),
+    "result_equality": (".utils.helpers", "result_equality"),
+    "register_fail_sentinel": (".utils.helpers", "register_fail_sentinel"),
+    "traceback_summary": (".utils.helpers", "traceback_summary"),
+    "result_do": (".utils.helpers", "result_do"),
+    "result_do_async": (".utils.helpers", "result_do_async"),
+    "pipeline": (".utils.compose", "pipeline"),
+    "Pipeline": (".utils.compose", "Pipeline"),
+    "result_map": (".utils.parallel", "result_map"),
+    "result_map_processes": (".utils.parallel", "result_map_processes"),
+    "gather_results": (".utils.aio", "gather_results"),
+    "cached_result": (".utils.cache", "cached_result"),
+    "CacheStats": (".utils.cache", "CacheStats"),
+    "hedged": (".utils.hedge", "hedged"),
+    "circuit_breaker": (".utils.breaker", "circuit_breaker"),
+    "deadline": (".utils.deadlines", "deadline"),
+    "time_remaining": (".utils.deadlines", "time_remaining"),
+    # types
+    "Ok": (".types.base", "Ok"),
+    "Fail": (".types.base", "Fail"),
+    "Result": (".types.base", "Result"),
+    "ResultCombine": (".types.base", "ResultCombine"),
+    "Either": (".types.base", "Either"),
+    "Some": (".types.base", "Some"),
+    "Option": (".types.base", "Option"),
+}
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
 
 __all__ = [
     # concrete classes
     "OkClass",
     "FailClass",
     "Result",
+    "ResultArray",
+    "ErrorBatch",
+    "ErrorRecord",
+    "CircuitOpen",
+    "DeadlineExceeded",
+    "DeadlineWorkersBusy",
+    "SomeClass",
+    "Nothing",
+    "NothingClass",
     # guards
     "is_ok",
     "is_fail",
     "is_result",
+    "is_some",
+    "is_nothing",
     # helpers
     "result_fail",
     "result_ok",
     "result_combine",
+    "result_combine_iter",
+    "result_combine_chunked",
+    "result_combine_all",
+    "result_partition",
     "as_result",
     "as_result_all",
     "unwrap_or",
     "value_or",
     "result_equality",
+    "register_fail_sentinel",
+    "traceback_summary",
+    "result_do",
+    "result_do_async",
+    "pipeline",
+    "Pipeline",
+    "result_map",
+    "result_map_processes",
+    "gather_results",
+    "cached_result",
+    "CacheStats",
+    "hedged",
+    "circuit_breaker",
+    "deadline",
+    "time_remaining",
     # types
     "Ok",
     "Fail",
     "Result",
     "ResultCombine",
     "Either",
+    "Some",
+    "Option",
 ]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from importlib import import_module
+from importlib.util import find_spec
+
+# The packages built on this module define TYPE_CHECKING = False themselves
+# instead of importing it from typing: type checkers treat the name as true
+# either way, and at runtime importing typing would undo much of what the
+# lazy exports save on `import result`.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+
+def lazy_attributes(
+    namespace: dict[str, Any], attributes: dict[str, tuple[str, str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build PEP 562 `__getattr__` and `__dir__` functions for a package.
+
+    Each public name is imported from its submodule on first access and then
+    cached in the package namespace, so later lookups are plain global reads.
+    Submodules not yet imported are also reachable as attributes, as they
+    would be after an eager `import`, so `result.utils.helpers` keeps working
+    after a bare `import result`.
+
+    Args:
+        namespace (dict[str, Any]): The package's `globals()`.
+        attributes (dict[str, tuple[str, str]]): Public name mapped to the
+            submodule (relative to the package) and the attribute within it.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: The module
+        level `__getattr__` and `__dir__` functions.
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module, attribute = attributes[name]
+        except KeyError:
+            if not name.startswith("__") and find_spec(f"{package}.{name}"):
+                # Importing a submodule binds it in the package namespace.
+                return import_module(f"{package}.{name}")
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(import_module(module, package), attribute)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *attributes})
+
+    return __getattr__, __dir__
@@ -1,4 +1,19 @@
-from typing import Literal, Iterator, Generic, TypeVar
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Final,
+    Literal,
+    Iterable,
+    Iterator,
+    Generic,
+    MutableSequence,
+    Self,
+    Sequence,
+    TypeVar,
+    overload,
+)
+from array import array
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
@@ -6,6 +21,18 @@ S = TypeVar("S", covariant=True)
 F = TypeVar("F", covariant=True)
 T = TypeVar("T", covariant=True)
 
+# Distinct per-variant salts mixed into __hash__ so that Ok(x) and Fail(x)
+# land in different hash buckets.
+_OK_HASH_TAG = 0x4F4B
+_FAIL_HASH_TAG = 0x4641494C
+
+# Every class deriving from _Result. Guards and helpers test membership of
+# type(x) here instead of isinstance(x, _Result), which would go through
+# ABCMeta.__instancecheck__ on every call. It holds the classes strongly: a
+# WeakSet lookup is several times slower than a set lookup, and Ok/Fail
+# subclasses are expected to be defined once, at module level.
+_RESULT_TYPES: set[type] = set()
+
 
 class _Result(ABC, Generic[T]):
     """
@@ -18,8 +45,18 @@ class _Result(ABC, Generic[T]):
     This base class defines the required interface for Result variants.
     """
 
+    # Lazily filled by __hash__ on first use; see _OK_HASH_TAG / _FAIL_HASH_TAG.
+    __slots__ = ("_hash",)
+
+    # Variant tag read by the guards: True on Ok, False on Fail.
+    _is_ok: ClassVar[bool]
+
     value: T
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        _RESULT_TYPES.add(cls)
+
     @abstractmethod
     def isFail(self) -> bool:
         """
@@ -40,6 +77,84 @@ class _Result(ABC, Generic[T]):
         """
         ...
 
+    @abstractmethod
+    def map(self, func: Callable[[Any], Any]) -> "_Result[Any]":
+        """
+        Transform the value of an Ok; a Fail is returned unchanged.
+
+        Args:
+            func (Callable): The function applied to the Ok value.
+
+        Returns:
+            _Result: A new Ok holding func(value), or this Fail.
+        """
+        ...
+
+    @abstractmethod
+    def map_err(self, func: Callable[[Any], Any]) -> "_Result[Any]":
+        """
+        Transform the error of a Fail; an Ok is returned unchanged.
+
+        Args:
+            func (Callable): The function applied to the Fail value.
+
+        Returns:
+            _Result: A new Fail holding func(error), or this Ok.
+        """
+        ...
+
+    @abstractmethod
+    def and_then(self, func: Callable[[Any], Any]) -> "_Result[Any]":
+        """
+        Chain a Result-returning function on the value of an Ok.
+
+        Args:
+            func (Callable): A function taking the Ok value and returning a Result.
+
+        Returns:
+            _Result: The Result returned by func, or this Fail.
+        """
+        ...
+
+    @abstractmethod
+    def or_else(self, func: Callable[[Any], Any]) -> "_Result[Any]":
+        """
+        Chain a Result-returning recovery function on the error of a Fail.
+
+        Args:
+            func (Callable): A function taking the Fail value and returning a Result.
+
+        Returns:
+            _Result: The Result returned by func, or this Ok.
+        """
+        ...
+
+    @abstractmethod
+    def inspect(self, func: Callable[[Any], Any]) -> Self:
+        """
+        Call func with the value of an Ok for its side effects.
+
+        Args:
+            func (Callable): The function called with the Ok value.
+
+        Returns:
+            Self: This Result, unchanged.
+        """
+        ...
+
+    @abstractmethod
+    def inspect_err(self, func: Callable[[Any], Any]) -> Self:
+        """
+        Call func with the error of a Fail for its side effects.
+
+        Args:
+            func (Callable): The function called with the Fail value.
+
+        Returns:
+            Self: This Result, unchanged.
+        """
+        ...
+
     @abstractmethod
     def __eq__(self, other: object) -> bool:
         """
@@ -97,6 +212,7 @@ class Ok(_Result[S], Generic[S]):
 
     value: S
     __match_args__ = ("value",)
+    _is_ok: ClassVar[bool] = True
 
     def __iter__(self) -> Iterator[S]:
         """
@@ -121,7 +237,11 @@ class Ok(_Result[S], Generic[S]):
         Returns:
             bool: True if both are Ok and values are equal.
         """
-        return isinstance(other, Ok) and self.value == other.value
+        return (
+            type(other) in _RESULT_TYPES
+            and other._is_ok
+            and self.value == other.value  # type: ignore
+        )
 
     def __ne__(self, other: object) -> bool:
         """
@@ -133,8 +253,8 @@ class Ok(_Result[S], Generic[S]):
         Returns:
             bool: True if both are Ok and values differ, otherwise NotImplemented.
         """
-        if isinstance(other, Ok):
-            return not (self.value == other.value)
+        if type(other) in _RESULT_TYPES and other._is_ok:
+            return not (self.value == other.value)  # type: ignore
         return NotImplemented
 
     def __hash__(self) -> int:
@@ -142,12 +262,31 @@ class Ok(_Result[S], Generic[S]):
         Return a hash for this Ok result.
 
         The hash is based on the variant and the contained value so Ok and Fail
-        with the same value do not collide.
+        with the same value do not collide. It is computed once and cached on
+        the instance, so hashing a large tuple or string payload repeatedly
+        costs O(1) after the first call.
 
         Returns:
             int: Hash of the Ok result.
         """
-        return hash((True, self.value))
+        try:
+            return self._hash
+        except AttributeError:
+            result_hash = hash((_OK_HASH_TAG, self.value))
+            object.__setattr__(self, "_hash", result_hash)
+            return result_hash
+
+    def __reduce__(self) -> tuple[type[Self], tuple[Any]]:
+        """
+        Pickle as the class and the contained value only.
+
+        The cached hash is left out: string hashes are randomised per process,
+        so it would be wrong wherever the result is unpickled.
+
+        Returns:
+            tuple[type[Self], tuple[Any]]: The class and its constructor arguments.
+        """
+        return (type(self), (self.value,))
 
     def __repr__(self) -> str:
         """
@@ -192,6 +331,79 @@ class Ok(_Result[S], Generic[S]):
             return self.value
         return result
 
+    def map[U](self, func: Callable[[S], U]) -> "Ok[U]":
+        """
+        Apply func to the contained value and wrap the outcome in a new Ok.
+
+        Args:
+            func (Callable[[S], U]): The function to apply.
+
+        Returns:
+            Ok[U]: Ok(func(value)).
+        """
+        return Ok(func(self.value))
+
+    def map_err(self, func: Callable[[Any], Any]) -> Self:
+        """
+        Return this Ok unchanged, without calling func or allocating.
+
+        Args:
+            func (Callable[[Any], Any]): Ignored.
+
+        Returns:
+            Self: This Ok.
+        """
+        return self
+
+    def and_then[R: _Result[Any]](self, func: Callable[[S], R]) -> R:
+        """
+        Apply a Result-returning func to the contained value.
+
+        Args:
+            func (Callable[[S], R]): The function to apply.
+
+        Returns:
+            R: The Result returned by func.
+        """
+        return func(self.value)
+
+    def or_else(self, func: Callable[[Any], Any]) -> Self:
+        """
+        Return this Ok unchanged, without calling func or allocating.
+
+        Args:
+            func (Callable[[Any], Any]): Ignored.
+
+        Returns:
+            Self: This Ok.
+        """
+        return self
+
+    def inspect(self, func: Callable[[S], Any]) -> Self:
+        """
+        Call func with the contained value, then return this Ok.
+
+        Args:
+            func (Callable[[S], Any]): The function to call; its return value is ignored.
+
+        Returns:
+            Self: This Ok.
+        """
+        func(self.value)
+        return self
+
+    def inspect_err(self, func: Callable[[Any], Any]) -> Self:
+        """
+        Return this Ok unchanged, without calling func.
+
+        Args:
+            func (Callable[[Any], Any]): Ignored.
+
+        Returns:
+            Self: This Ok.
+        """
+        return self
+
 
 @dataclass(frozen=True, slots=True)
 class Fail(_Result[F], Generic[F]):
@@ -205,6 +417,7 @@ class Fail(_Result[F], Generic[F]):
 
     value: F
     __match_args__ = ("value",)
+    _is_ok: ClassVar[bool] = False
 
     def __iter__(self) -> Iterator[F]:
         """
@@ -229,7 +442,11 @@ class Fail(_Result[F], Generic[F]):
         Returns:
             bool: True if both are Fail and values are equal.
         """
-        return isinstance(other, Fail) and self.value == other.value
+        return (
+            type(other) in _RESULT_TYPES
+            and not other._is_ok
+            and self.value == other.value  # type: ignore
+        )
 
     def __ne__(self, other: object) -> bool:
         """
@@ -241,8 +458,8 @@ class Fail(_Result[F], Generic[F]):
         Returns:
             bool: True if both are Fail and values differ, otherwise NotImplemented.
         """
-        if isinstance(other, Fail):
-            return not (self.value == other.value)
+        if type(other) in _RESULT_TYPES and not other._is_ok:
+            return not (self.value == other.value)  # type: ignore
         return NotImplemented
 
     def __hash__(self) -> int:
@@ -250,12 +467,31 @@ class Fail(_Result[F], Generic[F]):
         Return a hash for this Fail result.
 
         The hash is based on the variant and the contained value so Ok and Fail
-        with the same value do not collide.
+        with the same value do not collide. It is computed once and cached on
+        the instance, so hashing a large tuple or string payload repeatedly
+        costs O(1) after the first call.
 
         Returns:
             int: Hash of the Fail result.
         """
-        return hash((True, self.value))
+        try:
+            return self._hash
+        except AttributeError:
+            result_hash = hash((_FAIL_HASH_TAG, self.value))
+            object.__setattr__(self, "_hash", result_hash)
+            return result_hash
+
+    def __reduce__(self) -> tuple[type[Self], tuple[Any]]:
+        """
+        Pickle as the class and the contained value only.
+
+        The cached hash is left out: string hashes are randomised per process,
+        so it would be wrong wherever the result is unpickled.
+
+        Returns:
+            tuple[type[Self], tuple[Any]]: The class and its constructor arguments.
+        """
+        return (type(self), (self.value,))
 
     def __repr__(self) -> str:
         """
@@ -284,5 +520,479 @@ class Fail(_Result[F], Generic[F]):
         """
         return False
 
+    def map(self, func: Callable[[Any], Any]) -> Self:
+        """
+        Return this Fail unchanged, without calling func or allocating.
+
+        Args:
+            func (Callable[[Any], Any]): Ignored.
+
+        Returns:
+            Self: This Fail.
+        """
+        return self
+
+    def map_err[U](self, func: Callable[[F], U]) -> "Fail[U]":
+        """
+        Apply func to the contained error and wrap the outcome in a new Fail.
+
+        Args:
+            func (Callable[[F], U]): The function to apply.
+
+        Returns:
+            Fail[U]: Fail(func(error)).
+        """
+        return Fail(func(self.value))
+
+    def and_then(self, func: Callable[[Any], Any]) -> Self:
+        """
+        Return this Fail unchanged, without calling func or allocating.
+
+        Args:
+            func (Callable[[Any], Any]): Ignored.
+
+        Returns:
+            Self: This Fail.
+        """
+        return self
+
+    def or_else[R: _Result[Any]](self, func: Callable[[F], R]) -> R:
+        """
+        Apply a Result-returning recovery func to the contained error.
+
+        Args:
+            func (Callable[[F], R]): The function to apply.
+
+        Returns:
+            R: The Result returned by func.
+        """
+        return func(self.value)
+
+    def inspect(self, func: Callable[[Any], Any]) -> Self:
+        """
+        Return this Fail unchanged, without calling func.
+
+        Args:
+            func (Callable[[Any], Any]): Ignored.
+
+        Returns:
+            Self: This Fail.
+        """
+        return self
+
+    def inspect_err(self, func: Callable[[F], Any]) -> Self:
+        """
+        Call func with the contained error, then return this Fail.
+
+        Args:
+            func (Callable[[F], Any]): The function to call; its return value is ignored.
+
+        Returns:
+            Self: This Fail.
+        """
+        func(self.value)
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class ErrorBatch(Generic[F]):
+    """
+    The errors collected from a batch of results, with their positions.
+
+    Produced by result_combine_all and result_partition. Positions are kept
+    in a compact unsigned integer array rather than a list of ints.
+
+    Attributes:
+        errors (tuple[F, ...]): The collected Fail values, in input order.
+        indices (array): The input position of each collected error.
+        total (int): How many Fail results were seen. This is larger than
+            len(errors) when collection was capped with max_errors.
+    """
+
+    errors: tuple[F, ...]
+    indices: array
+    total: int
+
+    def __hash__(self) -> int:
+        """
+        Return a hash for this batch.
+
+        An array is unhashable, so the indices are hashed by their bytes. This
+        keeps Fail(ErrorBatch(...)) hashable like any other Fail whose
+        errors are.
+
+        Returns:
+            int: Hash of the errors, indices and total.
+        """
+        return hash((self.errors, self.indices.tobytes(), self.total))
+
+    def __len__(self) -> int:
+        """
+        Return the number of collected errors.
+
+        Returns:
+            int: len(errors).
+        """
+        return len(self.errors)
+
+    def __iter__(self) -> Iterator[F]:
+        """
+        Yield the collected errors in input order.
+
+        Yields:
+            Iterator[F]: Each collected error.
+        """
+        return iter(self.errors)
+
+    @property
+    def truncated(self) -> bool:
+        """
+        Return True if some Fail results were not collected because of a cap.
+
+        Returns:
+            bool: True when total exceeds the number of collected errors.
+        """
+        return self.total > len(self.errors)
+
+
+@dataclass(frozen=True, slots=True)
+class ErrorRecord:
+    """
+    A lightweight, picklable stand-in for an exception.
+
+    Used where a Fail crosses a process boundary: the exception itself may not
+    pickle, and its traceback would keep every frame's locals alive. The
+    record keeps the exception's type, message and a frame summary.
+
+    Attributes:
+        type_name (str): The qualified name of the exception class, such as
+            "builtins.ValueError".
+        message (str): str() of the exception.
+        trace (tuple[tuple[str, int, str], ...]): (filename, line, function)
+            per frame, innermost last.
+        lineage (tuple[str, ...]): Qualified names of the exception class and
+            its bases, used by `matches`.
+    """
+
+    type_name: str
+    message: str
+    trace: tuple[tuple[str, int, str], ...] = ()
+    lineage: tuple[str, ...] = ()
+
+    @classmethod
+    def from_exception(cls, exception: BaseException) -> Self:
+        """
+        Build a record from an exception, reusing an as_result summary if present.
+
+        Args:
+            exception (BaseException): The exception to describe.
+
+        Returns:
+            ErrorRecord: The record.
+        """
+        trace = getattr(exception, "_result_trace", None)
+        if trace is None:
+            frames: list[tuple[str, int, str]] = []
+            tb = exception.__traceback__
+            while tb is not None:
+                code = tb.tb_frame.f_code
+                frames.append((code.co_filename, tb.tb_lineno, code.co_name))
+                tb = tb.tb_next
+            trace = tuple(frames)
+        lineage = tuple(
+            f"{klass.__module__}.{klass.__qualname__}"
+            for klass in type(exception).__mro__
+            if klass is not object
+        )
+        return cls(lineage[0], str(exception), trace, lineage)
+
+    def matches(self, *exceptions: type[BaseException]) -> bool:
+        """
+        Return True if the original exception was an instance of any given class.
+
+        Args:
+            *exceptions (type[BaseException]): The classes to test against.
+
+        Returns:
+            bool: True if any class appears in the record's lineage.
+        """
+        return any(
+            f"{klass.__module__}.{klass.__qualname__}" in self.lineage
+            for klass in exceptions
+        )
+
+    def __repr__(self) -> str:
+        """
+        Return a developer-friendly string representation of the record.
+
+        Returns:
+            str: The exception type and message.
+        """
+        return f"<ErrorRecord {self.type_name}: {self.message}>"
+
+
+# Byte value -> the eight flags it encodes, least significant bit first, as
+# one byte per flag. Used to expand the validity bitmap into boolean masks.
+_OK_FLAGS: Final[tuple[bytes, ...]] = tuple(
+    bytes((byte >> bit) & 1 for bit in range(8)) for byte in range(256)
+)
+_FAIL_FLAGS: Final[tuple[bytes, ...]] = tuple(
+    bytes(1 - flag for flag in flags) for flags in _OK_FLAGS
+)
+
+
+class ResultArray(Generic[S, F]):
+    """
+    A compact, immutable sequence of results stored column by column.
+
+    Instead of one Ok/Fail object per element, the Ok values and the Fail
+    errors are kept in two dense columns, and a packed validity bitmap (one
+    bit per element, set for Ok) records which column each position belongs
+    to. Ok values may be stored in an `array.array` by passing a typecode,
+    in which case the column is also exposed as a zero-copy buffer that
+    NumPy and other buffer consumers can read directly.
+
+    Indexing and iteration rebuild ordinary Ok/Fail objects, so existing
+    `match` code keeps working.
+
+    Example:
+        >>> results = ResultArray([Ok(1), Fail("bad"), Ok(3)], typecode="q")
+        >>> results[1]
+        <Fail (bad)>
+        >>> results.combine()
+        <Fail (bad)>
+    """
+
+    __slots__ = ("_oks", "_fails", "_bitmap", "_ranks", "_length")
+
+    def __init__(
+        self, results: Iterable[_Result[S] | _Result[F]], typecode: str | None = None
+    ) -> None:
+        """
+        Build the columns from an iterable of Ok/Fail results in one pass.
+
+        Args:
+            results (Iterable[Ok[S] | Fail[F]]): The results to store.
+            typecode (str | None, optional): An `array` typecode for the Ok
+                column, e.g. "q" or "d". Defaults to None, which stores Ok
+                values in a list.
+
+        Raises:
+            TypeError: If an element is not an Ok/Fail result, or an Ok value
+                is not of the kind the typecode stores (e.g. a str for "q").
+            OverflowError: If an Ok value is of the right kind but out of
+                range for the typecode (e.g. 300 for "b").
+        """
+        oks: MutableSequence[S] = array(typecode) if typecode else []  # type: ignore
+        fails: list[F] = []
+        bitmap = bytearray()
+        # ranks[i] is the number of Ok values stored before bitmap byte i.
+        ranks = array("I")
+        ok_append, fail_append = oks.append, fails.append
+        byte = bit = length = 0
+
+        for result in results:
+            if type(result) not in _RESULT_TYPES:
+                raise TypeError(f"Expected Result (Ok/Fail), got {repr(result)}")
+            if bit == 0:
+                ranks.append(len(oks))
+            if result._is_ok:
+                ok_append(result.value)  # type: ignore
+                byte |= 1 << bit
+            else:
+                fail_append(result.value)  # type: ignore
+            length += 1
+            bit += 1
+            if bit == 8:
+                bitmap.append(byte)
+                byte = bit = 0
+        if bit:
+            bitmap.append(byte)
+
+        self._oks = oks
+        self._fails = fails
+        self._bitmap = bytes(bitmap)
+        self._ranks = ranks
+        self._length = length
+
+    @classmethod
+    def _from_columns(
+        cls,
+        oks: MutableSequence[S],
+        fails: list[F],
+        bitmap: bytes,
+        length: int,
+    ) -> "ResultArray[S, F]":
+        """Build an array from already-split columns, recomputing the ranks."""
+        ranks = array("I")
+        append = ranks.append
+        count = 0
+        for byte in bitmap:
+            append(count)
+            count += byte.bit_count()
+        if (
+            len(bitmap) != (length + 7) >> 3
+            or count != len(oks)
+            or length - count != len(fails)
+        ):
+            raise ValueError("ResultArray columns do not match the bitmap.")
+        self = cls.__new__(cls)
+        self._oks = oks
+        self._fails = fails
+        self._bitmap = bitmap
+        self._ranks = ranks
+        self._length = length
+        return self
+
+    def __len__(self) -> int:
+        """
+        Return the number of results stored.
+
+        Returns:
+            int: The number of elements.
+        """
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> "Ok[S] | Fail[F]": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ResultArray[S, F]": ...
+
+    def __getitem__(self, index):
+        """
+        Return the result at `index` as an Ok/Fail object, or a sub-array for a slice.
+
+        Args:
+            index (int | slice): The position, or a slice of positions.
+
+        Raises:
+            IndexError: If `index` is out of range.
+
+        Returns:
+            Ok[S] | Fail[F] | ResultArray[S, F]: The rebuilt result(s).
+        """
+        if isinstance(index, slice):
+            typecode = self._oks.typecode if isinstance(self._oks, array) else None
+            return ResultArray(
+                (self[position] for position in range(*index.indices(self._length))),
+                typecode,
+            )
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ResultArray index out of range")
+        block, bit = index >> 3, index & 7
+        byte = self._bitmap[block]
+        before = self._ranks[block] + (byte & ((1 << bit) - 1)).bit_count()
+        if byte >> bit & 1:
+            return Ok(self._oks[before])
+        return Fail(self._fails[index - before])
+
+    def __iter__(self) -> Iterator["Ok[S] | Fail[F]"]:
+        """
+        Yield every element as an Ok/Fail object, in order.
+
+        Yields:
+            Iterator[Ok[S] | Fail[F]]: The rebuilt results.
+        """
+        oks, fails = iter(self._oks), iter(self._fails)
+        for flag in self.is_ok():
+            yield Ok(next(oks)) if flag else Fail(next(fails))
+
+    def __repr__(self) -> str:
+        """
+        Return a developer-friendly summary of the array.
+
+        Returns:
+            str: The length and the Ok/Fail counts.
+        """
+        return (
+            f"<ResultArray (len={self._length}, ok={len(self._oks)}, "
+            f"fail={len(self._fails)})>"
+        )
+
+    @property
+    def ok_count(self) -> int:
+        """
+        Return the number of Ok elements.
+
+        Returns:
+            int: The number of Ok elements.
+        """
+        return len(self._oks)
+
+    @property
+    def fail_count(self) -> int:
+        """
+        Return the number of Fail elements.
+
+        Returns:
+            int: The number of Fail elements.
+        """
+        return len(self._fails)
+
+    def is_ok(self) -> memoryview:
+        """
+        Return a boolean mask that is True where the element is an Ok.
+
+        The mask is a read-only memoryview with format "?", so it can be
+        indexed like a sequence of bools or handed to NumPy without copying.
+
+        Returns:
+            memoryview: One bool per element.
+        """
+        mask = b"".join(map(_OK_FLAGS.__getitem__, self._bitmap))[: self._length]
+        return memoryview(mask).cast("?")
+
+    def is_fail(self) -> memoryview:
+        """
+        Return a boolean mask that is True where the element is a Fail.
+
+        Returns:
+            memoryview: One bool per element, see is_ok.
+        """
+        mask = b"".join(map(_FAIL_FLAGS.__getitem__, self._bitmap))[: self._length]
+        return memoryview(mask).cast("?")
+
+    def combine(self) -> "Ok[tuple[S, ...]] | Fail[F]":
+        """
+        Combine the whole array like result_combine.
+
+        Returns:
+            Ok[tuple[S, ...]] | Fail[F]:
+                - Ok(tuple_of_values) if every element is Ok
+                - Fail(error) holding the first error otherwise
+        """
+        if self._fails:
+            return Fail(self._fails[0])
+        return Ok(tuple(self._oks))
+
+    def partition(self) -> "tuple[Sequence[S], tuple[F, ...]]":
+        """
+        Split the array into its Ok values and its Fail errors.
+
+        Returns:
+            tuple[Sequence[S], tuple[F, ...]]: The Ok values, in order, as a
+            tuple, or as a read-only memoryview when a typecode was given; and
+            the Fail errors, in order.
+        """
+        if isinstance(self._oks, array):
+            return memoryview(self._oks).toreadonly(), tuple(self._fails)
+        return tuple(self._oks), tuple(self._fails)
+
+    def value_or[K](self, default: K) -> list[S | K]:
+        """
+        Return every Ok value, with `default` in place of each Fail.
+
+        Args:
+            default (K): The value to use for Fail elements.
+
+        Returns:
+            list[S | K]: One value per element.
+        """
+        oks = iter(self._oks)
+        return [next(oks) if flag else default for flag in self.is_ok()]
+
 
 Result = _Result
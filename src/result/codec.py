@@ -0,0 +1,302 @@
+"""
+Compact binary encoding of Ok/Fail results.
+
+Every result is one frame: a one-byte variant tag, the payload length, then
+the payload produced by a pluggable PayloadCodec (JSON, pickle or raw
+bytes). The length is a single byte when the tag has the short-frame bit
+set (payloads under 256 bytes) and a little-endian uint32 otherwise.
+Frames are self-delimiting, so a sequence of results is simply their
+frames back to back; decoding walks a memoryview over the buffer and never
+copies a frame out of it.
+
+A ResultArray is encoded as one batch frame holding its validity bitmap and
+its two columns, so it round-trips without building per-element objects.
+
+Example:
+    >>> data = encode_many([Ok(1), Fail("bad")], JSON)
+    >>> decode_many(data, JSON)
+    [<Ok (1)>, <Fail (bad)>]
+"""
+
+from array import array
+from dataclasses import dataclass
+from json import JSONEncoder, loads as _json_loads
+from pickle import dumps as _pickle_dumps, loads as _pickle_loads
+from struct import Struct
+from sys import byteorder
+from typing import Any, Callable, Final, Iterable, Iterator
+
+from result.base import Fail, Ok, ResultArray
+from result.types.base import Either
+
+_OK_TAG: Final[int] = 0x00
+_FAIL_TAG: Final[int] = 0x01
+_SHORT: Final[int] = 0x02
+_ARRAY_TAG: Final[int] = 0x04
+
+# tag, payload length
+_FRAME: Final[Struct] = Struct("<BI")
+_SHORT_FRAME: Final[Struct] = Struct("<BB")
+# tag, element count, Ok column typecode (0 for a list), Ok column byte order
+# (0 little, 1 big)
+_ARRAY_HEADER: Final[Struct] = Struct("<BIBB")
+
+
+@dataclass(frozen=True, slots=True)
+class PayloadCodec:
+    """
+    How the value inside a frame is turned into bytes and back.
+
+    Attributes:
+        name (str): A short label for the codec.
+        encode (Callable[[Any], bytes | bytearray | memoryview]): Serialises a
+            value.
+        decode (Callable[[memoryview], Any]): Rebuilds a value from a view of
+            its payload bytes. The view points into the decoded buffer.
+    """
+
+    name: str
+    encode: Callable[[Any], bytes | bytearray | memoryview]
+    decode: Callable[[memoryview], Any]
+
+
+# json.dumps builds a new encoder per call when given any option; reuse one.
+_json_encode: Final = JSONEncoder(separators=(",", ":")).encode
+
+
+def _encode_json(value: Any) -> bytes:
+    return _json_encode(value).encode()
+
+
+def _decode_json(view: memoryview) -> Any:
+    return _json_loads(str(view, "utf-8"))
+
+
+def _encode_pickle(value: Any) -> bytes:
+    return _pickle_dumps(value, protocol=5)
+
+
+# Compact JSON; values must be JSON-serialisable.
+JSON: Final[PayloadCodec] = PayloadCodec("json", _encode_json, _decode_json)
+
+# Pickle protocol 5; only decode data from trusted sources.
+PICKLE: Final[PayloadCodec] = PayloadCodec("pickle", _encode_pickle, _pickle_loads)
+
+# Bytes-like values stored as-is. Decoded values are read-only memoryviews into
+# the source buffer (zero-copy); call bytes() on them to detach.
+RAW: Final[PayloadCodec] = PayloadCodec("raw", memoryview, memoryview.toreadonly)
+
+
+def _frames(
+    results: Iterable[Either[Any, Any]], payload: PayloadCodec
+) -> Iterator[bytes | bytearray | memoryview]:
+    pack, pack_short, encode = _FRAME.pack, _SHORT_FRAME.pack, payload.encode
+    for result in results:
+        body = encode(result.value)
+        tag = _OK_TAG if result._is_ok else _FAIL_TAG
+        size = len(body) if type(body) is bytes else memoryview(body).nbytes
+        yield pack_short(tag | _SHORT, size) if size < 256 else pack(tag, size)
+        yield body
+
+
+def encode(result: Either[Any, Any], payload: PayloadCodec = PICKLE) -> bytes:
+    """
+    Encode one result as a frame.
+
+    Args:
+        result (Either[Any, Any]): The Ok/Fail to encode.
+        payload (PayloadCodec, optional): How to encode the contained value.
+            Defaults to PICKLE.
+
+    Returns:
+        bytes: The frame.
+    """
+    return b"".join(_frames((result,), payload))
+
+
+def encode_many(
+    results: Iterable[Either[Any, Any]], payload: PayloadCodec = PICKLE
+) -> bytes:
+    """
+    Encode a sequence of results as consecutive frames, joined in one copy.
+
+    Args:
+        results (Iterable[Either[Any, Any]]): The Ok/Fail results to encode.
+        payload (PayloadCodec, optional): How to encode the contained values.
+            Defaults to PICKLE.
+
+    Returns:
+        bytes: The frames, back to back.
+    """
+    return b"".join(_frames(results, payload))
+
+
+def iter_decode(
+    data: bytes | bytearray | memoryview, payload: PayloadCodec = PICKLE
+) -> Iterator[Either[Any, Any]]:
+    """
+    Lazily decode consecutive frames from a buffer.
+
+    Args:
+        data (bytes | bytearray | memoryview): The encoded frames.
+        payload (PayloadCodec, optional): The codec the values were encoded
+            with. Defaults to PICKLE.
+
+    Raises:
+        ValueError: If a frame has an unknown tag or is truncated.
+
+    Yields:
+        Iterator[Either[Any, Any]]: The decoded results, in order.
+    """
+    view = memoryview(data).cast("B")
+    unpack_from, header, decode = _FRAME.unpack_from, _FRAME.size, payload.decode
+    offset, end = 0, len(view)
+    while offset < end:
+        frame = offset
+        tag = view[offset]
+        if tag & _SHORT:
+            if end - offset < 2:
+                raise ValueError(f"Truncated frame header at byte {frame}.")
+            start = offset + 2
+            offset = start + view[offset + 1]
+        else:
+            if end - offset < header:
+                raise ValueError(f"Truncated frame header at byte {frame}.")
+            start = offset + header
+            offset = start + unpack_from(view, frame)[1]
+        if offset > end:
+            raise ValueError(f"Truncated frame payload at byte {start}.")
+        tag &= ~_SHORT
+        if tag == _OK_TAG:
+            yield Ok(decode(view[start:offset]))
+        elif tag == _FAIL_TAG:
+            yield Fail(decode(view[start:offset]))
+        else:
+            raise ValueError(f"Unknown frame tag {view[frame]:#04x} at byte {frame}.")
+
+
+def decode(
+    data: bytes | bytearray | memoryview, payload: PayloadCodec = PICKLE
+) -> Either[Any, Any]:
+    """
+    Decode a buffer holding exactly one frame.
+
+    Args:
+        data (bytes | bytearray | memoryview): The encoded frame.
+        payload (PayloadCodec, optional): The codec the value was encoded
+            with. Defaults to PICKLE.
+
+    Raises:
+        ValueError: If the buffer does not hold exactly one valid frame.
+
+    Returns:
+        Either[Any, Any]: The decoded result.
+    """
+    results = decode_many(data, payload)
+    if len(results) != 1:
+        raise ValueError(f"Expected one frame, found {len(results)}.")
+    return results[0]
+
+
+def decode_many(
+    data: bytes | bytearray | memoryview, payload: PayloadCodec = PICKLE
+) -> list[Either[Any, Any]]:
+    """
+    Decode every frame in a buffer.
+
+    Args:
+        data (bytes | bytearray | memoryview): The encoded frames.
+        payload (PayloadCodec, optional): The codec the values were encoded
+            with. Defaults to PICKLE.
+
+    Raises:
+        ValueError: If a frame has an unknown tag or is truncated.
+
+    Returns:
+        list[Either[Any, Any]]: The decoded results, in order.
+    """
+    return list(iter_decode(data, payload))
+
+
+def encode_array(results: ResultArray[Any, Any], payload: PayloadCodec = PICKLE) -> bytes:
+    """
+    Encode a ResultArray as a single batch frame.
+
+    The bitmap is written as-is. An Ok column stored in an `array` is written
+    as its raw machine values, without going through `payload`. A list Ok
+    column and the Fail column are each encoded by `payload` as one list.
+
+    Args:
+        results (ResultArray[Any, Any]): The array to encode.
+        payload (PayloadCodec, optional): How to encode the list columns.
+            Defaults to PICKLE.
+
+    Returns:
+        bytes: The batch frame.
+    """
+    oks = results._oks
+    if isinstance(oks, array):
+        typecode, ok_column = ord(oks.typecode), memoryview(oks)
+    else:
+        typecode, ok_column = 0, memoryview(payload.encode(list(oks)))
+    fail_column = memoryview(payload.encode(list(results._fails)))
+    return b"".join(
+        (
+            _ARRAY_HEADER.pack(_ARRAY_TAG, len(results), typecode, byteorder == "big"),
+            results._bitmap,
+            _FRAME.pack(_OK_TAG, ok_column.nbytes),
+            ok_column,
+            _FRAME.pack(_FAIL_TAG, fail_column.nbytes),
+            fail_column,
+        )
+    )
+
+
+def decode_array(
+    data: bytes | bytearray | memoryview, payload: PayloadCodec = PICKLE
+) -> ResultArray[Any, Any]:
+    """
+    Decode a batch frame written by encode_array.
+
+    Args:
+        data (bytes | bytearray | memoryview): The batch frame.
+        payload (PayloadCodec, optional): The codec the list columns were
+            encoded with. Defaults to PICKLE.
+
+    Raises:
+        ValueError: If the buffer is not a valid batch frame.
+
+    Returns:
+        ResultArray[Any, Any]: The decoded array.
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < _ARRAY_HEADER.size or view[0] != _ARRAY_TAG:
+        raise ValueError("Not a ResultArray batch frame.")
+    _, length, typecode, big_endian = _ARRAY_HEADER.unpack_from(view)
+    offset = _ARRAY_HEADER.size + ((length + 7) >> 3)
+    bitmap = bytes(view[_ARRAY_HEADER.size : offset])
+
+    columns: list[memoryview] = []
+    for expected in (_OK_TAG, _FAIL_TAG):
+        if len(view) < offset + _FRAME.size:
+            raise ValueError("Truncated ResultArray batch frame.")
+        tag, size = _FRAME.unpack_from(view, offset)
+        offset += _FRAME.size
+        if tag != expected or len(view) < offset + size:
+            raise ValueError("Malformed ResultArray batch frame.")
+        columns.append(view[offset : offset + size])
+        offset += size
+    if offset != len(view):
+        raise ValueError("Trailing bytes after ResultArray batch frame.")
+
+    ok_column, fail_column = columns
+    if typecode:
+        oks: Any = array(chr(typecode))
+        oks.frombytes(ok_column)
+        if big_endian != (byteorder == "big"):
+            oks.byteswap()
+    else:
+        oks = list(payload.decode(ok_column))
+    return ResultArray._from_columns(
+        oks, list(payload.decode(fail_column)), bitmap, length
+    )
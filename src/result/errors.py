@@ -0,0 +1,52 @@
+"""
+Exceptions carried as Fail values by the result utilities.
+
+These are never raised by the library itself: they are returned inside a
+Fail, so callers handle them like any other error.
+"""
+
+
+class CircuitOpen(Exception):
+    """
+    The error of the Fail returned by a circuit_breaker function while its
+    circuit is open and the wrapped function is not called.
+
+    Attributes:
+        name (str): The qualified name of the guarded function.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"Circuit open for {name}")
+        self.name = name
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    The error of the Fail returned by a deadline-aware as_result function when
+    its time budget runs out, or is already exhausted when it is called.
+
+    Attributes:
+        name (str): The qualified name of the function.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"Deadline exceeded for {name}")
+        self.name = name
+
+
+class DeadlineWorkersBusy(Exception):
+    """
+    The error of the Fail returned, without running the function, by a
+    deadline-aware sync as_result function when every deadline worker thread
+    is taken, typically by abandoned calls that are still running.
+
+    Unlike DeadlineExceeded, it says nothing about the call's time budget:
+    the function may be retried once workers free up.
+
+    Attributes:
+        name (str): The qualified name of the function.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"No deadline worker free for {name}")
+        self.name = name
@@ -1,3 +1,18 @@
-from .base import is_ok, is_fail, is_result
+from .._lazy import lazy_attributes
 
-__all__ = ["is_ok", "is_fail", "is_result"]
\ No newline at end of file
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .base import is_ok, is_fail, is_result, is_some, is_nothing
+
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "is_ok": (".base", "is_ok"),
+    "is_fail": (".base", "is_fail"),
+    "is_result": (".base", "is_result"),
+    "is_some": (".base", "is_some"),
+    "is_nothing": (".base", "is_nothing"),
+}
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
+
+__all__ = ["is_ok", "is_fail", "is_result", "is_some", "is_nothing"]
@@ -1,6 +1,8 @@
 from typing import TypeGuard, TypeIs
-from result.types.base import Either, Result, Ok, Fail
-from result.base import _Result as ResultClass
+from result.types.base import Either, Result, Ok, Fail, Option, Some
+from result.base import _RESULT_TYPES
+from result.nothing import Nothing, NothingClass
+from result.option import Some as SomeClass
 
 
 def is_result[T](result: T) -> TypeGuard[Result[T]]:
@@ -14,7 +16,7 @@ def is_result[T](result: T) -> TypeGuard[Result[T]]:
         TypeGuard[ResultInstance[T]]: True if `result` is an instance of Ok or Fail,
         otherwise False.
     """
-    return isinstance(result, ResultClass)
+    return type(result) in _RESULT_TYPES
 
 
 def is_ok[S, F](result: Either[S, F]) -> TypeIs[Ok[S]]:
@@ -29,7 +31,7 @@ def is_ok[S, F](result: Either[S, F]) -> TypeIs[Ok[S]]:
     Returns:
         TypeIs[Ok[S]]: True if `result` is an Ok result, otherwise False.
     """
-    return result.isOk()
+    return result._is_ok
 
 
 def is_fail[S, F](result: Either[S, F]) -> TypeIs[Fail[F]]:
@@ -44,4 +46,31 @@ def is_fail[S, F](result: Either[S, F]) -> TypeIs[Fail[F]]:
     Returns:
         TypeIs[Fail[F]]: True if `result` is a Fail result, otherwise False.
     """
-    return result.isFail()
+    return not result._is_ok
+
+
+def is_some[T](option: Option[T]) -> TypeIs[Some[T]]:
+    """
+    Type guard to check if an Option holds a value.
+
+    Args:
+        option (Option[T]): The Option object to check.
+
+    Returns:
+        TypeIs[Some[T]]: True if `option` is a Some, otherwise False (including
+        for Nothing, None and Ok/Fail).
+    """
+    return isinstance(option, SomeClass)
+
+
+def is_nothing[T](option: Option[T]) -> TypeIs[NothingClass]:
+    """
+    Type guard to check if an Option is Nothing.
+
+    Args:
+        option (Option[T]): The Option object to check.
+
+    Returns:
+        TypeIs[NothingClass]: True if `option` is the Nothing singleton, otherwise False.
+    """
+    return option is Nothing
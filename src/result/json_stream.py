@@ -0,0 +1,378 @@
+"""
+Streaming JSON encoding and decoding of Ok/Fail results.
+
+A result is written as a one-key object, {"ok": value} or {"err": error},
+with configurable keys, and a sequence of results as a JSON array of them.
+Encoding formats each value directly into output chunks, without building
+a wrapper dict per result; decoding parses the wrapper by hand and only
+hands the inner value to the json module, reading the stream in bounded
+pieces.
+
+Example:
+    >>> with open("out.json", "w") as fp:
+    ...     dump(results, fp)
+    >>> with open("out.json") as fp:
+    ...     for result in iter_load(fp):
+    ...         ...
+"""
+
+from codecs import getincrementaldecoder
+from json import JSONDecodeError, JSONDecoder, JSONEncoder
+from json.encoder import encode_basestring_ascii
+from re import compile as _compile
+from typing import IO, Any, Callable, Final, Iterable, Iterator
+
+from result.base import Fail, Ok
+from result.types.base import Either
+
+_WHITESPACE: Final = _compile(r"[ \t\n\r]*")
+_DECODER: Final[JSONDecoder] = JSONDecoder()
+
+
+class _NeedMore(Exception):
+    """Raised by the parser when the buffer may end inside an element."""
+
+
+def _encoder(default: Callable[[Any], Any] | None) -> Callable[[Any], str]:
+    return JSONEncoder(separators=(",", ":"), default=default).encode
+
+
+def dumps_result(
+    result: Either[Any, Any],
+    *,
+    ok_key: str = "ok",
+    err_key: str = "err",
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """
+    Encode one result as a JSON object.
+
+    Args:
+        result (Either[Any, Any]): The Ok/Fail to encode.
+        ok_key (str, optional): The key used for Ok values. Defaults to "ok".
+        err_key (str, optional): The key used for Fail errors. Defaults to "err".
+        default (Callable[[Any], Any] | None, optional): Converts values the
+            json module cannot serialise, as in json.dumps. Defaults to None.
+
+    Returns:
+        str: The JSON text.
+    """
+    encode = _encoder(default)
+    key = encode(ok_key if result._is_ok else err_key)
+    return f"{{{key}:{encode(result.value)}}}"
+
+
+def iter_encode(
+    results: Iterable[Either[Any, Any]],
+    *,
+    ok_key: str = "ok",
+    err_key: str = "err",
+    default: Callable[[Any], Any] | None = None,
+    batch: int = 512,
+) -> Iterator[str]:
+    """
+    Lazily encode results as a JSON array, yielding text chunks.
+
+    Args:
+        results (Iterable[Either[Any, Any]]): The Ok/Fail results. Consumed
+            lazily.
+        ok_key (str, optional): The key used for Ok values. Defaults to "ok".
+        err_key (str, optional): The key used for Fail errors. Defaults to "err".
+        default (Callable[[Any], Any] | None, optional): Converts values the
+            json module cannot serialise, as in json.dumps. Defaults to None.
+        batch (int, optional): How many results go into one chunk. Defaults
+            to 512.
+
+    Raises:
+        ValueError: If `batch` is not positive, when called rather than on the
+            first next().
+
+    Returns:
+        Iterator[str]: Pieces of the JSON array, in order.
+    """
+    if batch < 1:
+        raise ValueError("batch must be a positive integer.")
+    return _iter_encode(results, ok_key, err_key, default, batch)
+
+
+def _iter_encode(
+    results: Iterable[Either[Any, Any]],
+    ok_key: str,
+    err_key: str,
+    default: Callable[[Any], Any] | None,
+    batch: int,
+) -> Iterator[str]:
+    encode = _encoder(default)
+    ok_prefix, err_prefix = f"{{{encode(ok_key)}:", f"{{{encode(err_key)}:"
+    parts: list[str] = []
+    append = parts.append
+    separator = "["
+    for result in results:
+        value = result.value
+        kind = type(value)
+        append(separator)
+        append(ok_prefix if result._is_ok else err_prefix)
+        # JSONEncoder.encode builds a C encoder per call; skip it for the
+        # common scalars, whose JSON form is fixed.
+        if kind is int:
+            append(int.__repr__(value))
+        elif kind is str:
+            append(encode_basestring_ascii(value))
+        else:
+            append(encode(value))
+        append("}")
+        separator = ","
+        if len(parts) >= batch * 4:
+            yield "".join(parts)
+            parts.clear()
+    if separator == "[":
+        append("[")
+    append("]")
+    yield "".join(parts)
+
+
+def dump(
+    results: Iterable[Either[Any, Any]],
+    fp: IO[str],
+    *,
+    ok_key: str = "ok",
+    err_key: str = "err",
+    default: Callable[[Any], Any] | None = None,
+    batch: int = 512,
+) -> None:
+    """
+    Write results to a text file object as a JSON array, chunk by chunk.
+
+    Args:
+        results (Iterable[Either[Any, Any]]): The Ok/Fail results. Consumed
+            lazily.
+        fp (IO[str]): Anything with a `write(str)` method.
+        ok_key (str, optional): The key used for Ok values. Defaults to "ok".
+        err_key (str, optional): The key used for Fail errors. Defaults to "err".
+        default (Callable[[Any], Any] | None, optional): Converts values the
+            json module cannot serialise, as in json.dumps. Defaults to None.
+        batch (int, optional): How many results go into one write. Defaults
+            to 512.
+    """
+    write = fp.write
+    for chunk in iter_encode(
+        results, ok_key=ok_key, err_key=err_key, default=default, batch=batch
+    ):
+        write(chunk)
+
+
+def _parse_element(
+    text: str, index: int, ok_key: str, err_key: str, final: bool
+) -> tuple[Either[Any, Any], int]:
+    """
+    Parse one {"key": value} object starting at `index` (after whitespace).
+
+    Unless `final` is set, any error is reported as _NeedMore: the buffer may
+    just end inside the element (a string, or a number cut in two).
+    """
+    match = _WHITESPACE.match
+    try:
+        if text[index : index + 1] != "{":
+            raise JSONDecodeError("Expecting '{'", text, index)
+        key, index = _DECODER.raw_decode(text, match(text, index + 1).end())
+        index = match(text, index).end()
+        if text[index : index + 1] != ":":
+            raise JSONDecodeError("Expecting ':' delimiter", text, index)
+        value, index = _DECODER.raw_decode(text, match(text, index + 1).end())
+        index = match(text, index).end()
+        if text[index : index + 1] != "}":
+            raise JSONDecodeError("Expecting '}'", text, index)
+    except JSONDecodeError:
+        if final:
+            raise
+        raise _NeedMore from None
+    if key == ok_key:
+        return Ok(value), index + 1
+    if key == err_key:
+        return Fail(value), index + 1
+    raise ValueError(f"Unknown result key {key!r}, expected {ok_key!r} or {err_key!r}.")
+
+
+def _parse_batch(
+    text: str, ok_key: str, err_key: str
+) -> list[Either[Any, Any]] | None:
+    """
+    Decode `text`, a run of comma-separated result objects, in one C call.
+
+    Returns None if the run is not valid JSON or any object is not a single
+    `ok_key`/`err_key` pair; the caller then parses element by element, which
+    also reports the precise error.
+    """
+    try:
+        items, end = _DECODER.scan_once(f"[{text}]", 0)
+    except (StopIteration, JSONDecodeError):
+        return None
+    if end != len(text) + 2:
+        return None
+    results: list[Either[Any, Any]] = []
+    append = results.append
+    for item in items:
+        if type(item) is not dict or len(item) != 1:
+            return None
+        if ok_key in item:
+            append(Ok(item[ok_key]))
+        elif err_key in item:
+            append(Fail(item[err_key]))
+        else:
+            return None
+    return results
+
+
+def loads_result(text: str, *, ok_key: str = "ok", err_key: str = "err") -> Either[Any, Any]:
+    """
+    Decode one result from a JSON object.
+
+    Args:
+        text (str): The JSON text.
+        ok_key (str, optional): The key used for Ok values. Defaults to "ok".
+        err_key (str, optional): The key used for Fail errors. Defaults to "err".
+
+    Raises:
+        json.JSONDecodeError: If the text is not a single result object.
+        ValueError: If the object's key is neither `ok_key` nor `err_key`.
+
+    Returns:
+        Either[Any, Any]: The decoded result.
+    """
+    result, index = _parse_element(
+        text, _WHITESPACE.match(text).end(), ok_key, err_key, True
+    )
+    index = _WHITESPACE.match(text, index).end()
+    if index != len(text):
+        raise JSONDecodeError("Extra data", text, index)
+    return result
+
+
+def iter_load(
+    fp: IO[str] | IO[bytes],
+    *,
+    ok_key: str = "ok",
+    err_key: str = "err",
+    read_size: int = 1 << 16,
+) -> Iterator[Either[Any, Any]]:
+    """
+    Lazily decode a JSON array of results from a file object.
+
+    The stream is read `read_size` characters (or bytes, decoded as UTF-8) at
+    a time, and only the unparsed tail of the current piece is kept, so
+    memory is bounded by the largest single element rather than the payload.
+
+    Args:
+        fp (IO[str] | IO[bytes]): A text or binary file object.
+        ok_key (str, optional): The key used for Ok values. Defaults to "ok".
+        err_key (str, optional): The key used for Fail errors. Defaults to "err".
+        read_size (int, optional): How much to read at a time. Defaults to 64 KiB.
+
+    Raises:
+        json.JSONDecodeError: If the stream is not a JSON array of result objects.
+        ValueError: If an object's key is neither `ok_key` nor `err_key`.
+
+    Yields:
+        Iterator[Either[Any, Any]]: The decoded results, in order.
+    """
+    read = fp.read
+    to_text: Callable[[Any, bool], str] | None = None
+    buffer, index, exhausted = "", 0, False
+
+    def fill() -> None:
+        nonlocal buffer, index, exhausted, to_text
+        chunk = read(read_size)
+        if to_text is None:
+            to_text = (
+                getincrementaldecoder("utf-8")().decode
+                if isinstance(chunk, (bytes, bytearray))
+                else (lambda piece, final: piece)
+            )
+        if not chunk:
+            exhausted = True
+        buffer = buffer[index:] + to_text(chunk, not chunk)
+        index = 0
+
+    def skip_whitespace() -> None:
+        nonlocal index
+        while True:
+            index = _WHITESPACE.match(buffer, index).end()
+            if index < len(buffer) or exhausted:
+                return
+            fill()
+
+    # Fast path for the compact form this module writes: match the wrapper
+    # with startswith and hand only the value to the C scanner.
+    encode = _encoder(None)
+    ok_prefix, err_prefix = f"{{{encode(ok_key)}:", f"{{{encode(err_key)}:"
+    ok_length, err_length = len(ok_prefix), len(err_prefix)
+    scan_once = _DECODER.scan_once
+
+    skip_whitespace()
+    if buffer[index : index + 1] != "[":
+        raise JSONDecodeError("Expecting '['", buffer, index)
+    index += 1
+    skip_whitespace()
+    if buffer[index : index + 1] == "]":
+        index += 1
+    else:
+        while True:
+            # Batch path: decode every complete element left in the buffer
+            # with one call into the C scanner. A cut that falls inside a
+            # string or an unfinished element cannot parse, and then the
+            # per-element path below runs instead.
+            end = buffer.rfind("}", index)
+            if end > index and buffer[index : index + 1] == "{":
+                batch = _parse_batch(buffer[index : end + 1], ok_key, err_key)
+                if batch is not None:
+                    yield from batch
+                    index = end + 1
+                    if buffer[index : index + 1] == ",":
+                        index += 1
+                        continue
+                    skip_whitespace()
+                    delimiter = buffer[index : index + 1]
+                    index += 1
+                    if delimiter == "]":
+                        break
+                    if delimiter != ",":
+                        raise JSONDecodeError("Expecting ',' delimiter", buffer, index - 1)
+                    skip_whitespace()
+                    continue
+            result = None
+            if buffer.startswith(ok_prefix, index):
+                make, start = Ok, index + ok_length
+            elif buffer.startswith(err_prefix, index):
+                make, start = Fail, index + err_length
+            else:
+                make = None
+            if make is not None:
+                try:
+                    value, end = scan_once(buffer, start)
+                    if buffer[end : end + 1] == "}":
+                        result, index = make(value), end + 1
+                except (StopIteration, JSONDecodeError):
+                    pass
+            if result is None:
+                skip_whitespace()
+                try:
+                    result, index = _parse_element(
+                        buffer, index, ok_key, err_key, exhausted
+                    )
+                except _NeedMore:
+                    fill()
+                    continue
+            yield result
+            if buffer[index : index + 1] == ",":
+                index += 1
+                continue
+            skip_whitespace()
+            delimiter = buffer[index : index + 1]
+            index += 1
+            if delimiter == "]":
+                break
+            if delimiter != ",":
+                raise JSONDecodeError("Expecting ',' delimiter", buffer, index - 1)
+    skip_whitespace()
+    if index != len(buffer):
+        raise JSONDecodeError("Extra data", buffer, index)
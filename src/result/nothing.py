@@ -1,20 +1,128 @@
-from dataclasses import dataclass
-from typing import runtime_checkable, Protocol, Never, Final, Literal
+from typing import (
+    runtime_checkable,
+    Any,
+    Callable,
+    Protocol,
+    Never,
+    Final,
+    Literal,
+    Self,
+)
+
+from result.base import Fail
+
 
 @runtime_checkable
 class NothingType(Protocol):
     def __nothing__(self) -> Never: ...
 
-@dataclass(frozen=True)
+
 class _Nothing:
+    """
+    The empty variant of Option.
+
+    There is exactly one instance, `Nothing`: constructing `_Nothing()` again
+    returns it, and every combinator returns it or the provided fallback, so
+    the empty path never allocates.
+    """
+
+    __slots__ = ()
+    __match_args__ = ()
+
+    _instance: "_Nothing | None" = None
+    value = None
+
+    def __new__(cls) -> Self:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance  # type: ignore
+
     def __nothing__(self) -> Never:
         raise RuntimeError("Nothing has no value")
 
     def __repr__(self) -> str:
         return "Nothing"
 
-    value = None
+    def __reduce__(self) -> str:
+        # Pickle and copy by reference to the module-level singleton.
+        return "Nothing"
+
+    def is_some(self) -> Literal[False]:
+        """
+        Return False: Nothing never holds a value.
+
+        Returns:
+            Literal[False]: Always False for Nothing.
+        """
+        return False
+
+    def is_nothing(self) -> Literal[True]:
+        """
+        Return True: this Option is Nothing.
+
+        Returns:
+            Literal[True]: Always True for Nothing.
+        """
+        return True
+
+    def map(self, func: Callable[[Any], Any]) -> Self:
+        """
+        Return Nothing without calling `func`.
+
+        Args:
+            func (Callable[[Any], Any]): Ignored.
+
+        Returns:
+            _Nothing: This instance.
+        """
+        return self
+
+    def and_then(self, func: Callable[[Any], Any]) -> Self:
+        """
+        Return Nothing without calling `func`.
+
+        Args:
+            func (Callable[[Any], Any]): Ignored.
+
+        Returns:
+            _Nothing: This instance.
+        """
+        return self
+
+    def unwrap_or[K](self, default: K) -> K:
+        """
+        Return the fallback value.
+
+        Args:
+            default (K): The value to return.
+
+        Returns:
+            K: `default`.
+        """
+        return default
+
+    def ok_or[F](self, error: F) -> Fail[F]:
+        """
+        Convert this Option into a Fail holding `error`.
+
+        Args:
+            error (F): The error value for the Fail.
+
+        Returns:
+            Fail[F]: result_fail(error), so a registered sentinel error gives
+            its shared instance.
+        """
+        # Imported here: result.utils.helpers imports this module through
+        # result.types.
+        from result.utils.helpers import result_fail
+
+        return result_fail(error)
+
 
 Nothing: Final[_Nothing] = _Nothing()
 
-__all__ = ["Nothing", "NothingType"]
\ No newline at end of file
+# The public name of the class, for class patterns (`case NothingClass():`)
+# and isinstance checks, alongside OkClass, FailClass and SomeClass.
+NothingClass = _Nothing
+
+__all__ = ["Nothing", "NothingClass", "NothingType"]
@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterator, Literal, TypeVar
+
+from result.base import Ok
+from result.nothing import Nothing, _Nothing
+
+S = TypeVar("S", covariant=True)
+
+
+@dataclass(frozen=True, slots=True)
+class Some(Generic[S]):
+    """
+    The present variant of Option, holding a value.
+
+    Option is the lighter sibling of Result for "maybe a value" lookups: the
+    empty case is the `Nothing` singleton instead of a Fail with a made-up
+    error payload.
+
+    Example:
+        >>> def lookup(key: str) -> Option[int]:
+        ...     value = cache.get(key)
+        ...     return Nothing if value is None else Some(value)
+        ...
+        >>> lookup("hits").map(lambda n: n + 1).unwrap_or(0)
+    """
+
+    value: S
+    __match_args__ = ("value",)
+
+    def __iter__(self) -> Iterator[S]:
+        """
+        Yield the contained value to support unpacking and iteration.
+
+        Yields:
+            Iterator[S]: The contained value.
+        """
+        yield self.value
+
+    def __repr__(self) -> str:
+        """
+        Return a developer-friendly string representation of Some.
+
+        Returns:
+            str: A string representation of the Some option.
+        """
+        return f"<Some ({(self.value)})>"
+
+    def is_some(self) -> Literal[True]:
+        """
+        Return True: this Option holds a value.
+
+        Returns:
+            Literal[True]: Always True for Some.
+        """
+        return True
+
+    def is_nothing(self) -> Literal[False]:
+        """
+        Return False: Some is never Nothing.
+
+        Returns:
+            Literal[False]: Always False for Some.
+        """
+        return False
+
+    def map[U](self, func: Callable[[S], U]) -> "Some[U]":
+        """
+        Apply `func` to the contained value and wrap the outcome in Some.
+
+        Args:
+            func (Callable[[S], U]): The function to apply.
+
+        Returns:
+            Some[U]: Some(func(value)).
+        """
+        return Some(func(self.value))
+
+    def and_then[U](self, func: "Callable[[S], Some[U] | _Nothing]") -> "Some[U] | _Nothing":
+        """
+        Apply an Option-returning `func` to the contained value.
+
+        Args:
+            func (Callable[[S], Option[U]]): The function to apply.
+
+        Returns:
+            Option[U]: The Option returned by `func`.
+        """
+        return func(self.value)
+
+    def unwrap_or[K](self, default: K) -> S | K:
+        """
+        Return the contained value, ignoring the fallback.
+
+        Args:
+            default (K): Ignored.
+
+        Returns:
+            S: The contained value.
+        """
+        return self.value
+
+    def ok_or[F](self, error: F) -> Ok[S]:
+        """
+        Convert this Option into an Ok holding the contained value.
+
+        Args:
+            error (F): Ignored.
+
+        Returns:
+            Ok[S]: Ok(value).
+        """
+        return Ok(self.value)
+
+
+__all__ = ["Some", "Nothing"]
@@ -1,3 +1,42 @@
-from .base import Either, Ok, Fail, Result, ResultCombine
+from .._lazy import lazy_attributes
 
-__all__ = ["Either","Ok", "Fail", "Result", "ResultCombine"]
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .base import (
+        Either,
+        Ok,
+        Fail,
+        Result,
+        ResultCombine,
+        Some,
+        Option,
+        TraceEntry,
+        TracebackCapture,
+    )
+
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "Either": (".base", "Either"),
+    "Ok": (".base", "Ok"),
+    "Fail": (".base", "Fail"),
+    "Result": (".base", "Result"),
+    "ResultCombine": (".base", "ResultCombine"),
+    "Some": (".base", "Some"),
+    "Option": (".base", "Option"),
+    "TraceEntry": (".base", "TraceEntry"),
+    "TracebackCapture": (".base", "TracebackCapture"),
+}
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
+
+__all__ = [
+    "Either",
+    "Ok",
+    "Fail",
+    "Result",
+    "ResultCombine",
+    "Some",
+    "Option",
+    "TraceEntry",
+    "TracebackCapture",
+]
@@ -1,7 +1,15 @@
+from typing import Literal
+
 from result.base import Ok as OkClass, Fail as FailClass
+from result.nothing import _Nothing as NothingClass
+from result.option import Some as SomeClass
 
 type Either[S, F] = Ok[S] | FailClass[F]
 type Ok[S] = OkClass[S]
 type Fail[F] = FailClass[F]
 type Result[T] = OkClass[T] | FailClass[T]
 type ResultCombine[S, F] = Either[S, F]
+type Some[T] = SomeClass[T]
+type Option[T] = SomeClass[T] | NothingClass
+type TracebackCapture = Literal["full", "summary", "none"]
+type TraceEntry = tuple[str, int, str]
@@ -1,10 +1,86 @@
-from .helpers import (
-    result_combine,
-    result_fail,
-    result_equality,
-    result_ok,
-    as_result,
-    as_result_all,
-)
-
-__all__ = ["result_combine", "result_fail", "result_equality", "result_ok", "as_result", "as_result_all"]
\ No newline at end of file
+from .._lazy import lazy_attributes
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .helpers import (
+        result_combine,
+        result_combine_iter,
+        result_combine_chunked,
+        result_combine_all,
+        result_partition,
+        result_fail,
+        result_equality,
+        result_ok,
+        as_result,
+        as_result_all,
+        register_fail_sentinel,
+        traceback_summary,
+        result_do,
+        result_do_async,
+    )
+    from .compose import Pipeline, pipeline
+    from .parallel import result_map, result_map_processes
+    from .aio import gather_results
+    from .cache import CacheStats, cached_result
+    from .hedge import hedged
+    from .breaker import circuit_breaker
+    from .deadlines import deadline, time_remaining
+
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "result_combine": (".helpers", "result_combine"),
+    "result_combine_iter": (".helpers", "result_combine_iter"),
+    "result_combine_chunked": (".helpers", "result_combine_chunked"),
+    "result_combine_all": (".helpers", "result_combine_all"),
+    "result_partition": (".helpers", "result_partition"),
+    "result_fail": (".helpers", "result_fail"),
+    "result_equality": (".helpers", "result_equality"),
+    "result_ok": (".helpers", "result_ok"),
+    "as_result": (".helpers", "as_result"),
+    "as_result_all": (".helpers", "as_result_all"),
+    "register_fail_sentinel": (".helpers", "register_fail_sentinel"),
+    "traceback_summary": (".helpers", "traceback_summary"),
+    "result_do": (".helpers", "result_do"),
+    "result_do_async": (".helpers", "result_do_async"),
+    "pipeline": (".compose", "pipeline"),
+    "Pipeline": (".compose", "Pipeline"),
+    "result_map": (".parallel", "result_map"),
+    "result_map_processes": (".parallel", "result_map_processes"),
+    "gather_results": (".aio", "gather_results"),
+    "cached_result": (".cache", "cached_result"),
+    "CacheStats": (".cache", "CacheStats"),
+    "hedged": (".hedge", "hedged"),
+    "circuit_breaker": (".breaker", "circuit_breaker"),
+    "deadline": (".deadlines", "deadline"),
+    "time_remaining": (".deadlines", "time_remaining"),
+}
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
+
+__all__ = [
+    "result_combine",
+    "result_combine_iter",
+    "result_combine_chunked",
+    "result_combine_all",
+    "result_partition",
+    "result_fail",
+    "result_equality",
+    "result_ok",
+    "as_result",
+    "as_result_all",
+    "register_fail_sentinel",
+    "traceback_summary",
+    "result_do",
+    "result_do_async",
+    "pipeline",
+    "Pipeline",
+    "result_map",
+    "result_map_processes",
+    "gather_results",
+    "cached_result",
+    "CacheStats",
+    "hedged",
+    "circuit_breaker",
+    "deadline",
+    "time_remaining",
+]
@@ -0,0 +1,256 @@
+"""
+Compiles result_do / result_do_async bodies into early-return functions.
+
+A decorated generator such as
+
+    def total(order_id):
+        order = yield load_order(order_id)
+        return order.price
+
+is recompiled, from its source, into the chain one would write by hand:
+
+    def total(order_id):
+        __do_step__ = load_order(order_id)
+        if not __do_step__._is_ok:
+            return __do_step__
+        order = __do_step__.value
+        return __do_ok__(order.price)
+
+so a call pays for neither a generator nor the StopIteration carrying its
+return value. Only `yield` used as a statement, or as the whole right-hand
+side of an assignment, is rewritten; any other shape returns None and the
+caller falls back to driving the generator.
+"""
+
+import ast
+from inspect import getsource
+from textwrap import dedent
+from types import CellType, CodeType, FunctionType
+from typing import Any, Callable, Final
+
+from result.utils.helpers import result_ok
+
+_STEP: Final[str] = "__do_step__"
+_LAST: Final[str] = "__do_last__"
+_OK: Final[str] = "__do_ok__"
+_FACTORY: Final[str] = "__do_factory__"
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _ok(value: ast.expr) -> ast.expr:
+    return ast.Call(ast.Name(_OK, ast.Load()), [value], [])
+
+
+def _catches_exit(handler: ast.ExceptHandler) -> bool:
+    """Return True if `handler` would see the GeneratorExit raised by close()."""
+    if handler.type is None:
+        return True
+    if isinstance(handler.type, ast.Tuple):
+        names = handler.type.elts
+    else:
+        names = [handler.type]
+    return any(
+        isinstance(name, ast.Name) and name.id in ("BaseException", "GeneratorExit")
+        for name in names
+    )
+
+
+class _Rewriter(ast.NodeTransformer):
+    def __init__(self, is_async: bool) -> None:
+        self._is_async = is_async
+        # > 0 while inside a block whose behaviour differs between an early
+        # return and the GeneratorExit that closing a generator raises.
+        self._guarded = 0
+
+    def _step(
+        self, node: ast.stmt, value: ast.expr | None, targets: list[ast.expr]
+    ) -> list[ast.stmt]:
+        if self._guarded:
+            raise _Unsupported
+        step = ast.Name(_STEP, ast.Load())
+        statements: list[ast.stmt] = [
+            ast.Assign([ast.Name(_STEP, ast.Store())], value or ast.Constant(None)),
+            ast.If(
+                ast.UnaryOp(ast.Not(), ast.Attribute(step, "_is_ok", ast.Load())),
+                [ast.Return(step)],
+                [],
+            ),
+        ]
+        if self._is_async:
+            statements.append(ast.Assign([ast.Name(_LAST, ast.Store())], step))
+        if targets:
+            value = ast.Attribute(step, "value", ast.Load())
+            statements.append(ast.Assign(targets, value))
+        for statement in statements:
+            ast.copy_location(statement, node)
+        return statements
+
+    def visit_Expr(self, node: ast.Expr) -> Any:
+        if isinstance(node.value, ast.Yield):
+            return self._step(node, node.value.value, [])
+        return self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign) -> Any:
+        if isinstance(node.value, ast.Yield):
+            return self._step(node, node.value.value, node.targets)
+        return self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> Any:
+        if isinstance(node.value, ast.Yield):
+            return self._step(node, node.value.value, [node.target])
+        return self.generic_visit(node)
+
+    def visit_Return(self, node: ast.Return) -> Any:
+        if self._is_async:
+            value: ast.expr = ast.Name(_LAST, ast.Load())
+        else:
+            value = _ok(node.value or ast.Constant(None))
+        return ast.copy_location(ast.Return(value), node)
+
+    def visit_With(self, node: ast.stmt) -> Any:
+        # A context manager (or a handler catching BaseException) sees the
+        # GeneratorExit raised when a generator is closed, but nothing on an
+        # early return.
+        self._guarded += 1
+        try:
+            return self.generic_visit(node)
+        finally:
+            self._guarded -= 1
+
+    visit_AsyncWith = visit_With
+
+    def visit_Try(self, node: ast.Try | ast.TryStar) -> Any:
+        if any(_catches_exit(handler) for handler in node.handlers):
+            return self.visit_With(node)
+        return self.generic_visit(node)
+
+    visit_TryStar = visit_Try
+
+    def _nested(self, node: ast.AST) -> ast.AST:
+        # Yields and returns in nested scopes belong to those scopes.
+        return node
+
+    visit_FunctionDef = visit_AsyncFunctionDef = _nested
+    visit_Lambda = visit_ClassDef = _nested
+
+
+_NESTED: Final = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+
+
+def _has_leftover(function: ast.AST) -> bool:
+    """Return True if a yield survived the rewrite, or a name would change meaning."""
+    pending = list(ast.iter_child_nodes(function))
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (ast.Yield, ast.YieldFrom)):
+            return True
+        if not isinstance(node, _NESTED):
+            # Nested scopes are free to yield.
+            pending.extend(ast.iter_child_nodes(node))
+    for node in ast.walk(function):
+        if isinstance(node, ast.Name):
+            name = node.id
+        elif isinstance(node, ast.Attribute):
+            name = node.attr
+        else:
+            continue
+        # Private names are mangled only when compiled inside their class.
+        if name.startswith("__") and not name.endswith("__"):
+            return True
+    return False
+
+
+def _find_code(code: CodeType, name: str) -> CodeType:
+    return next(
+        const
+        for const in code.co_consts
+        if isinstance(const, CodeType) and const.co_name == name
+    )
+
+
+def compile_do(
+    func: Callable[..., Any], is_async: bool
+) -> Callable[..., Any] | None:
+    """
+    Rebuild the generator function `func` as an early-return function.
+
+    Args:
+        func (Callable[..., Any]): A result_do generator function, or a
+            result_do_async async generator function.
+        is_async (bool): Whether `func` is an async generator function.
+
+    Returns:
+        Callable[..., Any] | None: A plain (or coroutine) function with the
+        same behaviour, or None if `func` cannot be rewritten.
+    """
+    code = func.__code__
+    if "__class__" in code.co_freevars:
+        # Zero-argument super() needs the class cell of a class body.
+        return None
+    try:
+        tree = ast.parse(dedent(getsource(func)))
+    except (OSError, TypeError, SyntaxError):
+        return None
+    function = tree.body[0] if len(tree.body) == 1 else None
+    if not isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return None
+    if function.name != code.co_name:
+        return None
+    used = {node.id for node in ast.walk(function) if isinstance(node, ast.Name)}
+    if used & {_STEP, _LAST, _OK, _FACTORY}:
+        return None
+
+    try:
+        # generic_visit: visit the body without treating `function` as nested.
+        _Rewriter(is_async).generic_visit(function)
+    except _Unsupported:
+        return None
+    if _has_leftover(function):
+        return None
+    function.decorator_list = []
+    # Type parameters would add a scope around the function; annotations are
+    # never evaluated here, so they can go.
+    function.type_params = []
+    if is_async:
+        last = ast.Assign([ast.Name(_LAST, ast.Store())], _ok(ast.Constant(None)))
+        function.body.insert(0, last)
+        function.body.append(ast.Return(ast.Name(_LAST, ast.Load())))
+    else:
+        function.body.append(ast.Return(_ok(ast.Constant(None))))
+
+    # Compile inside a factory taking the closure's names as parameters, so
+    # the rebuilt function gets free variables that can reuse func's cells.
+    free = (*code.co_freevars, _OK)
+    factory = ast.FunctionDef(
+        name=_FACTORY,
+        args=ast.arguments(args=[ast.arg(name) for name in free]),
+        body=[function, ast.Return(ast.Name(function.name, ast.Load()))],
+    )
+    module = ast.Module([factory], [])
+    ast.fix_missing_locations(module)
+    ast.increment_lineno(module, code.co_firstlineno - 1)
+    try:
+        compiled = compile(module, code.co_filename, "exec")
+    except SyntaxError:
+        return None
+
+    inner = _find_code(_find_code(compiled, _FACTORY), function.name)
+    arguments = code.co_argcount + code.co_kwonlyargcount
+    if inner.co_varnames[:arguments] != code.co_varnames[:arguments]:
+        # The source on disk no longer matches the loaded function.
+        return None
+    inner = inner.replace(co_qualname=code.co_qualname)
+    cells = dict(zip(code.co_freevars, func.__closure__ or ()))
+    cells[_OK] = CellType(result_ok)
+    rebuilt = FunctionType(
+        inner,
+        func.__globals__,
+        func.__name__,
+        func.__defaults__,
+        tuple(cells[name] for name in inner.co_freevars),
+    )
+    rebuilt.__kwdefaults__ = func.__kwdefaults__
+    return rebuilt
@@ -0,0 +1,108 @@
+from asyncio import FIRST_COMPLETED, Future, ensure_future, gather, wait
+from inspect import iscoroutine
+from itertools import islice
+from sys import maxsize
+from typing import Any, Awaitable, Iterable, Literal, Tuple, overload
+
+from result.types.base import Either
+from result.utils.helpers import result_ok
+
+
+@overload
+async def gather_results[S, F](
+    aws: Iterable[Awaitable[Either[S, F]]],
+    limit: int | None = None,
+    fail_fast: Literal[True] = True,
+) -> Either[Tuple[S, ...], F]: ...
+
+
+@overload
+async def gather_results[S, F](
+    aws: Iterable[Awaitable[Either[S, F]]],
+    limit: int | None = None,
+    *,
+    fail_fast: Literal[False],
+) -> Tuple[Either[S, F], ...]: ...
+
+
+async def gather_results(
+    aws: Iterable[Awaitable[Either[Any, Any]]],
+    limit: int | None = None,
+    fail_fast: bool = True,
+) -> Either[Tuple[Any, ...], Any] | Tuple[Either[Any, Any], ...]:
+    """
+    Await Result-returning awaitables concurrently, with an optional concurrency cap.
+
+    Tasks are created lazily: at most `limit` awaitables are scheduled at any
+    time, and the next one is taken from `aws` only when a running one
+    finishes, so the peak number of tasks is bounded, not just the number
+    running. (A semaphore around eagerly created tasks would cap only how
+    many run, while still creating a task per awaitable up front.)
+
+    Behavior:
+    - fail_fast=True: returns Ok(tuple_of_values) in input order, or the first
+      Fail to complete. On a Fail the running tasks are cancelled and awaited,
+      so none is left with an unretrieved exception, and awaitables never
+      started are closed.
+    - fail_fast=False: waits for everything and returns the tuple of Ok/Fail
+      results in input order.
+
+    An exception raised by an awaitable cancels the rest, as with fail_fast,
+    and propagates.
+
+    Example:
+        >>> fetch = as_result(OSError)(fetch_async)
+        >>> await gather_results((fetch(url) for url in urls), limit=50)
+        <Ok ((...))>
+
+    Args:
+        aws (Iterable[Awaitable[Either[S, F]]]): Coroutines or futures
+            resolving to Ok/Fail. A generator is consumed lazily.
+        limit (int | None, optional): Maximum number of tasks scheduled at
+            once. Defaults to None (no cap).
+        fail_fast (bool, optional): Return at the first Fail. Defaults to True.
+
+    Raises:
+        ValueError: If `limit` is not positive.
+
+    Returns:
+        Either[Tuple[S, ...], F] | Tuple[Either[S, F], ...]: See Behavior.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be None or a positive integer.")
+    source = enumerate(aws)
+    results: list[Any] = []
+    running: dict[Future[Any], int] = {}
+
+    def start(count: int) -> None:
+        for index, awaitable in islice(source, count):
+            results.append(None)
+            running[ensure_future(awaitable)] = index
+
+    try:
+        start(limit or maxsize)
+        while running:
+            done, _ = await wait(running, return_when=FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if fail_fast and not result._is_ok:
+                    return result
+                results[running.pop(task)] = result
+            start(len(done))
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            # Let the cancellations land and retrieve whatever the tasks
+            # ended with, so nothing logs "exception was never retrieved".
+            await gather(*running, return_exceptions=True)
+        # Awaitables handed over in a collection already exist; close the
+        # coroutines among them so they do not warn about never being awaited.
+        if iter(aws) is not aws:
+            for _, awaitable in source:
+                if iscoroutine(awaitable):
+                    awaitable.close()
+
+    if fail_fast:
+        return result_ok(tuple([result.value for result in results]))
+    return tuple(results)
@@ -0,0 +1,284 @@
+from asyncio import CancelledError
+from functools import wraps
+from inspect import iscoroutinefunction
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Final
+
+from result.errors import CircuitOpen
+from result.types.base import Either
+from result.utils.helpers import result_fail
+
+_CLOSED: Final[int] = 0
+_OPEN: Final[int] = 1
+_HALF_OPEN: Final[int] = 2
+_STATE_NAMES: Final[tuple[str, ...]] = ("closed", "open", "half_open")
+
+
+class _Breaker:
+    """The state machine and outcome ring buffer behind one circuit_breaker."""
+
+    __slots__ = (
+        "lock",
+        "state",
+        "ring",
+        "position",
+        "calls",
+        "failures",
+        "window",
+        "threshold",
+        "min_calls",
+        "reset_after",
+        "probes",
+        "probing",
+        "probe_successes",
+        "opened_at",
+        "clock",
+    )
+
+    def __init__(
+        self,
+        window: int,
+        failure_rate: float,
+        min_calls: int,
+        reset_after: float,
+        probes: int,
+        clock: Callable[[], float],
+    ) -> None:
+        self.lock = Lock()
+        self.state = _CLOSED
+        # One byte per outcome in the window: 1 for a Fail, 0 for an Ok.
+        self.ring = bytearray(window)
+        self.position = self.calls = self.failures = 0
+        self.window = window
+        self.threshold = failure_rate
+        self.min_calls = min_calls
+        self.reset_after = reset_after
+        self.probes = probes
+        self.probing = self.probe_successes = 0
+        self.opened_at = 0.0
+        self.clock = clock
+
+    def admit(self) -> bool | None:
+        """Return True for a probe call, False for a normal one, None to reject."""
+        with self.lock:
+            if self.state == _OPEN:
+                if self.clock() - self.opened_at < self.reset_after:
+                    return None
+                self.state = _HALF_OPEN
+                self.probing = self.probe_successes = 0
+            if self.state == _CLOSED:
+                return False
+            if self.probing < self.probes:
+                self.probing += 1
+                return True
+            return None
+
+    def record(self, failed: bool, probe: bool) -> None:
+        if probe:
+            self.record_probe(failed)
+            return
+        if not failed:
+            position = self.position
+            if not self.ring[position]:
+                # An Ok replacing an Ok changes neither the ring nor the
+                # failure count, so only the cursor moves, without the lock.
+                # A racing thread may skip or reuse a slot; the invariant
+                # failures == sum(ring) holds because only locked code
+                # writes either.
+                self.position = position + 1 if position + 1 < self.window else 0
+                if self.calls < self.window:
+                    self.calls += 1
+                return
+        # acquire/release rather than `with`: this runs after every call in
+        # the closed state, and the context manager protocol costs more than
+        # the update itself.
+        self.lock.acquire()
+        try:
+            if self.state != _CLOSED:
+                # Admitted before the circuit opened; the window is stale.
+                return
+            ring, position = self.ring, self.position
+            evicted = ring[position]
+            if failed or evicted:
+                ring[position] = failed
+                self.failures += failed - evicted
+            self.position = position + 1 if position + 1 < self.window else 0
+            if self.calls < self.window:
+                self.calls += 1
+            # Only a Fail can raise the rate.
+            if (
+                failed
+                and self.calls >= self.min_calls
+                and self.failures >= self.threshold * self.calls
+            ):
+                self.trip()
+        finally:
+            self.lock.release()
+
+    def record_probe(self, failed: bool) -> None:
+        with self.lock:
+            self.probing -= 1
+            if self.state != _HALF_OPEN:
+                return
+            if failed:
+                self.trip()
+            else:
+                self.probe_successes += 1
+                if self.probe_successes >= self.probes:
+                    self.close()
+
+    def abandon(self, probe: bool) -> None:
+        """Release the probe slot of a call cancelled before it finished."""
+        if probe:
+            with self.lock:
+                self.probing -= 1
+
+    def trip(self) -> None:
+        self.state = _OPEN
+        self.opened_at = self.clock()
+
+    def close(self) -> None:
+        self.state = _CLOSED
+        self.ring[:] = bytes(self.window)
+        self.position = self.calls = self.failures = 0
+
+    def reset(self) -> None:
+        with self.lock:
+            self.close()
+            self.probing = 0
+
+
+def circuit_breaker[S, F](
+    window: int = 100,
+    *,
+    failure_rate: float = 0.5,
+    min_calls: int = 20,
+    reset_after: float = 30.0,
+    half_open_probes: int = 1,
+    clock: Callable[[], float] = monotonic,
+) -> Callable[
+    [Callable[..., Either[S, F]]], Callable[..., Either[S, F | CircuitOpen]]
+]:
+    """
+    Stop calling a failing function for a while, returning a ready-made Fail instead.
+
+    Apply it on top of as_result. The outcomes of the last `window` calls are
+    kept in a ring buffer. Once at least `min_calls` are recorded and the
+    share of Fail among them reaches `failure_rate`, the circuit opens: for
+    `reset_after` seconds every call returns the same pre-built
+    Fail(CircuitOpen) without calling the function. After that the circuit
+    is half-open: up to `half_open_probes` calls go through as probes while
+    the others are still rejected. A failing probe opens the circuit again,
+    and once `half_open_probes` probes succeed it closes with an empty window.
+
+    An exception escaping the function counts as a Fail and propagates;
+    cancelling a coroutine call records no outcome.
+
+    Thread-safe. In the closed state an Ok takes no lock (it only advances
+    the ring cursor unless it evicts a Fail), and a Fail takes one short
+    locked update. The returned function gains
+    `circuit_state()` ("closed", "open" or "half_open") and `circuit_reset()`.
+
+    Example:
+        >>> @circuit_breaker(50, failure_rate=0.5, reset_after=10)
+        ... @as_result(OSError)
+        ... def fetch(url): ...
+
+    Args:
+        window (int, optional): How many recent outcomes are considered.
+            Defaults to 100.
+        failure_rate (float, optional): The Fail share, in (0, 1], that opens
+            the circuit. Defaults to 0.5.
+        min_calls (int, optional): Outcomes needed before the rate is
+            evaluated; at most `window`. Defaults to 20.
+        reset_after (float, optional): Seconds the circuit stays open before
+            probing. Defaults to 30.0.
+        half_open_probes (int, optional): Concurrent probe calls allowed, and
+            successes needed to close, while half-open. Defaults to 1.
+        clock (Callable[[], float], optional): The time source, in seconds.
+            Defaults to time.monotonic.
+
+    Raises:
+        ValueError: If a parameter is out of range.
+
+    Returns:
+        Callable[[Callable[..., Either[S, F]]], Callable[..., Either[S, F | CircuitOpen]]]:
+        The decorator.
+    """
+    if window < 1:
+        raise ValueError("window must be a positive integer.")
+    if not 0 < failure_rate <= 1:
+        raise ValueError("failure_rate must be in (0, 1].")
+    if not 1 <= min_calls <= window:
+        raise ValueError("min_calls must be between 1 and window.")
+    if reset_after < 0:
+        raise ValueError("reset_after must be non-negative.")
+    if half_open_probes < 1:
+        raise ValueError("half_open_probes must be a positive integer.")
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        breaker = _Breaker(
+            window, failure_rate, min_calls, reset_after, half_open_probes, clock
+        )
+        rejected = result_fail(CircuitOpen(getattr(func, "__qualname__", repr(func))))
+        admit, record = breaker.admit, breaker.record
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                probe = False
+                if breaker.state != _CLOSED:
+                    # Lock-free rejection while the open period lasts.
+                    if (
+                        breaker.state == _OPEN
+                        and clock() - breaker.opened_at < reset_after
+                    ):
+                        return rejected
+                    admitted = admit()
+                    if admitted is None:
+                        return rejected
+                    probe = admitted
+                try:
+                    result = await func(*args, **kwargs)
+                except CancelledError:
+                    # Cancellation says nothing about the dependency's health.
+                    breaker.abandon(probe)
+                    raise
+                except BaseException:
+                    record(True, probe)
+                    raise
+                record(not result._is_ok, probe)
+                return result
+
+            wrapper: Any = async_wrapper
+        else:
+
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                probe = False
+                if breaker.state != _CLOSED:
+                    # Lock-free rejection while the open period lasts.
+                    if (
+                        breaker.state == _OPEN
+                        and clock() - breaker.opened_at < reset_after
+                    ):
+                        return rejected
+                    admitted = admit()
+                    if admitted is None:
+                        return rejected
+                    probe = admitted
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException:
+                    record(True, probe)
+                    raise
+                record(not result._is_ok, probe)
+                return result
+
+        wrapper.circuit_state = lambda: _STATE_NAMES[breaker.state]
+        wrapper.circuit_reset = breaker.reset
+        return wrapper
+
+    return decorator
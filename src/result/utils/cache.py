@@ -0,0 +1,268 @@
+from asyncio import Future, ensure_future, shield
+from collections import OrderedDict
+from copy import copy
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Final, Hashable
+
+from result.base import Fail
+from result.types.base import Either
+from result.utils.helpers import _trace_entries
+
+# Separates positional from keyword arguments in a cache key.
+_KWARGS_MARK: Final = object()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """
+    A snapshot of a cached_result cache's counters.
+
+    Attributes:
+        hits (int): Calls answered from the cache.
+        misses (int): Calls that ran the function.
+        evictions (int): Entries dropped to respect maxsize.
+        expirations (int): Entries dropped because their TTL had passed.
+        coalesced (int): Async calls that awaited an identical call already
+            in flight instead of running the function.
+        size (int): Entries currently cached.
+        maxsize (int | None): The size bound, or None if unbounded.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    coalesced: int
+    size: int
+    maxsize: int | None
+
+
+class _Cache:
+    """The LRU store and counters behind one cached_result function."""
+
+    __slots__ = (
+        "entries",
+        "lock",
+        "maxsize",
+        "ok_ttl",
+        "fail_ttl",
+        "never_cache",
+        "clock",
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "coalesced",
+    )
+
+    def __init__(
+        self,
+        maxsize: int | None,
+        ok_ttl: float | None,
+        fail_ttl: float | None,
+        never_cache: tuple[type[BaseException], ...],
+        clock: Callable[[], float],
+    ) -> None:
+        # key -> (result, expiry time or None)
+        self.entries: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self.lock = Lock()
+        self.maxsize = maxsize
+        self.ok_ttl = ok_ttl
+        self.fail_ttl = fail_ttl
+        self.never_cache = never_cache
+        self.clock = clock
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self.coalesced = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the live cached result for `key`, or None (counting the miss)."""
+        entries = self.entries
+        entry = entries.get(key)
+        if entry is not None and (entry[1] is None or self.clock() < entry[1]):
+            # Lock-free: a lock costs more than the whole lookup. The reorder
+            # is a single atomic OrderedDict call, and the counter may
+            # undercount slightly under contention.
+            self.hits += 1
+            try:
+                entries.move_to_end(key)
+            except KeyError:
+                # Evicted by another thread since it was read.
+                pass
+            return entry[0]
+        self.miss(key)
+        return None
+
+    def miss(self, key: Hashable) -> None:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] is not None and self.clock() >= entry[1]:
+                del self.entries[key]
+                self.expirations += 1
+            self.misses += 1
+
+    def put(self, key: Hashable, result: Either[Any, Any]) -> None:
+        """Store `result` if the Ok/Fail policy allows it."""
+        ttl = self.ok_ttl if result._is_ok else self.fail_ttl
+        if ttl is not None and ttl <= 0:
+            return
+        if not result._is_ok:
+            error = result.value
+            if isinstance(error, self.never_cache):
+                return
+            if isinstance(error, BaseException) and error.__traceback__ is not None:
+                # A cached Fail outlives the call; store a copy holding a
+                # frame summary (see traceback_summary) instead of the frames,
+                # so the caller's exception keeps its traceback.
+                stored = _detach(error)
+                if stored is None:
+                    return
+                result = Fail(stored)
+        expires = None if ttl is None else self.clock() + ttl
+        with self.lock:
+            self.entries[key] = (result, expires)
+            self.entries.move_to_end(key)
+            if self.maxsize is not None and len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> CacheStats:
+        with self.lock:
+            return CacheStats(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.expirations,
+                self.coalesced,
+                len(self.entries),
+                self.maxsize,
+            )
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+def _detach[E: BaseException](error: E) -> E | None:
+    """Copy `error` without its traceback or chain, or return None if it cannot be copied."""
+    try:
+        stored = copy(error)
+        stored._result_trace = _trace_entries(error)  # type: ignore
+    except Exception:
+        return None
+    return stored
+
+
+def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    if not kwargs:
+        return args
+    return (*args, _KWARGS_MARK, *kwargs.items())
+
+
+def cached_result[S, F](
+    maxsize: int | None = 128,
+    *,
+    ok_ttl: float | None = None,
+    fail_ttl: float | None = 0,
+    never_cache: tuple[type[BaseException], ...] = (),
+    clock: Callable[[], float] = monotonic,
+) -> Callable[
+    [Callable[..., Either[S, F]]], Callable[..., Either[S, F]]
+]:
+    """
+    Memoise a function returning Ok/Fail, with separate policies for each variant.
+
+    Apply it on top of as_result. Arguments must be hashable. The returned
+    function gains `cache_stats()` and `cache_clear()`.
+
+    Sync functions are thread-safe, but concurrent identical calls may each
+    run the function. Cache hits take no lock, so the hit counter is
+    best-effort under heavy contention. Coroutine functions are coalesced: while a call is in
+    flight, identical calls await the same task (shielded, so one caller
+    being cancelled does not cancel it for the others).
+
+    A cached Fail never holds a live traceback: a copy of an exception error,
+    holding a frame summary readable with traceback_summary, is stored in
+    its place. The caller that ran the function still gets the original
+    exception with its traceback. Fails whose exception cannot be copied
+    are not cached.
+
+    Example:
+        >>> @cached_result(1024, ok_ttl=300, fail_ttl=5, never_cache=(TimeoutError,))
+        ... @as_result(LookupError, TimeoutError)
+        ... def lookup(user_id): ...
+
+    Args:
+        maxsize (int | None, optional): Maximum number of cached entries, least
+            recently used evicted first. None means unbounded. Defaults to 128.
+        ok_ttl (float | None, optional): Seconds an Ok stays cached; None means
+            until evicted. Defaults to None.
+        fail_ttl (float | None, optional): Seconds a Fail stays cached; None
+            means until evicted, 0 disables caching Fails. Defaults to 0.
+        never_cache (tuple[type[BaseException], ...], optional): Fails whose
+            error is an instance of one of these are never cached. Defaults
+            to ().
+        clock (Callable[[], float], optional): The time source for TTLs, in
+            seconds. Defaults to time.monotonic.
+
+    Raises:
+        ValueError: If `maxsize` is negative.
+
+    Returns:
+        Callable[[Callable[..., Either[S, F]]], Callable[..., Either[S, F]]]:
+        The decorator.
+    """
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("maxsize must be None or a non-negative integer.")
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache = _Cache(maxsize, ok_ttl, fail_ttl, never_cache, clock)
+
+        if iscoroutinefunction(func):
+            in_flight: dict[Hashable, Future[Any]] = {}
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = _make_key(args, kwargs)
+                result = cache.get(key)
+                if result is not None:
+                    return result
+                task = in_flight.get(key)
+                if task is not None:
+                    cache.coalesced += 1
+                    return await shield(task)
+                task = ensure_future(func(*args, **kwargs))
+                in_flight[key] = task
+
+                def settle(done: Future[Any]) -> None:
+                    del in_flight[key]
+                    if not done.cancelled() and done.exception() is None:
+                        cache.put(key, done.result())
+
+                task.add_done_callback(settle)
+                return await shield(task)
+
+            wrapper: Any = async_wrapper
+        else:
+
+            get, put = cache.get, cache.put
+
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                # _make_key(args, {}) is args; skip the call on the hot path.
+                key = _make_key(args, kwargs) if kwargs else args
+                result = get(key)
+                if result is not None:
+                    return result
+                result = func(*args, **kwargs)
+                put(key, result)
+                return result
+
+        wrapper.cache_stats = cache.stats
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,211 @@
+from inspect import iscoroutinefunction, isasyncgenfunction, isgeneratorfunction
+from time import perf_counter_ns
+from typing import Any, Callable, Iterable, Iterator
+
+from result.types.base import Either, TracebackCapture
+from result.utils.helpers import (
+    _TRACEBACK_RELEASE,
+    _as_result_spec,
+    result_fail,
+    result_ok,
+)
+
+# A compiled step: the callable to run, the exceptions it declared through
+# as_result (None for a step that returns Ok/Fail itself) and its traceback
+# release function.
+type _Step = tuple[Callable[[Any], Any], tuple[type[Exception], ...] | None, Any]
+
+
+class Pipeline:
+    """
+    A chain of Result-returning steps compiled into a single callable.
+
+    Build one with `pipeline`. Calling it threads the raw value from step to
+    step and only wraps the final value in Ok; the first Fail is returned
+    as-is and the remaining steps are skipped.
+
+    Steps decorated with (sync) `as_result` are fused: the pipeline calls the
+    undecorated function directly and catches that step's declared
+    exceptions itself, so no intermediate Ok is built. Any other step must
+    return an Ok/Fail.
+    """
+
+    __slots__ = (
+        "_steps",
+        "_names",
+        "_catch",
+        "_release",
+        "_timed",
+        "_totals",
+        "_calls",
+    )
+
+    def __init__(
+        self,
+        steps: tuple[_Step, ...],
+        names: tuple[str, ...],
+        catch: tuple[type[Exception], ...],
+        release: Callable[[Any], Any] | None,
+        timed: bool,
+    ) -> None:
+        self._steps = steps
+        self._names = names
+        self._catch = catch
+        self._release = release
+        self._timed = timed
+        self._totals = [0] * len(steps)
+        self._calls = [0] * len(steps)
+
+    def __call__(self, value: Any) -> Either[Any, Any]:
+        """
+        Run every step on `value`.
+
+        Args:
+            value (Any): The input to the first step.
+
+        Returns:
+            Either[Any, Any]: Ok(final_value), or the first Fail produced.
+        """
+        if self._timed:
+            return self._run_timed(value)
+        try:
+            for func, exceptions, release in self._steps:
+                if exceptions is None:
+                    result = func(value)
+                    if not result._is_ok:
+                        return result
+                    value = result.value
+                    continue
+                try:
+                    value = func(value)
+                except exceptions as exception:
+                    return result_fail(release(exception) if release else exception)
+        except self._catch as exception:
+            release = self._release
+            return result_fail(release(exception) if release else exception)
+        return result_ok(value)
+
+    def _run_timed(self, value: Any) -> Either[Any, Any]:
+        totals, calls = self._totals, self._calls
+        index = 0
+        try:
+            for index, (func, exceptions, release) in enumerate(self._steps):
+                started = perf_counter_ns()
+                try:
+                    if exceptions is None:
+                        result = func(value)
+                        if not result._is_ok:
+                            return result
+                        value = result.value
+                        continue
+                    try:
+                        value = func(value)
+                    except exceptions as exception:
+                        return result_fail(
+                            release(exception) if release else exception
+                        )
+                finally:
+                    totals[index] += perf_counter_ns() - started
+                    calls[index] += 1
+        except self._catch as exception:
+            release = self._release
+            return result_fail(release(exception) if release else exception)
+        return result_ok(value)
+
+    def batch(self, records: Iterable[Any]) -> Iterator[Either[Any, Any]]:
+        """
+        Lazily run the pipeline on every record.
+
+        Args:
+            records (Iterable[Any]): The inputs.
+
+        Returns:
+            Iterator[Either[Any, Any]]: One Ok/Fail per record, in order.
+        """
+        return map(self, records)
+
+    def timings(self) -> list[dict[str, Any]]:
+        """
+        Return per-step timing collected so far when built with `timed=True`.
+
+        Returns:
+            list[dict[str, Any]]: One entry per step with its "step" name, the
+            number of "calls" and the "total_ns" spent in it.
+        """
+        return [
+            {"step": name, "calls": calls, "total_ns": total}
+            for name, calls, total in zip(self._names, self._calls, self._totals)
+        ]
+
+    def __repr__(self) -> str:
+        """
+        Return a developer-friendly string representation of the Pipeline.
+
+        Returns:
+            str: The step names, in order.
+        """
+        return f"<Pipeline ({' -> '.join(self._names)})>"
+
+
+def pipeline(
+    *steps: Callable[[Any], Any],
+    catch: tuple[type[Exception], ...] = (),
+    capture: TracebackCapture = "full",
+    timed: bool = False,
+) -> Pipeline:
+    """
+    Compile Result-returning steps into one callable.
+
+    Example:
+        >>> parse = as_result(ValueError)(int)
+        >>> check = lambda n: Ok(n) if n > 0 else Fail("not positive")
+        >>> invert = as_result(ZeroDivisionError)(lambda n: 100 // n)
+        >>> run = pipeline(parse, check, invert)
+        >>> run("4")
+        <Ok (25)>
+        >>> list(run.batch(["4", "-1"]))
+        [<Ok (25)>, <Fail (not positive)>]
+
+    Args:
+        *steps (Callable[[Any], Any]): One-argument functions returning Ok/Fail,
+            typically decorated with as_result.
+        catch (tuple[type[Exception], ...], optional): Exceptions converted to
+            Fail if raised by any step, in addition to what each as_result
+            step already declares. Defaults to ().
+        capture (TracebackCapture, optional): Traceback policy for exceptions
+            caught through `catch`, as in as_result. Defaults to "full".
+        timed (bool, optional): Record per-step call counts and time, readable
+            with Pipeline.timings. Defaults to False.
+
+    Raises:
+        ValueError: If no steps are given or `capture` is unknown.
+        TypeError: If a step is an async or generator function.
+
+    Returns:
+        Pipeline: The compiled pipeline.
+    """
+    if not steps:
+        raise ValueError("At least one step must be provided to pipeline.")
+    if capture not in _TRACEBACK_RELEASE:
+        raise ValueError(f"Unknown traceback capture policy: {capture!r}")
+
+    compiled: list[_Step] = []
+    names: list[str] = []
+    for step in steps:
+        if (
+            iscoroutinefunction(step)
+            or isasyncgenfunction(step)
+            or isgeneratorfunction(step)
+        ):
+            raise TypeError(f"pipeline steps must be plain functions, got {step!r}")
+        spec = _as_result_spec(step)
+        if spec is not None:
+            func, exceptions, release = spec
+            compiled.append((func, exceptions, release))
+        else:
+            compiled.append((step, None, None))
+        names.append(getattr(step, "__qualname__", repr(step)))
+
+    return Pipeline(
+        tuple(compiled), tuple(names), catch, _TRACEBACK_RELEASE[capture], timed
+    )
@@ -0,0 +1,100 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import Context, ContextVar
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from typing import Any, Callable, Final, Iterator
+
+# The absolute time.monotonic() deadline of the current context, if any.
+_DEADLINE: Final[ContextVar[float | None]] = ContextVar(
+    "result_deadline", default=None
+)
+# True in the context of a deadline-aware sync call running on a worker.
+# Nested sync calls then run inline: the enclosing call already stops
+# waiting at its deadline, and waiting on a second worker from a worker
+# deadlocks once every worker is doing so.
+_ON_WORKER: Final[ContextVar[bool]] = ContextVar(
+    "result_deadline_worker", default=False
+)
+# Sync deadline-aware calls run here so the caller can stop waiting. Calls
+# that overrun are abandoned, not interrupted, and keep a worker until they
+# return. A call finding every worker taken is refused at once rather than
+# queued, where it would use up its budget without having run.
+_MAX_WORKERS: Final[int] = 32
+_free_workers = BoundedSemaphore(_MAX_WORKERS)
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = Lock()
+
+
+def _worker_pool() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    _MAX_WORKERS, thread_name_prefix="result_deadline"
+                )
+    return _executor
+
+
+def _release_worker(_: Future) -> None:
+    _free_workers.release()
+
+
+def _submit(
+    context: Context, func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Future | None:
+    """Run `func` on a free worker in `context`, or return None if none is free."""
+    if not _free_workers.acquire(blocking=False):
+        return None
+    try:
+        future = _worker_pool().submit(context.run, func, *args, **kwargs)
+    except BaseException:
+        _free_workers.release()
+        raise
+    # Also runs when the future is cancelled before it starts.
+    future.add_done_callback(_release_worker)
+    return future
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Set a deadline for the deadline-aware as_result calls made in this context.
+
+    Deadlines only tighten: inside an enclosing deadline that expires sooner,
+    the enclosing one stays in effect. The deadline follows the context, so
+    it reaches tasks created inside the block and the worker threads that
+    deadline-aware sync calls run on.
+
+    Example:
+        >>> with deadline(0.25):
+        ...     handle(request)   # nested as_result(..., timeout=...) calls share 250 ms
+
+    Args:
+        seconds (float): The budget from now, in seconds.
+
+    Yields:
+        Iterator[float]: The effective deadline, as a time.monotonic() value.
+    """
+    limit = monotonic() + seconds
+    current = _DEADLINE.get()
+    if current is not None and current < limit:
+        limit = current
+    token = _DEADLINE.set(limit)
+    try:
+        yield limit
+    finally:
+        _DEADLINE.reset(token)
+
+
+def time_remaining() -> float | None:
+    """
+    Return the seconds left before the current context's deadline.
+
+    Returns:
+        float | None: The remaining budget (negative once passed), or None if
+        no deadline is set.
+    """
+    limit = _DEADLINE.get()
+    return None if limit is None else limit - monotonic()
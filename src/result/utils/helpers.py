@@ -1,10 +1,46 @@
-from inspect import isclass
-from result.base import Ok as OkClass, Fail as FailClass, Result as ResultClass
-from result.types.base import Either, Ok, Fail, ResultCombine
-from result.guards import is_fail
-from typing import Sequence, Callable, Any, overload, Tuple, Unpack
+from inspect import (
+    isclass,
+    iscoroutinefunction,
+    isasyncgenfunction,
+    isgeneratorfunction,
+)
+from array import array
+from result.base import Ok as OkClass, Fail as FailClass, ErrorBatch, _RESULT_TYPES
+from result.types.base import (
+    Either,
+    Ok,
+    Fail,
+    ResultCombine,
+    TraceEntry,
+    TracebackCapture,
+)
+from sys import maxsize
+from time import perf_counter_ns
+from types import NoneType
+from typing import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Generator,
+    Callable,
+    Any,
+    Final,
+    Hashable,
+    overload,
+    Tuple,
+    Unpack,
+)
 from functools import wraps, partial
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from result.errors import DeadlineExceeded
+    from result.utils.histogram import ResultLatency
+
 
 def result_equality(result: object, otherResult: object) -> bool:
     """
@@ -27,21 +63,38 @@ def result_equality(result: object, otherResult: object) -> bool:
     """
 
     if (
-        isinstance(result, OkClass)
-        and isinstance(otherResult, OkClass)
-        or isinstance(result, FailClass)
-        and isinstance(otherResult, FailClass)
+        type(result) in _RESULT_TYPES
+        and type(otherResult) in _RESULT_TYPES
+        and result._is_ok is otherResult._is_ok  # type: ignore
     ):
-        return result.value == otherResult.value
+        return result.value == otherResult.value  # type: ignore
     return False
 
 
+# Canonical Ok instances for hot constant payloads, keyed by exact payload type
+# so that Ok(True) and Ok(1) stay distinct even though True == 1.
+_INTERNED_OK: Final[dict[type, dict[Any, Ok[Any]]]] = {
+    NoneType: {None: OkClass(None)},
+    bool: {False: OkClass(False), True: OkClass(True)},
+    int: {number: OkClass(number) for number in range(-5, 257)},
+    str: {"": OkClass("")},
+}
+_EMPTY_TUPLE_OK: Final[Ok[tuple[()]]] = OkClass(())
+
+# Opt-in registry of user-declared constant Fail sentinels, keyed the same way.
+_INTERNED_FAIL: dict[type, dict[Any, Fail[Any]]] = {}
+
+
 def result_ok[S](value: S = None) -> Ok[S]:
     """
     Create an Ok result containing the provided value.
 
     If no value is passed, the Ok result will contain None.
 
+    Ok results for None, booleans, small integers (-5 to 256), the empty
+    string and the empty tuple are interned: the same instance is returned
+    on every call, so building them does not allocate.
+
     Args:
         value (S | None, optional): The value to wrap in an Ok result.
             Defaults to None.
@@ -49,6 +102,15 @@ def result_ok[S](value: S = None) -> Ok[S]:
     Returns:
         Ok[S]: An Ok result containing the provided value.
     """
+    kind = type(value)
+    if kind is tuple:
+        # Tuples are not hashed here: large combined payloads would pay O(n).
+        return OkClass(value) if value else _EMPTY_TUPLE_OK  # type: ignore
+    interned = _INTERNED_OK.get(kind)
+    if interned is not None:
+        result = interned.get(value)
+        if result is not None:
+            return result
     return OkClass(value)
 
 
@@ -56,6 +118,9 @@ def result_fail[F](value: F) -> Fail[F]:
     """
     Create a Fail result containing the provided error value.
 
+    If the value was registered with `register_fail_sentinel`, the registered
+    instance is returned instead of a new Fail.
+
     Args:
         value (F): The error value to wrap in a Fail result.
 
@@ -64,9 +129,49 @@ def result_fail[F](value: F) -> Fail[F]:
     """
     if value is None:
         raise ValueError("Fail value must be a valid and not None")
+    interned = _INTERNED_FAIL.get(type(value))
+    if interned is not None:
+        try:
+            result = interned.get(value)
+        except TypeError:
+            # e.g. a tuple holding unhashable items; such values are never sentinels.
+            result = None
+        if result is not None:
+            return result
     return FailClass(value)
 
 
+def register_fail_sentinel[F: Hashable](value: F) -> Fail[F]:
+    """
+    Register a constant error value so result_fail returns a shared instance.
+
+    Registering the same value twice returns the instance created the first
+    time, so sentinels can be declared at module level in several places.
+
+    Example:
+        >>> NOT_FOUND = register_fail_sentinel("not_found")
+        >>> result_fail("not_found") is NOT_FOUND
+        True
+
+    Args:
+        value (F): A hashable, immutable error value.
+
+    Raises:
+        ValueError: If `value` is None.
+        TypeError: If `value` is not hashable.
+
+    Returns:
+        Fail[F]: The canonical Fail instance for `value`.
+    """
+    if value is None:
+        raise ValueError("Fail value must be a valid and not None")
+    interned = _INTERNED_FAIL.setdefault(type(value), {})
+    result = interned.get(value)
+    if result is None:
+        result = interned[value] = FailClass(value)
+    return result
+
+
 @overload
 def result_combine[S1, F](
     results: Tuple[Either[S1, F]],
@@ -111,35 +216,196 @@ def result_combine[S, F](
 
 @overload
 def result_combine[*T, F](
-    results: Sequence[Either[T, F]],
+    results: Iterable[Either[T, F]],
 ) -> ResultCombine[Tuple[Unpack[T]], F]: ...
 
 
 def result_combine(results):
     """
-    Combine a sequence of Result objects into a single Result.
+    Combine an iterable of Result objects into a single Result.
 
     Behavior:
-    - If all results are Ok, returns Ok([...]) containing all Ok values in order.
-    - If any result is Fail, returns Fail(error) using the first Fail encountered.
+    - If all results are Ok, returns Ok((...)) containing all Ok values in order.
+    - If any result is Fail, returns the first Fail encountered.
+
+    The input is consumed lazily, so a generator is not pulled from any
+    further once a Fail has been seen.
 
     Args:
-        results (Sequence[Either[S, F]]): A sequence of Ok/Fail results.
+        results (Iterable[Either[S, F]]): An iterable of Ok/Fail results.
 
     Returns:
-        Ok[List[S | None]] | Fail[F]:
-            - Ok(list_of_values) if all are Ok
+        Ok[Tuple[S, ...]] | Fail[F]:
+            - Ok(tuple_of_values) if all are Ok
             - Fail(error) if any Fail is found
     """
     validResults = []
+    append = validResults.append
 
     for result in results:
-        if is_fail(result):
-            return result_fail(result.value)
-        validResults.append(result.value)
+        if not result._is_ok:
+            return result
+        append(result.value)
     return result_ok(tuple(validResults))
 
 
+def result_combine_iter[S, F](
+    results: Iterable[Either[S, F]],
+) -> Generator[S, None, Fail[F] | None]:
+    """
+    Lazily yield the values of Ok results until the first Fail.
+
+    Unlike result_combine, no tuple of values is built, so memory stays
+    constant however long the input is. The first Fail stops iteration and
+    becomes the generator's return value, which `yield from` hands back.
+
+    Example:
+        >>> def consume(results):
+        ...     failure = yield from result_combine_iter(results)
+        ...     if failure is not None:
+        ...         ...  # handle the Fail
+
+    Args:
+        results (Iterable[Either[S, F]]): An iterable of Ok/Fail results.
+
+    Yields:
+        S: Each Ok value, in order.
+
+    Returns:
+        Fail[F] | None: The first Fail encountered, or None if all were Ok.
+    """
+    for result in results:
+        if not result._is_ok:
+            return result  # type: ignore
+        yield result.value
+    return None
+
+
+def result_combine_chunked[S, F](
+    results: Iterable[Either[S, F]], size: int
+) -> Iterator[Either[Tuple[S, ...], F]]:
+    """
+    Combine results into Ok batches of at most `size` values.
+
+    Each full batch is yielded as Ok(tuple_of_values) as soon as it is
+    complete, followed by a final partial batch. If a Fail is encountered,
+    the values collected for the current batch are dropped, the Fail is
+    yielded and the input is not consumed any further. Only one batch is
+    held in memory at a time.
+
+    Args:
+        results (Iterable[Either[S, F]]): An iterable of Ok/Fail results.
+        size (int): The maximum number of values per batch.
+
+    Raises:
+        ValueError: If `size` is smaller than 1, when called rather than on
+            the first next().
+
+    Returns:
+        Iterator[Ok[Tuple[S, ...]] | Fail[F]]: Ok batches, then possibly a
+        single Fail.
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    return _combine_chunked(results, size)
+
+
+def _combine_chunked[S, F](
+    results: Iterable[Either[S, F]], size: int
+) -> Iterator[Either[Tuple[S, ...], F]]:
+    chunk: list[S] = []
+    append = chunk.append
+
+    for result in results:
+        if not result._is_ok:
+            yield result  # type: ignore
+            return
+        append(result.value)
+        if len(chunk) == size:
+            yield result_ok(tuple(chunk))
+            chunk.clear()
+    if chunk:
+        yield result_ok(tuple(chunk))
+
+
+def _collect(
+    results: Iterable[Either[Any, Any]], max_errors: int | None, keep_values: bool
+) -> tuple[list[Any], ErrorBatch[Any]]:
+    if max_errors is not None and max_errors < 0:
+        raise ValueError("max_errors must be None or a non-negative integer.")
+    values: list[Any] = []
+    errors: list[Any] = []
+    indices = array("Q")
+    append_value, append_error, append_index = (
+        values.append,
+        errors.append,
+        indices.append,
+    )
+    cap = maxsize if max_errors is None else max_errors
+    total = 0
+
+    for index, result in enumerate(results):
+        if result._is_ok:
+            if keep_values or not total:
+                append_value(result.value)
+        else:
+            if total < cap:
+                append_error(result.value)
+                append_index(index)
+            total += 1
+    return values, ErrorBatch(tuple(errors), indices, total)
+
+
+def result_combine_all[S, F](
+    results: Iterable[Either[S, F]], max_errors: int | None = None
+) -> Either[Tuple[S, ...], ErrorBatch[F]]:
+    """
+    Combine results in one pass, collecting every Fail instead of the first.
+
+    Behavior:
+    - If all results are Ok, returns Ok(tuple_of_values), like result_combine.
+    - Otherwise returns Fail(ErrorBatch) holding the errors in input order and
+      their positions. Ok values stop being collected after the first Fail.
+
+    Args:
+        results (Iterable[Either[S, F]]): An iterable of Ok/Fail results.
+        max_errors (int | None, optional): Keep at most this many errors; the
+            rest are only counted in ErrorBatch.total. Defaults to None (keep all).
+
+    Raises:
+        ValueError: If `max_errors` is negative.
+
+    Returns:
+        Ok[Tuple[S, ...]] | Fail[ErrorBatch[F]]: All values, or all errors.
+    """
+    values, batch = _collect(results, max_errors, keep_values=False)
+    if batch.total:
+        return FailClass(batch)
+    return result_ok(tuple(values))
+
+
+def result_partition[S, F](
+    results: Iterable[Either[S, F]], max_errors: int | None = None
+) -> tuple[Tuple[S, ...], ErrorBatch[F]]:
+    """
+    Split results in one pass into their Ok values and an ErrorBatch of errors.
+
+    Args:
+        results (Iterable[Either[S, F]]): An iterable of Ok/Fail results.
+        max_errors (int | None, optional): Keep at most this many errors; the
+            rest are only counted in ErrorBatch.total. Defaults to None (keep all).
+
+    Raises:
+        ValueError: If `max_errors` is negative.
+
+    Returns:
+        tuple[Tuple[S, ...], ErrorBatch[F]]: Every Ok value in input order, and
+        the collected errors with their positions.
+    """
+    values, batch = _collect(results, max_errors, keep_values=True)
+    return tuple(values), batch
+
+
 def value_or[T, K](result: Either[T, T], default: K) -> T | K:
     """
     Return the contained value from an Ok result, or a default value if Fail.
@@ -159,9 +425,9 @@ def value_or[T, K](result: Either[T, T], default: K) -> T | K:
             - Ok.value if the result is Ok
             - default if the result is Fail
     """
-    if not isinstance(result, ResultClass):
+    if type(result) not in _RESULT_TYPES:
         raise TypeError(f"Expected Result (Ok/Fail), got {repr(result)}")
-    if not is_fail(result):
+    if result._is_ok:
         return result.value
     return default
 
@@ -183,13 +449,382 @@ def unwrap_or[T, E](result: T, default: E) -> T | E:
             - result.value if result is an Ok/Fail instance
             - default otherwise
     """
-    if isinstance(result, ResultClass):
+    if type(result) in _RESULT_TYPES:
         return result.value
     return default
 
 
+def _release_chain(exception: BaseException) -> None:
+    """Drop the tracebacks of an exception and of every exception chained to it."""
+    seen: set[int] = set()
+    pending: list[BaseException | None] = [exception]
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        current.__traceback__ = None
+        pending.append(current.__cause__)
+        pending.append(current.__context__)
+
+
+def _drop_traceback[T: BaseException](exception: T) -> T:
+    _release_chain(exception)
+    return exception
+
+
+def _trace_entries(exception: BaseException) -> tuple[TraceEntry, ...]:
+    """Summarise the traceback of an exception caught by an as_result wrapper."""
+    frames: list[TraceEntry] = []
+    # The first entry is the as_result wrapper itself, which is not useful.
+    tb = exception.__traceback__
+    tb = tb.tb_next if tb is not None else None
+    while tb is not None:
+        code = tb.tb_frame.f_code
+        frames.append((code.co_filename, tb.tb_lineno, code.co_name))
+        tb = tb.tb_next
+    return tuple(frames)
+
+
+def _summarise_traceback[T: BaseException](exception: T) -> T:
+    frames = _trace_entries(exception)
+    _release_chain(exception)
+    exception._result_trace = frames  # type: ignore
+    return exception
+
+
+_TRACEBACK_RELEASE: Final[dict[str, Callable[[Any], Any] | None]] = {
+    "full": None,
+    "summary": _summarise_traceback,
+    "none": _drop_traceback,
+}
+
+
+def traceback_summary(
+    error: BaseException,
+) -> tuple[TraceEntry, ...] | None:
+    """
+    Return the compact traceback recorded by as_result(..., capture="summary").
+
+    Args:
+        error (BaseException): The exception held by a Fail result.
+
+    Returns:
+        tuple[TraceEntry, ...] | None: One (filename, line, function) entry per
+        frame, innermost last, or None if no summary was recorded.
+    """
+    return getattr(error, "_result_trace", None)
+
+
+def _wrap_function[S, T: Exception](
+    func: Callable[..., S],
+    exceptions: tuple[type[T], ...],
+    release: Callable[[T], T] | None,
+) -> Callable[..., Either[S, T]]:
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Either[S, T]:
+        try:
+            return result_ok(func(*args, **kwargs))
+        except exceptions as exception:
+            if release is not None:
+                return result_fail(release(exception))  # type: ignore
+            return result_fail(exception)  # type: ignore
+
+    # Lets pipeline() call func directly and skip the intermediate Ok. Read
+    # it through _as_result_spec: functools.wraps copies it onto outer
+    # decorators, which must not be bypassed.
+    wrapper._as_result = (func, exceptions, release)  # type: ignore
+    return wrapper
+
+
+def _as_result_spec(
+    func: Callable[..., Any],
+) -> tuple[Callable[..., Any], tuple[type[Exception], ...], Any] | None:
+    """
+    Return (func, exceptions, release) if `func` is itself an as_result wrapper.
+
+    A decorator stacked on top with functools.wraps inherits the marker, but
+    its `__wrapped__` is the as_result wrapper rather than the raw function,
+    so it is not mistaken for one.
+    """
+    spec = getattr(func, "_as_result", None)
+    if spec is not None and getattr(func, "__wrapped__", None) is spec[0]:
+        return spec
+    return None
+
+
+def _wrap_coroutine_function[S, T: Exception](
+    func: Callable[..., Awaitable[S]],
+    exceptions: tuple[type[T], ...],
+    release: Callable[[T], T] | None,
+) -> Callable[..., Coroutine[Any, Any, Either[S, T]]]:
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Either[S, T]:
+        try:
+            return result_ok(await func(*args, **kwargs))
+        except exceptions as exception:
+            if release is not None:
+                return result_fail(release(exception))  # type: ignore
+            return result_fail(exception)  # type: ignore
+
+    return wrapper
+
+
+def _wrap_generator_function[S, T: Exception](
+    func: Callable[..., Iterable[S]],
+    exceptions: tuple[type[T], ...],
+    release: Callable[[T], T] | None,
+) -> Callable[..., Iterator[Either[S, T]]]:
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Generator[Either[S, T], Any, Any]:
+        # A manual loop rather than `for`, so send(), throw() and close() reach
+        # the inner generator and its return value is passed on.
+        generator = func(*args, **kwargs)
+        try:
+            item = next(generator)  # type: ignore
+            while True:
+                try:
+                    sent = yield result_ok(item)
+                except GeneratorExit:
+                    generator.close()  # type: ignore
+                    raise
+                except BaseException as thrown:
+                    item = generator.throw(thrown)  # type: ignore
+                else:
+                    item = generator.send(sent)  # type: ignore
+        except StopIteration as stop:
+            return stop.value
+        except exceptions as exception:
+            if release is not None:
+                exception = release(exception)
+            yield result_fail(exception)  # type: ignore
+
+    return wrapper
+
+
+def _wrap_async_generator_function[S, T: Exception](
+    func: Callable[..., AsyncIterable[S]],
+    exceptions: tuple[type[T], ...],
+    release: Callable[[T], T] | None,
+) -> Callable[..., AsyncIterator[Either[S, T]]]:
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> AsyncGenerator[Either[S, T], Any]:
+        # As in _wrap_generator_function: forward asend(), athrow() and aclose().
+        generator = func(*args, **kwargs)
+        try:
+            item = await anext(generator)  # type: ignore
+            while True:
+                try:
+                    sent = yield result_ok(item)
+                except GeneratorExit:
+                    await generator.aclose()  # type: ignore
+                    raise
+                except BaseException as thrown:
+                    item = await generator.athrow(thrown)  # type: ignore
+                else:
+                    item = await generator.asend(sent)  # type: ignore
+        except StopAsyncIteration:
+            return
+        except exceptions as exception:
+            if release is not None:
+                exception = release(exception)
+            yield result_fail(exception)  # type: ignore
+
+    return wrapper
+
+
+def _wrap_timed_function[S, T: Exception](
+    func: Callable[..., S],
+    exceptions: tuple[type[T], ...],
+    release: Callable[[T], T] | None,
+    latency: "ResultLatency",
+) -> Callable[..., Either[S, T]]:
+    record_ok, record_fail = latency.ok.record, latency.fail.record
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Either[S, T]:
+        started = perf_counter_ns()
+        try:
+            value = func(*args, **kwargs)
+        except exceptions as exception:
+            record_fail(perf_counter_ns() - started)
+            if release is not None:
+                return result_fail(release(exception))  # type: ignore
+            return result_fail(exception)  # type: ignore
+        record_ok(perf_counter_ns() - started)
+        return result_ok(value)
+
+    # No _as_result marker: pipeline() must call through the timing wrapper.
+    wrapper.latency = latency  # type: ignore
+    return wrapper
+
+
+def _wrap_timed_coroutine_function[S, T: Exception](
+    func: Callable[..., Awaitable[S]],
+    exceptions: tuple[type[T], ...],
+    release: Callable[[T], T] | None,
+    latency: "ResultLatency",
+) -> Callable[..., Coroutine[Any, Any, Either[S, T]]]:
+    record_ok, record_fail = latency.ok.record, latency.fail.record
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Either[S, T]:
+        started = perf_counter_ns()
+        try:
+            value = await func(*args, **kwargs)
+        except exceptions as exception:
+            record_fail(perf_counter_ns() - started)
+            if release is not None:
+                return result_fail(release(exception))  # type: ignore
+            return result_fail(exception)  # type: ignore
+        record_ok(perf_counter_ns() - started)
+        return result_ok(value)
+
+    wrapper.latency = latency  # type: ignore
+    return wrapper
+
+
+def _wrap_deadline_function[S, T: Exception](
+    func: Callable[..., S],
+    exceptions: tuple[type[T], ...],
+    release: Callable[[T], T] | None,
+    timeout: float | None,
+) -> Callable[..., Either[S, T | "DeadlineExceeded"]]:
+    from concurrent.futures import wait
+    from contextvars import copy_context
+    from time import monotonic
+
+    from result.errors import DeadlineExceeded, DeadlineWorkersBusy
+    from result.utils.deadlines import _DEADLINE, _ON_WORKER, _submit
+
+    name = getattr(func, "__qualname__", repr(func))
+    current_deadline, set_deadline = _DEADLINE.get, _DEADLINE.set
+    on_worker, set_on_worker = _ON_WORKER.get, _ON_WORKER.set
+
+    def enter_worker(limit: float) -> None:
+        set_deadline(limit)
+        set_on_worker(True)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Either[S, T | DeadlineExceeded]:
+        limit = current_deadline()
+        if timeout is not None:
+            own = monotonic() + timeout
+            if limit is None or own < limit:
+                limit = own
+        if limit is None:
+            try:
+                value = func(*args, **kwargs)
+            except exceptions as exception:
+                if release is not None:
+                    return result_fail(release(exception))  # type: ignore
+                return result_fail(exception)  # type: ignore
+            return result_ok(value)
+        remaining = limit - monotonic()
+        if remaining <= 0:
+            # A new error per expiry: a shared one would gather the
+            # traceback and context of wherever a caller raised it.
+            return result_fail(DeadlineExceeded(name))  # type: ignore
+        if on_worker():
+            # Nested in a call already on a worker: run here, under the
+            # tighter deadline, and let the enclosing call do the abandoning.
+            token = set_deadline(limit)
+            try:
+                value = func(*args, **kwargs)
+            except exceptions as exception:
+                if release is not None:
+                    return result_fail(release(exception))  # type: ignore
+                return result_fail(exception)  # type: ignore
+            finally:
+                _DEADLINE.reset(token)
+            return result_ok(value)
+        # Run in a copy of the caller's context carrying the deadline, so
+        # nested deadline-aware calls inherit what is left of it.
+        context = copy_context()
+        context.run(enter_worker, limit)
+        future = _submit(context, func, *args, **kwargs)
+        if future is None:
+            return result_fail(DeadlineWorkersBusy(name))  # type: ignore
+        # Branch on the wait's outcome rather than on a TimeoutError from
+        # future.result(timeout): that cannot be told apart from one raised
+        # by func, and the call may complete between the two.
+        if not wait((future,), remaining).done:
+            future.cancel()
+            return result_fail(DeadlineExceeded(name))  # type: ignore
+        try:
+            value = future.result()
+        except exceptions as exception:
+            if release is not None:
+                return result_fail(release(exception))  # type: ignore
+            return result_fail(exception)  # type: ignore
+        return result_ok(value)
+
+    return wrapper
+
+
+def _wrap_deadline_coroutine_function[S, T: Exception](
+    func: Callable[..., Awaitable[S]],
+    exceptions: tuple[type[T], ...],
+    release: Callable[[T], T] | None,
+    timeout: float | None,
+) -> Callable[..., Coroutine[Any, Any, Either[S, T | "DeadlineExceeded"]]]:
+    from asyncio import timeout as timeout_scope
+    from time import monotonic
+
+    from result.errors import DeadlineExceeded
+    from result.utils.deadlines import _DEADLINE
+
+    name = getattr(func, "__qualname__", repr(func))
+    current_deadline, set_deadline = _DEADLINE.get, _DEADLINE.set
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Either[S, T | DeadlineExceeded]:
+        limit = current_deadline()
+        if timeout is not None:
+            own = monotonic() + timeout
+            if limit is None or own < limit:
+                limit = own
+        if limit is None:
+            try:
+                value = await func(*args, **kwargs)
+            except exceptions as exception:
+                if release is not None:
+                    return result_fail(release(exception))  # type: ignore
+                return result_fail(exception)  # type: ignore
+            return result_ok(value)
+        remaining = limit - monotonic()
+        if remaining <= 0:
+            # A new error per expiry, as in _wrap_deadline_function.
+            return result_fail(DeadlineExceeded(name))  # type: ignore
+        token = set_deadline(limit)
+        scope = timeout_scope(remaining)
+        try:
+            async with scope:
+                value = await func(*args, **kwargs)
+        except exceptions as exception:
+            # `exceptions` may include TimeoutError, which the scope raises.
+            if scope.expired():
+                return result_fail(DeadlineExceeded(name))  # type: ignore
+            if release is not None:
+                return result_fail(release(exception))  # type: ignore
+            return result_fail(exception)  # type: ignore
+        except TimeoutError:
+            if scope.expired():
+                return result_fail(DeadlineExceeded(name))  # type: ignore
+            raise
+        finally:
+            _DEADLINE.reset(token)
+        return result_ok(value)
+
+    return wrapper
+
+
 def as_result[S, T: Exception](
     *exceptions: type[T],
+    capture: TracebackCapture = "full",
+    timed: bool = False,
+    timeout: float | None = None,
+    deadline: bool = False,
 ) -> Callable[[Callable[..., S]], Callable[..., Either[S, T]]]:
     """
     Decorator to convert exceptions into Fail results.
@@ -198,6 +833,46 @@ def as_result[S, T: Exception](
     into Fail results. If the function executes successfully, its return value is
     wrapped in an Ok result.
 
+    The kind of the decorated function is detected once, at decoration time,
+    and a native wrapper of the same kind is returned:
+    - `async def` functions give a coroutine function returning Ok/Fail.
+    - generator functions give a generator yielding Ok(item) for each item,
+      and a final Fail(exception) if the generator raises. send(), throw()
+      and close() are forwarded to the wrapped generator, and its return
+      value becomes the wrapper's.
+    - async generator functions give an async generator with the same shape,
+      forwarding asend(), athrow() and aclose().
+
+    A caught exception normally keeps its `__traceback__`, which keeps every
+    frame and local variable of the failing call alive for as long as the
+    Fail is held. `capture` controls what is kept instead:
+    - "full" keeps the traceback untouched (the default).
+    - "summary" keeps a precomputed (filename, line, function) entry per
+      frame, readable with `traceback_summary`, and drops the traceback.
+    - "none" drops the traceback.
+    With "summary" and "none", the tracebacks of chained exceptions
+    (`__cause__` / `__context__`) are dropped too.
+
+    With `timed=True` (functions and coroutine functions only), the wall time
+    of every call is recorded into fixed-size Ok and Fail latency histograms,
+    exposed as `wrapper.latency` (a ResultLatency): `wrapper.latency.snapshot()`
+    gives p50/p99/p999 per outcome.
+
+    With `timeout=` or `deadline=True` (functions and coroutine functions
+    only), the call is bounded by the sooner of its own `timeout` and the
+    deadline of the current context (see `result.utils.deadlines`). Past that
+    point the result is Fail(DeadlineExceeded), a TimeoutError subclass:
+    - coroutine functions are cancelled at the deadline.
+    - sync functions run on a worker thread; the caller stops waiting at the
+      deadline, and the abandoned call finishes in the background. When
+      every worker is taken (abandoned calls hold theirs until they return),
+      the call is not run and the result is Fail(DeadlineWorkersBusy).
+      Nested deadline-aware sync calls run inline on the enclosing call's
+      worker, so they never wait on the pool.
+    - a call made when the budget is already spent returns the Fail without
+      running. Nested deadline-aware calls see the remaining budget.
+    Without any deadline in effect, a `deadline=True` function runs inline.
+
     Type Parameters:
         ExcT: The exception type(s) to catch. Must be a subclass of Exception.
         S: The return type of the decorated function.
@@ -205,6 +880,13 @@ def as_result[S, T: Exception](
     Args:
         *exceptions: One or more exception types to catch and convert to Fail.
                     All must be subclasses of Exception.
+        capture: How much of the traceback of a caught exception to keep:
+                    "full", "summary" or "none". Defaults to "full".
+        timed: Record per-call latency histograms. Defaults to False.
+        timeout: Seconds each call may take, also capping the deadline seen by
+                    nested calls. Defaults to None.
+        deadline: Honour the context deadline without a timeout of its own.
+                    Implied by `timeout`. Defaults to False.
 
     Returns:
         A decorator that transforms a function with return type S to return Either[S, ExcT].
@@ -216,24 +898,178 @@ def as_result[S, T: Exception](
         ...
         >>> result = parse_int("123")  # Ok[int]
         >>> error = parse_int("abc")   # Fail[ValueError]
+        >>>
+        >>> @as_result(OSError)
+        ... async def fetch(url: str) -> bytes: ...
+        ...
+        >>> result = await fetch(url)  # Ok[bytes] | Fail[OSError]
     """
     if not exceptions or not all(
         isclass(exception) and issubclass(exception, Exception)
         for exception in exceptions
     ):
         raise ValueError("At least one exception type must be provided to as_result.")
+    if capture not in _TRACEBACK_RELEASE:
+        raise ValueError(f"Unknown traceback capture policy: {capture!r}")
+    release = _TRACEBACK_RELEASE[capture]
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout must be None or positive.")
+    bounded = deadline or timeout is not None
+    if bounded and timed:
+        raise ValueError("timed cannot be combined with timeout or deadline.")
 
     def decorator(func: Callable[..., S]) -> Callable[..., Either[S, T]]:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Either[S, T]:
-            try:
-                return result_ok(func(*args, **kwargs))
-            except exceptions as exception:
-                return result_fail(exception)  # type: ignore
+        if bounded:
+            if iscoroutinefunction(func):
+                return _wrap_deadline_coroutine_function(
+                    func, exceptions, release, timeout  # type: ignore
+                )
+            if isasyncgenfunction(func) or isgeneratorfunction(func):
+                raise TypeError("Deadlines are not supported on generator functions.")
+            return _wrap_deadline_function(func, exceptions, release, timeout)
+        if timed:
+            from result.utils.histogram import ResultLatency
 
-        return wrapper
+            if iscoroutinefunction(func):
+                return _wrap_timed_coroutine_function(
+                    func, exceptions, release, ResultLatency()  # type: ignore
+                )
+            if isasyncgenfunction(func) or isgeneratorfunction(func):
+                raise TypeError("timed=True is not supported on generator functions.")
+            return _wrap_timed_function(func, exceptions, release, ResultLatency())
+        if iscoroutinefunction(func):
+            return _wrap_coroutine_function(func, exceptions, release)  # type: ignore
+        if isasyncgenfunction(func):
+            return _wrap_async_generator_function(func, exceptions, release)  # type: ignore
+        if isgeneratorfunction(func):
+            return _wrap_generator_function(func, exceptions, release)  # type: ignore
+        return _wrap_function(func, exceptions, release)
 
     return decorator
 
 
 as_result_all = partial(as_result, Exception)
+
+
+def result_do[S, F](
+    func: Callable[..., Generator[Either[Any, F], Any, S]],
+) -> Callable[..., Either[S, F]]:
+    """
+    Decorator for generator-based do-notation over Results.
+
+    Inside the decorated generator, `yield result` hands back the value of
+    an Ok, so dependent steps read like straight-line code. The first Fail
+    yielded stops the generator (running its `finally` blocks) and is
+    returned as-is. The generator's `return` value is wrapped in Ok.
+
+    The body is not run as a generator: at decoration time it is recompiled
+    from source into the early-return chain one would write by hand, each
+    `x = yield r` becoming `if not r._is_ok: return r` followed by
+    `x = r.value`, so a call costs no more than that chain (see
+    benchmarks/bench_result_do.py). Bodies that cannot be rewritten exactly
+    (no source, a `yield` nested in an expression, or inside a `with` block
+    or a handler that would see GeneratorExit) are driven as a generator,
+    which is slower but behaves the same.
+
+    Example:
+        >>> @result_do
+        ... def total(order_id: str):
+        ...     order = yield load_order(order_id)      # Ok[Order] | Fail[str]
+        ...     price = yield price_of(order)          # Ok[int] | Fail[str]
+        ...     return price * order.quantity
+        ...
+        >>> total("42")  # Ok(...) or the first Fail
+
+    Args:
+        func (Callable[..., Generator]): A generator function yielding Ok/Fail.
+
+    Raises:
+        TypeError: If `func` is not a generator function.
+
+    Returns:
+        Callable[..., Either[S, F]]: A function returning Ok(return_value) or
+        the first Fail.
+    """
+    if not isgeneratorfunction(func):
+        raise TypeError(f"result_do expects a generator function, got {func!r}")
+    from result.utils._do import compile_do
+
+    rebuilt = compile_do(func, is_async=False)
+    if rebuilt is not None:
+        return wraps(func)(rebuilt)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Either[S, F]:
+        generator = func(*args, **kwargs)
+        send = generator.send
+        try:
+            result = next(generator)
+            while result._is_ok:
+                result = send(result.value)
+        except StopIteration as stop:
+            return result_ok(stop.value)
+        generator.close()
+        return result
+
+    return wrapper
+
+
+def result_do_async[S, F](
+    func: Callable[..., AsyncGenerator[Either[Any, F], Any]],
+) -> Callable[..., Coroutine[Any, Any, Either[S, F]]]:
+    """
+    Decorator for do-notation in asyncio code, the async flavour of result_do.
+
+    Async generators cannot `return` a value, so the outcome is the last
+    result yielded: end the body with `yield Ok(value)`. As with result_do,
+    each `yield result` receives the Ok value and the first Fail stops the
+    generator and is returned. A body that yields nothing gives Ok(None).
+    Like result_do, the body is recompiled into a coroutine function with
+    early returns where possible, so no `asend` is paid per step.
+
+    Example:
+        >>> @result_do_async
+        ... async def profile(user_id: str):
+        ...     user = yield await fetch_user(user_id)
+        ...     avatar = yield await fetch_avatar(user)
+        ...     yield Ok((user, avatar))
+        ...
+        >>> await profile("42")  # Ok((user, avatar)) or the first Fail
+
+    Args:
+        func (Callable[..., AsyncGenerator]): An async generator function
+            yielding Ok/Fail.
+
+    Raises:
+        TypeError: If `func` is not an async generator function.
+
+    Returns:
+        Callable[..., Coroutine[Any, Any, Either[S, F]]]: A coroutine function
+        returning the last yielded Ok or the first Fail.
+    """
+    if not isasyncgenfunction(func):
+        raise TypeError(
+            f"result_do_async expects an async generator function, got {func!r}"
+        )
+    from result.utils._do import compile_do
+
+    rebuilt = compile_do(func, is_async=True)
+    if rebuilt is not None:
+        return wraps(func)(rebuilt)
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Either[S, F]:
+        generator = func(*args, **kwargs)
+        asend = generator.asend
+        last: Either[Any, F] = result_ok()
+        try:
+            result = await asend(None)
+            while result._is_ok:
+                last = result
+                result = await asend(result.value)
+        except StopAsyncIteration:
+            return last
+        await generator.aclose()
+        return result
+
+    return wrapper
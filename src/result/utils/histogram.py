@@ -0,0 +1,200 @@
+from array import array
+from dataclasses import dataclass
+from typing import Any, Final
+
+# Log-linear bucketing, as in HDR histograms: values below 2**(_SUB_BITS + 1)
+# get one bucket each, and every further power of two is split into
+# 2**_SUB_BITS equal buckets, bounding the relative error at 1/32 (~3%).
+_SUB_BITS: Final[int] = 5
+_LINEAR_LIMIT_BITS: Final[int] = _SUB_BITS + 1
+# Latencies are clamped to 2**36 ns (about 69 seconds).
+_MAX_BITS: Final[int] = 36
+_BUCKETS: Final[int] = ((_MAX_BITS - _LINEAR_LIMIT_BITS + 1) << _SUB_BITS) + (
+    1 << _SUB_BITS
+)
+# Latencies below this many nanoseconds (about 33 µs) take their bucket from
+# _LOOKUP instead of computing it.
+_LOOKUP_LIMIT: Final[int] = 1 << 15
+
+
+def _bucket_index(nanoseconds: int) -> int:
+    """Return the bucket counting `nanoseconds`, clamped to the histogram's range."""
+    shift = nanoseconds.bit_length() - _LINEAR_LIMIT_BITS
+    if shift <= 0:
+        return nanoseconds if nanoseconds > 0 else 0
+    index = (shift << _SUB_BITS) + (nanoseconds >> shift)
+    return index if index < _BUCKETS else _BUCKETS - 1
+
+
+def _lookup_table() -> list[int]:
+    # Share one int object per bucket: the table is _LOOKUP_LIMIT pointers.
+    indices = list(range(_BUCKETS))
+    return [indices[_bucket_index(value)] for value in range(_LOOKUP_LIMIT)]
+
+
+_LOOKUP: Final[list[int]] = _lookup_table()
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """Return the [low, high) range of values counted in bucket `index`."""
+    if index < 1 << _LINEAR_LIMIT_BITS:
+        return index, index + 1
+    shift = (index >> _SUB_BITS) - 1
+    low = (index - (shift << _SUB_BITS)) << shift
+    return low, low + (1 << shift)
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSnapshot:
+    """
+    A merged, point-in-time copy of a LatencyHistogram.
+
+    Attributes:
+        counts (array): The number of samples in each log-linear bucket.
+        total (int): The number of samples.
+    """
+
+    counts: array
+    total: int
+
+    def percentile(self, q: float) -> int:
+        """
+        Return the value at quantile `q`, accurate to the bucket width (~3%).
+
+        Args:
+            q (float): The quantile, from 0 to 100.
+
+        Raises:
+            ValueError: If `q` is outside [0, 100].
+
+        Returns:
+            int: The midpoint of the bucket holding the quantile, or 0 when the
+            histogram is empty.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100.")
+        if not self.total:
+            return 0
+        rank = max(1, -(-self.total * q // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                low, high = _bucket_bounds(index)
+                return (low + high - 1) // 2
+        return _bucket_bounds(len(self.counts) - 1)[0]
+
+    @property
+    def p50(self) -> int:
+        """The median."""
+        return self.percentile(50)
+
+    @property
+    def p99(self) -> int:
+        """The 99th percentile."""
+        return self.percentile(99)
+
+    @property
+    def p999(self) -> int:
+        """The 99.9th percentile."""
+        return self.percentile(99.9)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the summary statistics as plain data.
+
+        Returns:
+            dict[str, Any]: "count", "p50", "p99", "p999" and "max", the last
+            being the upper edge of the highest non-empty bucket.
+        """
+        highest = 0
+        for index in range(len(self.counts) - 1, -1, -1):
+            if self.counts[index]:
+                highest = _bucket_bounds(index)[1] - 1
+                break
+        return {
+            "count": self.total,
+            "p50": self.p50,
+            "p99": self.p99,
+            "p999": self.p999,
+            "max": highest,
+        }
+
+
+class LatencyHistogram:
+    """
+    A fixed-memory log-linear histogram of nanosecond latencies.
+
+    Every thread counts into one list of _BUCKETS counters, without a lock or
+    a per-thread lookup: recording is a table lookup and one increment. With
+    the GIL, CPython does not switch threads inside `counts[i] += 1`, so no
+    sample is lost; on a free-threaded build, concurrent increments of the
+    same bucket may occasionally drop one.
+    """
+
+    __slots__ = ("_counts",)
+
+    def __init__(self) -> None:
+        self._counts = [0] * _BUCKETS
+
+    def record(self, nanoseconds: int) -> None:
+        """
+        Add one sample.
+
+        Args:
+            nanoseconds (int): The latency; values above about 69 seconds are
+                clamped into the last bucket.
+        """
+        if 0 <= nanoseconds < _LOOKUP_LIMIT:
+            self._counts[_LOOKUP[nanoseconds]] += 1
+        else:
+            self._counts[_bucket_index(nanoseconds)] += 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        """
+        Copy the counts into a snapshot.
+
+        Returns:
+            HistogramSnapshot: The counts so far.
+        """
+        counts = array("Q", self._counts)
+        return HistogramSnapshot(counts, sum(counts))
+
+    def reset(self) -> None:
+        """
+        Zero every counter.
+        """
+        # In place: timed wrappers keep bound references to this histogram.
+        self._counts[:] = [0] * _BUCKETS
+
+
+class ResultLatency:
+    """
+    The Ok and Fail latency histograms of one `as_result(..., timed=True)` function.
+
+    Attributes:
+        ok (LatencyHistogram): Latencies of calls that returned Ok.
+        fail (LatencyHistogram): Latencies of calls that returned Fail.
+    """
+
+    __slots__ = ("ok", "fail")
+
+    def __init__(self) -> None:
+        self.ok = LatencyHistogram()
+        self.fail = LatencyHistogram()
+
+    def snapshot(self) -> dict[str, HistogramSnapshot]:
+        """
+        Merge both histograms.
+
+        Returns:
+            dict[str, HistogramSnapshot]: The "ok" and "fail" snapshots.
+        """
+        return {"ok": self.ok.snapshot(), "fail": self.fail.snapshot()}
+
+    def reset(self) -> None:
+        """
+        Zero both histograms.
+        """
+        self.ok.reset()
+        self.fail.reset()
@@ -0,0 +1,261 @@
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from itertools import islice
+from os import process_cpu_count
+from time import perf_counter_ns
+from typing import Any, Callable, Final, Iterable, Iterator
+
+from result.base import ErrorRecord, Fail as FailClass, Ok as OkClass
+from result.types.base import Either, TracebackCapture
+from result.utils.helpers import _TRACEBACK_RELEASE, _as_result_spec, result_fail
+
+# Upper bound on the automatic chunk size, so one slow chunk cannot hold back
+# ordered output for long.
+_MAX_CHUNK: Final[int] = 4096
+
+
+def result_map[T, S, F](
+    func: Callable[[T], Either[S, F]],
+    iterable: Iterable[T],
+    executor: Executor | None = None,
+    *,
+    max_in_flight: int = 32,
+    fail_fast: bool = False,
+    catch: tuple[type[Exception], ...] = (Exception,),
+    capture: TracebackCapture = "full",
+) -> Iterator[Either[S, F | Exception]]:
+    """
+    Call `func` on every item concurrently, yielding the results in input order.
+
+    At most `max_in_flight` calls are submitted at once: a new item is pulled
+    from `iterable` only after the oldest outstanding result has been yielded,
+    so memory stays bounded for arbitrarily long inputs. Results are streamed
+    as soon as every earlier item has completed.
+
+    Example:
+        >>> fetch = as_result(OSError)(download)
+        >>> for result in result_map(fetch, urls, max_in_flight=16):
+        ...     ...
+
+    Args:
+        func (Callable[[T], Either[S, F]]): A one-argument function returning
+            Ok/Fail, typically decorated with as_result.
+        iterable (Iterable[T]): The inputs. Consumed lazily.
+        executor (Executor | None, optional): Where to run the calls. Defaults
+            to a ThreadPoolExecutor with `max_in_flight` workers, owned by (and
+            shut down with) the returned iterator.
+        max_in_flight (int, optional): Maximum number of submitted calls not yet
+            yielded. Defaults to 32.
+        fail_fast (bool, optional): Stop after yielding the first Fail and
+            cancel every call that has not started yet. Defaults to False.
+        catch (tuple[type[Exception], ...], optional): Exceptions raised by
+            `func` that are converted to Fail, as in as_result; pass () to let
+            them propagate. Defaults to (Exception,).
+        capture (TracebackCapture, optional): Traceback policy for exceptions
+            caught through `catch`, as in as_result. Defaults to "full".
+
+    Raises:
+        ValueError: If `max_in_flight` is not positive or `capture` is unknown.
+
+    Returns:
+        Iterator[Either[S, F | Exception]]: One Ok/Fail per input, in input
+        order (ending at the first Fail when `fail_fast` is set).
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be a positive integer.")
+    if capture not in _TRACEBACK_RELEASE:
+        raise ValueError(f"Unknown traceback capture policy: {capture!r}")
+    return _result_map(
+        func,
+        iterable,
+        executor,
+        max_in_flight,
+        fail_fast,
+        catch,
+        _TRACEBACK_RELEASE[capture],
+    )
+
+
+def _result_map(
+    func: Callable[[Any], Any],
+    iterable: Iterable[Any],
+    executor: Executor | None,
+    max_in_flight: int,
+    fail_fast: bool,
+    catch: tuple[type[Exception], ...],
+    release: Callable[[Any], Any] | None,
+) -> Iterator[Either[Any, Any]]:
+    owned = executor is None
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="result_map"
+        )
+    submit = executor.submit
+    items = iter(iterable)
+    pending: deque[Future[Any]] = deque(
+        submit(func, item) for item in islice(items, max_in_flight)
+    )
+    popleft, append = pending.popleft, pending.append
+
+    try:
+        while pending:
+            future = popleft()
+            try:
+                result = future.result()
+            except catch as exception:
+                result = result_fail(release(exception) if release else exception)
+            if fail_fast and not result._is_ok:
+                yield result
+                return
+            # Refill before yielding so the pool keeps working while the
+            # consumer handles this result.
+            for item in islice(items, 1):
+                append(submit(func, item))
+            yield result
+    finally:
+        # Reached on exhaustion, fail-fast, an uncaught exception, or the
+        # consumer closing the iterator early.
+        for future in pending:
+            future.cancel()
+        if owned:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def result_map_processes[T, S, F](
+    func: Callable[[T], Either[S, F]],
+    iterable: Iterable[T],
+    executor: ProcessPoolExecutor | None = None,
+    *,
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+    chunk_ms: float = 20.0,
+    fail_fast: bool = False,
+) -> Iterator[Either[S, F | ErrorRecord]]:
+    """
+    Call `func` on every item in worker processes, yielding results in input order.
+
+    Items are sent in chunks. Unless `chunksize` is given, the first chunks
+    hold a single item and are timed inside the worker; later chunks are
+    sized from the measured per-item cost so each takes about `chunk_ms`.
+    That amortises pickling and IPC for cheap functions while keeping chunks
+    short for expensive ones.
+
+    Exceptions never cross the process boundary: when `func` is decorated with
+    as_result, the exceptions it catches come back as Fail(ErrorRecord), and
+    any other Fail holding an exception is converted the same way. Ok and
+    Fail pickle as their tag and value only.
+
+    Args:
+        func (Callable[[T], Either[S, F]]): A picklable (module-level)
+            one-argument function returning Ok/Fail, typically decorated with
+            as_result.
+        iterable (Iterable[T]): The inputs. Consumed lazily.
+        executor (ProcessPoolExecutor | None, optional): The pool to use.
+            Defaults to a new pool owned by (and shut down with) the returned
+            iterator.
+        max_workers (int | None, optional): Worker count for a new pool, and
+            how many chunks are kept in flight (two per worker). Defaults to
+            the number of usable CPUs.
+        chunksize (int | None, optional): A fixed chunk size, disabling the
+            automatic sizing. Defaults to None.
+        chunk_ms (float, optional): Target duration of an automatically sized
+            chunk, in milliseconds. Defaults to 20.0.
+        fail_fast (bool, optional): Stop after yielding the first Fail and
+            cancel every chunk that has not started yet. Defaults to False.
+
+    Raises:
+        ValueError: If `max_workers`, `chunksize` or `chunk_ms` is not positive.
+
+    Returns:
+        Iterator[Either[S, F | ErrorRecord]]: One Ok/Fail per input, in input
+        order (ending at the first Fail when `fail_fast` is set).
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be a positive integer.")
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    if chunk_ms <= 0:
+        raise ValueError("chunk_ms must be positive.")
+    return _result_map_processes(
+        func,
+        iterable,
+        executor,
+        max_workers or process_cpu_count() or 1,
+        chunksize,
+        int(chunk_ms * 1_000_000),
+        fail_fast,
+    )
+
+
+def _run_chunk(
+    func: Callable[[Any], Any], items: list[Any]
+) -> tuple[list[Either[Any, Any]], int]:
+    """Run one chunk inside a worker; return its results and elapsed ns."""
+    started = perf_counter_ns()
+    results: list[Either[Any, Any]] = []
+    append = results.append
+    spec = _as_result_spec(func)
+    if spec is not None:
+        # Call the undecorated function, as pipeline() does, so a caught
+        # exception is recorded without being wrapped in Fail first.
+        raw, exceptions, _ = spec
+        for item in items:
+            try:
+                append(OkClass(raw(item)))
+            except exceptions as exception:
+                append(FailClass(ErrorRecord.from_exception(exception)))
+    else:
+        for item in items:
+            result = func(item)
+            if not result._is_ok and isinstance(result.value, BaseException):
+                result = FailClass(ErrorRecord.from_exception(result.value))
+            append(result)
+    return results, perf_counter_ns() - started
+
+
+def _result_map_processes(
+    func: Callable[[Any], Any],
+    iterable: Iterable[Any],
+    executor: ProcessPoolExecutor | None,
+    workers: int,
+    chunksize: int | None,
+    chunk_ns: int,
+    fail_fast: bool,
+) -> Iterator[Either[Any, Any]]:
+    owned = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    items = iter(iterable)
+    size = chunksize or 1
+    pending: deque[Future[tuple[list[Either[Any, Any]], int]]] = deque()
+
+    def submit() -> bool:
+        chunk = list(islice(items, size))
+        if chunk:
+            pending.append(executor.submit(_run_chunk, func, chunk))
+        return bool(chunk)
+
+    try:
+        for _ in range(2 * workers):
+            if not submit():
+                break
+        while pending:
+            results, elapsed = pending.popleft().result()
+            if chunksize is None:
+                per_item = max(elapsed // len(results), 1)
+                size = max(1, min(_MAX_CHUNK, chunk_ns // per_item))
+            submit()
+            for result in results:
+                yield result
+                if fail_fast and not result._is_ok:
+                    return
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            executor.shutdown(wait=False, cancel_futures=True)
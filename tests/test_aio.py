@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+from result.base import Ok, Fail
+from result.utils.aio import gather_results
+from result.utils.helpers import as_result
+
+
+async def _settle(value: int, delay: float = 0.0):
+    await asyncio.sleep(delay)
+    return Ok(value) if value >= 0 else Fail(f"negative {value}")
+
+
+class TestGatherResults(unittest.IsolatedAsyncioTestCase):
+    async def test_returns_values_in_input_order(self) -> None:
+        """Ensure Ok values come back in input order whatever the completion order."""
+        aws = [_settle(3, 0.03), _settle(1, 0.0), _settle(2, 0.01)]
+        self.assertEqual(await gather_results(aws), Ok((3, 1, 2)))
+        self.assertEqual(await gather_results([]), Ok(()))
+
+    async def test_fail_fast_cancels_outstanding_tasks(self) -> None:
+        """Ensure the first Fail returns immediately and the running tasks are cancelled."""
+        started: list[int] = []
+        cancelled: list[int] = []
+
+        async def slow(value: int):
+            started.append(value)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(value)
+                raise
+            return Ok(value)
+
+        aws = [slow(0), _settle(-1, 0.01), slow(2), slow(3)]
+        result = await asyncio.wait_for(gather_results(aws, limit=3), timeout=1)
+        self.assertEqual(result, Fail("negative -1"))
+        await asyncio.sleep(0)
+        self.assertEqual(sorted(cancelled), [0, 2])
+        self.assertEqual(started, [0, 2])
+
+    async def test_fail_fast_retrieves_remaining_task_outcomes(self) -> None:
+        """Ensure tasks left behind by a fail-fast exit are awaited, not leaked."""
+        import gc
+
+        reports: list[dict] = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: reports.append(context)
+        )
+
+        async def stubborn():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                raise RuntimeError("while cancelled")
+
+        result = await gather_results([stubborn(), _settle(-1, 0.01)])
+        self.assertEqual(result, Fail("negative -1"))
+        gc.collect()
+        await asyncio.sleep(0)
+        self.assertEqual(reports, [])
+
+    async def test_limit_bounds_task_count(self) -> None:
+        """Ensure no more than `limit` tasks exist at once, even for a long input."""
+        peak = 0
+        baseline = len(asyncio.all_tasks())
+
+        async def tracked(value: int):
+            nonlocal peak
+            peak = max(peak, len(asyncio.all_tasks()) - baseline)
+            await asyncio.sleep(0)
+            return Ok(value)
+
+        result = await gather_results((tracked(i) for i in range(200)), limit=5)
+        self.assertEqual(result, Ok(tuple(range(200))))
+        self.assertLessEqual(peak, 5)
+
+    async def test_collects_all_outcomes_without_fail_fast(self) -> None:
+        """Ensure fail_fast=False waits for everything and returns each result."""
+        aws = [_settle(1, 0.01), _settle(-2), _settle(3)]
+        results = await gather_results(aws, limit=2, fail_fast=False)
+        self.assertEqual(results, (Ok(1), Fail("negative -2"), Ok(3)))
+
+    async def test_exceptions_propagate(self) -> None:
+        """Ensure an exception from an awaitable propagates and invalid limits are rejected."""
+
+        async def boom():
+            raise KeyError("boom")
+
+        with self.assertRaises(KeyError):
+            await gather_results([boom()])
+        with self.assertRaises(ValueError):
+            await gather_results([], limit=0)
+
+        parse = as_result(ValueError)(self._parse)
+        result = await gather_results([parse("1"), parse("x")])
+        self.assertIsInstance(result.value, ValueError)
+
+    @staticmethod
+    async def _parse(text: str) -> int:
+        return int(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import unittest
+from result.base import Fail, Ok
+from result.errors import CircuitOpen
+from result.utils.breaker import circuit_breaker
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.healthy = True
+        self.calls = 0
+
+        @circuit_breaker(
+            10, failure_rate=0.5, min_calls=4, reset_after=5, clock=self.clock
+        )
+        def fetch(key: str):
+            self.calls += 1
+            return Ok(key) if self.healthy else Fail(OSError("down"))
+
+        self.fetch = fetch
+
+    def test_stays_closed_below_threshold(self) -> None:
+        """Ensure occasional Fails do not open the circuit."""
+        for index in range(20):
+            self.healthy = index % 4 != 0
+            self.fetch("a")
+        self.assertEqual(self.fetch.circuit_state(), "closed")
+        self.assertEqual(self.calls, 20)
+
+    def test_opens_and_rejects_with_prebuilt_fail(self) -> None:
+        """Ensure the circuit opens at the threshold and stops calling the function."""
+        self.healthy = False
+        for _ in range(4):
+            self.fetch("a")
+        self.assertEqual(self.fetch.circuit_state(), "open")
+        first, second = self.fetch("a"), self.fetch("b")
+        self.assertEqual(self.calls, 4)
+        self.assertTrue(first.isFail())
+        self.assertIsInstance(first.value, CircuitOpen)
+        self.assertIs(first, second)
+
+    def test_open_circuit_rejects_pipeline_calls(self) -> None:
+        """Ensure pipeline cannot bypass an open breaker around an as_result step."""
+        from result.utils.compose import pipeline
+        from result.utils.helpers import _as_result_spec, as_result
+
+        calls: list[str] = []
+
+        @circuit_breaker(4, min_calls=2, reset_after=60, clock=self.clock)
+        @as_result(OSError)
+        def fetch(key: str) -> str:
+            calls.append(key)
+            raise OSError("down")
+
+        fetch("a")
+        fetch("b")
+        self.assertEqual(fetch.circuit_state(), "open")
+        self.assertIsNone(_as_result_spec(fetch))
+        run = pipeline(fetch)
+        for _ in range(5):
+            self.assertIsInstance(run("c").value, CircuitOpen)
+        self.assertEqual(calls, ["a", "b"])
+
+    def test_min_calls(self) -> None:
+        """Ensure the rate is not evaluated before min_calls outcomes."""
+        self.healthy = False
+        for _ in range(3):
+            self.fetch("a")
+        self.assertEqual(self.fetch.circuit_state(), "closed")
+
+    def test_half_open_probe_success_closes(self) -> None:
+        """Ensure a successful probe after reset_after closes the circuit."""
+        self.healthy = False
+        for _ in range(4):
+            self.fetch("a")
+        self.clock.now = 5
+        self.healthy = True
+        self.assertEqual(self.fetch("a"), Ok("a"))
+        self.assertEqual(self.fetch.circuit_state(), "closed")
+
+    def test_half_open_probe_failure_reopens(self) -> None:
+        """Ensure a failing probe opens the circuit for another period."""
+        self.healthy = False
+        for _ in range(4):
+            self.fetch("a")
+        self.clock.now = 5
+        self.assertIsInstance(self.fetch("a").value, OSError)
+        self.assertEqual(self.fetch.circuit_state(), "open")
+        self.clock.now = 9
+        self.assertIsInstance(self.fetch("a").value, CircuitOpen)
+        self.assertEqual(self.calls, 5)
+
+    def test_half_open_limits_concurrent_probes(self) -> None:
+        """Ensure only half_open_probes calls go through while a probe is running."""
+        clock = _Clock()
+        entered, release = threading.Event(), threading.Event()
+        healthy = [False]
+
+        @circuit_breaker(4, min_calls=2, reset_after=1, clock=clock)
+        def fetch():
+            if healthy[0]:
+                entered.set()
+                release.wait(5)
+                return Ok(1)
+            return Fail("down")
+
+        fetch()
+        fetch()
+        clock.now, healthy[0] = 1, True
+        results = []
+        probe = threading.Thread(target=lambda: results.append(fetch()))
+        probe.start()
+        entered.wait(5)
+        self.assertIsInstance(fetch().value, CircuitOpen)
+        release.set()
+        probe.join()
+        self.assertEqual(results, [Ok(1)])
+        self.assertEqual(fetch.circuit_state(), "closed")
+
+    def test_exception_counts_as_fail(self) -> None:
+        """Ensure escaping exceptions propagate and count as failures."""
+
+        @circuit_breaker(4, min_calls=2, clock=self.clock)
+        def broken():
+            raise KeyError("x")
+
+        for _ in range(2):
+            with self.assertRaises(KeyError):
+                broken()
+        self.assertEqual(broken.circuit_state(), "open")
+        broken.circuit_reset()
+        self.assertEqual(broken.circuit_state(), "closed")
+
+    def test_thread_safety(self) -> None:
+        """Ensure concurrent calls keep the window consistent."""
+
+        @circuit_breaker(64, failure_rate=1.0, min_calls=64)
+        def fetch(value: int):
+            return Ok(value)
+
+        def work() -> None:
+            for value in range(2000):
+                fetch(value)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(fetch.circuit_state(), "closed")
+
+    def test_validation(self) -> None:
+        """Ensure out-of-range parameters are rejected."""
+        for kwargs in (
+            {"window": 0},
+            {"failure_rate": 0},
+            {"min_calls": 200},
+            {"reset_after": -1},
+            {"half_open_probes": 0},
+        ):
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                circuit_breaker(**kwargs)
+
+
+class TestCircuitBreakerAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_opens_and_probes(self) -> None:
+        """Ensure coroutine functions are guarded the same way."""
+        clock = _Clock()
+        healthy = [False]
+
+        @circuit_breaker(4, min_calls=2, reset_after=1, clock=clock)
+        async def fetch():
+            await asyncio.sleep(0)
+            return Ok(1) if healthy[0] else Fail("down")
+
+        await fetch()
+        await fetch()
+        self.assertIsInstance((await fetch()).value, CircuitOpen)
+        clock.now, healthy[0] = 1, True
+        self.assertEqual(await fetch(), Ok(1))
+        self.assertEqual(fetch.circuit_state(), "closed")
+
+    async def test_cancelled_probe_releases_slot(self) -> None:
+        """Ensure a cancelled probe lets the next call probe."""
+        clock = _Clock()
+        mode = ["fail"]
+
+        @circuit_breaker(4, min_calls=2, reset_after=1, clock=clock)
+        async def fetch():
+            if mode[0] == "hang":
+                await asyncio.sleep(10)
+            return Ok(1) if mode[0] == "ok" else Fail("down")
+
+        await fetch()
+        await fetch()
+        clock.now, mode[0] = 1, "hang"
+        task = asyncio.ensure_future(fetch())
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        mode[0] = "ok"
+        self.assertEqual(await fetch(), Ok(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import unittest
+from result.base import Ok, Fail
+from result.guards.base import is_fail
+from result.utils.cache import cached_result
+from result.utils.helpers import _as_result_spec, as_result, traceback_summary
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCachedResult(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = _Clock()
+        self.calls: list[int] = []
+
+    def _lookup(self, **options):
+        @cached_result(clock=self.clock, **options)
+        @as_result(KeyError, TimeoutError)
+        def lookup(key: int) -> int:
+            self.calls.append(key)
+            if key < 0:
+                raise KeyError(key)
+            if key == 0:
+                raise TimeoutError("slow")
+            return key * 10
+
+        return lookup
+
+    def test_caches_ok_and_counts(self) -> None:
+        """Ensure Ok results are served from the cache and stats are tracked."""
+        lookup = self._lookup()
+        self.assertEqual([lookup(1), lookup(1), lookup(key=1)], [Ok(10)] * 3)
+        self.assertEqual(self.calls, [1, 1])
+        stats = lookup.cache_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size, stats.maxsize), (1, 2, 2, 128))
+        lookup.cache_clear()
+        lookup(1)
+        self.assertEqual(self.calls, [1, 1, 1])
+
+    def test_not_bypassed_by_pipeline(self) -> None:
+        """Ensure pipeline calls go through the cache instead of the raw function."""
+        from result.utils.compose import pipeline
+
+        lookup = self._lookup()
+        self.assertIsNone(_as_result_spec(lookup))
+        run = pipeline(lookup)
+        self.assertEqual([run(2) for _ in range(3)], [Ok(20)] * 3)
+        self.assertEqual(self.calls, [2])
+        self.assertEqual(lookup.cache_stats().hits, 2)
+
+    def test_lru_eviction(self) -> None:
+        """Ensure the least recently used entry is evicted at maxsize."""
+        lookup = self._lookup(maxsize=2)
+        lookup(1), lookup(2), lookup(1), lookup(3)
+        self.assertEqual(lookup.cache_stats().evictions, 1)
+        lookup(1)
+        lookup(2)
+        self.assertEqual(self.calls, [1, 2, 3, 2])
+
+    def test_separate_ttls(self) -> None:
+        """Ensure Ok and Fail expire on their own TTLs and Fail is not cached by default."""
+        lookup = self._lookup()
+        lookup(-1), lookup(-1)
+        self.assertEqual(self.calls, [-1, -1])
+
+        self.calls.clear()
+        lookup = self._lookup(ok_ttl=60, fail_ttl=5)
+        lookup(1), lookup(-1)
+        self.clock.now = 4
+        lookup(1), lookup(-1)
+        self.assertEqual(self.calls, [1, -1])
+        self.clock.now = 10
+        lookup(1), lookup(-1)
+        self.assertEqual(self.calls, [1, -1, -1])
+        self.clock.now = 61
+        lookup(1)
+        self.assertEqual(self.calls, [1, -1, -1, 1])
+        self.assertEqual(lookup.cache_stats().expirations, 2)
+
+    def test_never_cache_and_traceback_release(self) -> None:
+        """Ensure excluded errors are not cached and only the cached copy of a Fail loses its traceback."""
+        lookup = self._lookup(fail_ttl=None, never_cache=(TimeoutError,))
+        lookup(0), lookup(0)
+        self.assertEqual(self.calls, [0, 0])
+        failure = lookup(-2)
+        self.assertTrue(is_fail(failure))
+        self.assertIsNotNone(failure.value.__traceback__)
+        cached = lookup(-2)
+        self.assertIsNot(cached, failure)
+        self.assertIs(type(cached.value), type(failure.value))
+        self.assertEqual(cached.value.args, failure.value.args)
+        self.assertIsNone(cached.value.__traceback__)
+        self.assertEqual(traceback_summary(cached.value)[-1][2], "lookup")
+        self.assertIs(lookup(-2), cached)
+        self.assertEqual(self.calls, [0, 0, -2])
+        self.assertRaises(ValueError, cached_result, -1)
+
+
+class TestCachedResultAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_coalesces_concurrent_calls(self) -> None:
+        """Ensure identical concurrent calls share one computation and the result is cached."""
+        calls: list[int] = []
+
+        @cached_result(fail_ttl=None)
+        async def fetch(key: int):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return Ok(key) if key else Fail("zero")
+
+        results = await asyncio.gather(fetch(1), fetch(1), fetch(2), fetch(1))
+        self.assertEqual(results, [Ok(1), Ok(1), Ok(2), Ok(1)])
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(await fetch(1), Ok(1))
+        self.assertEqual(calls, [1, 2])
+        stats = fetch.cache_stats()
+        self.assertEqual((stats.coalesced, stats.hits), (2, 1))
+
+        first = asyncio.ensure_future(fetch(0))
+        second = asyncio.ensure_future(fetch(0))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual(await second, Fail("zero"))
+        self.assertEqual(calls, [1, 2, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
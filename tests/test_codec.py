@@ -0,0 +1,77 @@
+import struct
+import unittest
+from result.base import Ok, Fail, ResultArray
+from result.codec import (
+    JSON,
+    PICKLE,
+    RAW,
+    PayloadCodec,
+    decode,
+    decode_array,
+    decode_many,
+    encode,
+    encode_array,
+    encode_many,
+    iter_decode,
+)
+
+
+class TestCodec(unittest.TestCase):
+    def test_frame_layout(self) -> None:
+        """Ensure a frame is a tag byte, a one- or four-byte length and the payload."""
+        self.assertEqual(encode(Ok(1), JSON), b"\x02\x011")
+        self.assertEqual(encode(Fail("x"), JSON), b'\x03\x03"x"')
+        long = "y" * 300
+        self.assertEqual(encode(Fail(long), JSON), b"\x01" + struct.pack("<I", 302) + f'"{long}"'.encode())
+        self.assertEqual(decode(encode(Fail(long), JSON), JSON), Fail(long))
+
+    def test_round_trips_each_payload_codec(self) -> None:
+        """Ensure sequences round-trip through JSON, pickle and raw payloads."""
+        results = [Ok({"a": [1, 2]}), Fail("bad"), Ok(None)]
+        self.assertEqual(decode_many(encode_many(results, JSON), JSON), results)
+        results.append(Fail(ValueError))
+        self.assertEqual(decode_many(encode_many(results)), results)
+        self.assertEqual(decode(encode(Fail(3))), Fail(3))
+
+        data = bytearray(encode_many([Ok(b"abc"), Fail(memoryview(b"zz"))], RAW))
+        ok, fail = decode_many(data, RAW)
+        self.assertEqual((bytes(ok.value), bytes(fail.value)), (b"abc", b"zz"))
+        data[2] = ord("X")
+        self.assertEqual(bytes(ok.value), b"Xbc")
+        self.assertTrue(ok.value.readonly)
+
+    def test_custom_payload_codec(self) -> None:
+        """Ensure any encode/decode pair can be plugged in."""
+        utf8 = PayloadCodec("utf8", str.encode, lambda view: str(view, "utf-8"))
+        self.assertEqual(decode_many(encode_many([Ok("é"), Fail("ñ")], utf8), utf8), [Ok("é"), Fail("ñ")])
+
+    def test_iter_decode_is_lazy_and_validates(self) -> None:
+        """Ensure iter_decode yields frame by frame and rejects malformed input."""
+        data = encode_many([Ok(1), Ok(2)], JSON) + b"\x07\x00\x00\x00\x00"
+        frames = iter_decode(data, JSON)
+        self.assertEqual([next(frames), next(frames)], [Ok(1), Ok(2)])
+        self.assertRaises(ValueError, next, frames)
+        self.assertRaises(ValueError, decode_many, encode(Ok(1), JSON)[:-1], JSON)
+        self.assertRaises(ValueError, decode_many, b"\x00\x01", JSON)
+        self.assertRaises(ValueError, decode, encode_many([Ok(1), Ok(2)], JSON), JSON)
+
+    def test_result_array_batches(self) -> None:
+        """Ensure ResultArray batches round-trip with typed and list Ok columns."""
+        typed = ResultArray([Ok(1), Fail("e"), Ok(3)] * 7, typecode="q")
+        decoded = decode_array(encode_array(typed))
+        self.assertEqual(list(decoded), list(typed))
+        self.assertEqual(decoded.partition()[0].tolist(), [1, 3] * 7)
+        self.assertEqual(decoded[4], Fail("e"))
+
+        untyped = ResultArray([Ok("a"), Fail({"code": 1})])
+        self.assertEqual(list(decode_array(encode_array(untyped, JSON), JSON)), list(untyped))
+        self.assertEqual(len(decode_array(encode_array(ResultArray([])))), 0)
+
+        data = encode_array(typed)
+        self.assertRaises(ValueError, decode_array, data[:-1])
+        self.assertRaises(ValueError, decode_array, data + b"\x00")
+        self.assertRaises(ValueError, decode_array, encode(Ok(1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
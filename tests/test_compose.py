@@ -0,0 +1,102 @@
+import unittest
+from functools import wraps
+from result.base import Ok, Fail
+from result.utils.compose import pipeline
+from result.utils.helpers import as_result
+
+
+def _positive(value: int):
+    return Ok(value) if value > 0 else Fail("not positive")
+
+
+_parse = as_result(ValueError)(int)
+_invert = as_result(ZeroDivisionError)(lambda value: 100 // value)
+
+
+class TestPipeline(unittest.TestCase):
+    def test_threads_values_and_wraps_final_value(self) -> None:
+        """Ensure a successful chain returns Ok holding the last step's value."""
+        run = pipeline(_parse, _positive, _invert)
+        self.assertEqual(run("4"), Ok(25))
+
+    def test_short_circuits_on_first_fail(self) -> None:
+        """Ensure the first Fail is returned and later steps are skipped."""
+        calls: list[int] = []
+
+        def record(value: int):
+            calls.append(value)
+            return Ok(value)
+
+        run = pipeline(_parse, _positive, record)
+        self.assertEqual(run("-1"), Fail("not positive"))
+        self.assertIsInstance(run("x").value, ValueError)
+        self.assertEqual(calls, [])
+
+    def test_fused_steps_keep_their_own_exceptions(self) -> None:
+        """Ensure a fused as_result step only catches the exceptions it declared."""
+        run = pipeline(_parse, as_result(KeyError)(lambda value: {}[value]))
+        self.assertIsInstance(run("1").value, KeyError)
+        self.assertRaises(ZeroDivisionError, pipeline(_parse, lambda value: 1 // 0), "1")
+
+    def test_outer_decorators_are_not_bypassed(self) -> None:
+        """Ensure a decorator stacked on an as_result step is called, not fused away."""
+        from result.utils.cache import cached_result
+
+        outer_calls: list[int] = []
+        raw_calls: list[str] = []
+
+        def counted(func):
+            @wraps(func)
+            def wrapper(*args):
+                outer_calls.append(1)
+                return func(*args)
+
+            return wrapper
+
+        @as_result(ValueError)
+        def parse(text: str) -> int:
+            raw_calls.append(text)
+            return int(text)
+
+        run = pipeline(counted(parse), _invert)
+        self.assertEqual(run("4"), Ok(25))
+        self.assertEqual(outer_calls, [1])
+
+        raw_calls.clear()
+        run = pipeline(cached_result()(parse), _invert)
+        self.assertEqual([run("5") for _ in range(3)], [Ok(20)] * 3)
+        self.assertEqual(raw_calls, ["5"])
+
+    def test_catch_applies_to_the_whole_chain(self) -> None:
+        """Ensure exceptions listed in catch become Fail with the chosen traceback policy."""
+
+        def explode(value: int):
+            raise RuntimeError(value)
+
+        run = pipeline(_parse, explode, catch=(RuntimeError,), capture="none")
+        result = run("3")
+        self.assertIsInstance(result.value, RuntimeError)
+        self.assertIsNone(result.value.__traceback__)
+
+    def test_batch_and_timings(self) -> None:
+        """Ensure batch mode maps every record and timed mode counts step calls."""
+        run = pipeline(_parse, _positive, _invert, timed=True)
+        results = list(run.batch(["4", "-1", "x"]))
+        self.assertEqual(results[:2], [Ok(25), Fail("not positive")])
+        self.assertIsInstance(results[2].value, ValueError)
+        self.assertEqual([entry["calls"] for entry in run.timings()], [3, 2, 1])
+        self.assertTrue(all(entry["total_ns"] >= 0 for entry in run.timings()))
+
+    def test_rejects_invalid_steps(self) -> None:
+        """Ensure empty pipelines and async steps are rejected at build time."""
+
+        async def fetch(value: int) -> int:
+            return value
+
+        self.assertRaises(ValueError, pipeline)
+        self.assertRaises(TypeError, pipeline, fetch)
+        self.assertRaises(ValueError, pipeline, _parse, capture="some")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,282 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+from result.base import Ok
+from result.errors import DeadlineExceeded, DeadlineWorkersBusy
+from result.utils import deadlines
+from result.utils.deadlines import deadline, time_remaining
+from result.utils.helpers import as_result
+
+
+def tearDownModule() -> None:
+    # Stop the shared worker threads so later tests that fork start from a
+    # single-threaded process.
+    if deadlines._executor is not None:
+        deadlines._executor.shutdown(wait=True)
+        deadlines._executor = None
+
+
+class TestDeadlineContext(unittest.TestCase):
+    def test_time_remaining(self) -> None:
+        """Ensure the context deadline is visible and removed on exit."""
+        self.assertIsNone(time_remaining())
+        with deadline(10):
+            self.assertTrue(9 < time_remaining() <= 10)
+        self.assertIsNone(time_remaining())
+
+    def test_deadlines_only_tighten(self) -> None:
+        """Ensure a nested deadline cannot extend the enclosing one."""
+        with deadline(1) as outer:
+            with deadline(100) as inner:
+                self.assertEqual(inner, outer)
+            with deadline(0.5) as inner:
+                self.assertLess(inner, outer)
+
+
+class TestDeadlineSync(unittest.TestCase):
+    def test_fast_call(self) -> None:
+        """Ensure calls within the timeout return their result."""
+
+        @as_result(ValueError, timeout=5)
+        def parse(text: str) -> int:
+            return int(text)
+
+        self.assertEqual(parse("3"), Ok(3))
+        self.assertIsInstance(parse("x").value, ValueError)
+
+    def test_overrun_returns_fail_without_waiting(self) -> None:
+        """Ensure an overrunning call gives Fail(DeadlineExceeded) at the deadline."""
+        release = threading.Event()
+
+        @as_result(ValueError, timeout=0.05)
+        def stuck() -> None:
+            release.wait(5)
+
+        started = time.perf_counter()
+        result = stuck()
+        elapsed = time.perf_counter() - started
+        release.set()
+        self.assertTrue(result.isFail())
+        self.assertIsInstance(result.value, DeadlineExceeded)
+        self.assertIsInstance(result.value, TimeoutError)
+        self.assertLess(elapsed, 1)
+
+    def test_broad_exceptions_still_report_deadline(self) -> None:
+        """Ensure catching Exception does not hide the deadline."""
+        release = threading.Event()
+
+        @as_result(Exception, timeout=0.02)
+        def stuck() -> None:
+            release.wait(5)
+
+        result = stuck()
+        release.set()
+        self.assertIsInstance(result.value, DeadlineExceeded)
+
+    def test_call_finishing_at_the_deadline(self) -> None:
+        """Ensure a call ending right at the deadline gives its result or the deadline Fail."""
+        for exceptions in ((ValueError,), (TimeoutError,)):
+
+            @as_result(*exceptions, timeout=0.003)
+            def borderline() -> int:
+                time.sleep(0.003)
+                return 1
+
+            for _ in range(20):
+                result = borderline()
+                with self.subTest(exceptions=exceptions):
+                    self.assertTrue(
+                        result == Ok(1) or type(result.value) is DeadlineExceeded,
+                        result,
+                    )
+
+    def test_own_timeout_error_is_not_a_deadline(self) -> None:
+        """Ensure a TimeoutError raised by the function is kept as-is."""
+        error = TimeoutError("socket")
+
+        @as_result(TimeoutError, timeout=5)
+        def connect() -> None:
+            raise error
+
+        self.assertIs(connect().value, error)
+
+    def test_exhausted_budget_skips_work(self) -> None:
+        """Ensure a call made after the deadline does not run."""
+        calls: list[int] = []
+
+        @as_result(ValueError, deadline=True)
+        def work() -> int:
+            calls.append(1)
+            return 1
+
+        with deadline(0.01):
+            time.sleep(0.02)
+            self.assertIsInstance(work().value, DeadlineExceeded)
+        self.assertEqual(calls, [])
+        self.assertEqual(work(), Ok(1))
+
+    def test_nested_calls_inherit_remaining_budget(self) -> None:
+        """Ensure nested calls see the outer timeout, not just their own."""
+        seen: list[float] = []
+
+        @as_result(ValueError, deadline=True)
+        def inner() -> None:
+            seen.append(time_remaining())
+
+        @as_result(ValueError, timeout=0.5)
+        def outer() -> None:
+            inner()
+
+        self.assertEqual(outer(), Ok(None))
+        self.assertTrue(0 < seen[0] <= 0.5)
+
+    def test_nested_calls_run_on_the_enclosing_worker(self) -> None:
+        """Ensure nested sync calls run inline instead of waiting on another worker."""
+        threads: list[int] = []
+
+        @as_result(ValueError, timeout=0.5)
+        def inner() -> None:
+            threads.append(threading.get_ident())
+
+        @as_result(ValueError, timeout=1)
+        def outer() -> None:
+            threads.append(threading.get_ident())
+            inner()
+
+        # With a single worker, waiting on a second one would deadlock.
+        slots = threading.BoundedSemaphore(1)
+        with mock.patch.object(deadlines, "_free_workers", slots):
+            self.assertEqual(outer(), Ok(None))
+        self.assertEqual(len(threads), 2)
+        self.assertEqual(threads[0], threads[1])
+        self.assertNotEqual(threads[0], threading.get_ident())
+
+    def test_busy_workers_are_not_a_deadline(self) -> None:
+        """Ensure a call finding no free worker is refused unrun with DeadlineWorkersBusy."""
+        release = threading.Event()
+        calls: list[int] = []
+
+        @as_result(ValueError, timeout=0.02)
+        def stuck() -> None:
+            release.wait(5)
+
+        @as_result(ValueError, timeout=0.5)
+        def quick() -> int:
+            calls.append(1)
+            return 1
+
+        slots = threading.BoundedSemaphore(1)
+        with mock.patch.object(deadlines, "_free_workers", slots):
+            self.assertIsInstance(stuck().value, DeadlineExceeded)
+            busy = quick()
+            release.set()
+            # The abandoned call hands its worker back once it returns.
+            self.assertTrue(slots.acquire(timeout=5))
+            slots.release()
+            self.assertEqual(quick(), Ok(1))
+        self.assertIsInstance(busy.value, DeadlineWorkersBusy)
+        self.assertNotIsInstance(busy.value, TimeoutError)
+        self.assertEqual(calls, [1])
+
+    def test_each_expiry_gets_its_own_error(self) -> None:
+        """Ensure expired calls never share a DeadlineExceeded that raising would mutate."""
+
+        @as_result(ValueError, deadline=True)
+        def work() -> None:
+            pass
+
+        with deadline(0):
+            first, second = work(), work()
+        self.assertIsNot(first.value, second.value)
+        try:
+            raise first.value
+        except DeadlineExceeded:
+            pass
+        self.assertIsNone(second.value.__traceback__)
+
+    def test_uncaught_exception_propagates(self) -> None:
+        """Ensure exceptions outside the caught types still propagate."""
+
+        @as_result(ValueError, timeout=5)
+        def lookup() -> None:
+            raise KeyError("x")
+
+        with self.assertRaises(KeyError):
+            lookup()
+
+    def test_validation(self) -> None:
+        """Ensure invalid combinations are rejected."""
+        with self.assertRaises(ValueError):
+            as_result(ValueError, timeout=0)
+        with self.assertRaises(ValueError):
+            as_result(ValueError, timeout=1, timed=True)
+        with self.assertRaises(TypeError):
+
+            @as_result(ValueError, timeout=1)
+            def numbers():
+                yield 1
+
+
+class TestDeadlineAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_coroutine_is_cancelled_at_deadline(self) -> None:
+        """Ensure the coroutine is cancelled and the result is a Fail."""
+        cancelled: list[int] = []
+
+        @as_result(ValueError, timeout=0.02)
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+
+        result = await slow()
+        self.assertIsInstance(result.value, DeadlineExceeded)
+        self.assertEqual(cancelled, [1])
+
+    async def test_broad_exceptions_still_report_deadline(self) -> None:
+        """Ensure catching Exception does not hide the deadline."""
+
+        @as_result(Exception, timeout=0.01)
+        async def slow() -> None:
+            await asyncio.sleep(10)
+
+        self.assertIsInstance((await slow()).value, DeadlineExceeded)
+
+    async def test_nested_inherits_and_skips(self) -> None:
+        """Ensure nested coroutine calls share the budget and skip once it is spent."""
+        calls: list[str] = []
+
+        @as_result(ValueError, deadline=True)
+        async def step(name: str) -> str:
+            calls.append(name)
+            await asyncio.sleep(0.03)
+            return name
+
+        @as_result(ValueError, timeout=0.05)
+        async def handler():
+            first = await step("a")
+            second = await step("b")
+            third = await step("c")
+            return first, second, third
+
+        result = await handler()
+        self.assertIsInstance(result.value, DeadlineExceeded)
+        self.assertEqual(calls, ["a", "b"])
+
+    async def test_context_deadline(self) -> None:
+        """Ensure a deadline set with the context manager applies to coroutines."""
+
+        @as_result(ValueError, deadline=True)
+        async def slow() -> None:
+            await asyncio.sleep(10)
+
+        with deadline(0.01):
+            self.assertIsInstance((await slow()).value, DeadlineExceeded)
+        self.assertIsNone(time_remaining())
+
+
+if __name__ == "__main__":
+    unittest.main()
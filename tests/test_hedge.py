@@ -0,0 +1,195 @@
+import asyncio
+import gc
+import threading
+import time
+import unittest
+from result.base import ErrorBatch, Fail, Ok
+from result.utils.hedge import hedged
+
+
+class TestHedgedSync(unittest.TestCase):
+    def test_fast_call_starts_one_attempt(self) -> None:
+        """Ensure no backup is started when the first attempt beats the threshold."""
+        calls: list[int] = []
+
+        def fetch(key: str):
+            calls.append(1)
+            return Ok(key)
+
+        self.assertEqual(hedged(fetch, after=1.0, max_attempts=3)("a"), Ok("a"))
+        self.assertEqual(len(calls), 1)
+
+    def test_slow_attempt_is_hedged(self) -> None:
+        """Ensure a backup is started after the threshold and its Ok wins."""
+        attempts: list[int] = []
+        release = threading.Event()
+
+        def fetch(key: str):
+            attempts.append(1)
+            if len(attempts) == 1:
+                release.wait(5)
+                return Ok("slow")
+            return Ok("fast")
+
+        started = time.perf_counter()
+        result = hedged(fetch, after=0.01, max_attempts=2)("a")
+        release.set()
+        self.assertEqual(result, Ok("fast"))
+        self.assertLess(time.perf_counter() - started, 1)
+
+    def test_every_attempt_fails(self) -> None:
+        """Ensure a combined Fail holds every attempt's error by attempt number."""
+
+        def fetch(key: str):
+            return Fail(f"down {key}")
+
+        result = hedged(fetch, after=1.0, max_attempts=3)("a")
+        self.assertTrue(result.isFail())
+        self.assertIsInstance(result.value, ErrorBatch)
+        self.assertEqual(result.value.errors, ("down a",) * 3)
+        self.assertEqual(list(result.value.indices), [0, 1, 2])
+
+    def test_failure_then_ok(self) -> None:
+        """Ensure a failed attempt starts the next one immediately."""
+        attempts: list[int] = []
+
+        def fetch():
+            attempts.append(1)
+            return Fail("flaky") if len(attempts) == 1 else Ok(len(attempts))
+
+        started = time.perf_counter()
+        self.assertEqual(hedged(fetch, after=10, max_attempts=2)(), Ok(2))
+        self.assertLess(time.perf_counter() - started, 5)
+
+    def test_exception_propagates(self) -> None:
+        """Ensure an exception raised by an attempt propagates."""
+
+        def fetch():
+            raise KeyError("x")
+
+        with self.assertRaises(KeyError):
+            hedged(fetch, after=1.0)()
+
+    def test_attempts_see_the_callers_context(self) -> None:
+        """Ensure context variables such as the deadline reach thread attempts."""
+        from result.utils.deadlines import deadline, time_remaining
+
+        seen: list[float | None] = []
+
+        def fetch():
+            seen.append(time_remaining())
+            return Ok(1)
+
+        call = hedged(fetch, after=1.0)
+        with deadline(5):
+            call()
+        call.shutdown()
+        self.assertIsNotNone(seen[0])
+
+    def test_not_bypassed_by_pipeline(self) -> None:
+        """Ensure a hedged as_result step is hedged inside a pipeline."""
+        from result.utils.compose import pipeline
+        from result.utils.helpers import _as_result_spec, as_result
+
+        attempts: list[int] = []
+
+        @as_result(OSError)
+        def fetch(key: str) -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("flaky")
+            return key
+
+        call = hedged(fetch, after=1.0, max_attempts=2)
+        self.assertIsNone(_as_result_spec(call))
+        self.assertEqual(pipeline(call)("a"), Ok("a"))
+        self.assertEqual(len(attempts), 2)
+        call.shutdown()
+
+    def test_shutdown_releases_the_pool(self) -> None:
+        """Ensure shutdown stops the owned pool and a later call makes a new one."""
+        call = hedged(lambda: Ok(threading.current_thread().name), after=1.0)
+        first = call().value
+        call.shutdown()
+        self.assertFalse(
+            any(thread.name == first for thread in threading.enumerate())
+        )
+        self.assertTrue(call().value.startswith("hedged"))
+        call.shutdown()
+
+    def test_validation(self) -> None:
+        """Ensure invalid parameters are rejected."""
+        with self.assertRaises(ValueError):
+            hedged(lambda: Ok(1), after=-1)
+        with self.assertRaises(ValueError):
+            hedged(lambda: Ok(1), after=1, max_attempts=0)
+
+
+class TestHedgedAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_first_ok_wins_and_losers_are_cancelled(self) -> None:
+        """Ensure the backup's Ok is returned and the slow attempt is cancelled."""
+        cancelled: list[int] = []
+        attempts: list[int] = []
+
+        async def fetch(key: str):
+            attempts.append(1)
+            if len(attempts) == 1:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(1)
+                    raise
+            return Ok(key)
+
+        result = await hedged(fetch, after=0.01, max_attempts=2)("a")
+        self.assertEqual(result, Ok("a"))
+        self.assertEqual(cancelled, [1])
+
+    async def test_losers_raising_on_cancel_are_retrieved(self) -> None:
+        """Ensure a loser that raises while cancelled is awaited, not reported as unretrieved."""
+        reports: list[dict] = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: reports.append(context)
+        )
+        attempts: list[int] = []
+
+        async def fetch():
+            attempts.append(1)
+            if len(attempts) == 1:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    raise RuntimeError("while cancelled")
+            return Ok(1)
+
+        self.assertEqual(await hedged(fetch, after=0.01, max_attempts=2)(), Ok(1))
+        gc.collect()
+        await asyncio.sleep(0)
+        self.assertEqual(reports, [])
+
+    async def test_every_attempt_fails(self) -> None:
+        """Ensure a combined Fail is returned only after every attempt fails."""
+
+        async def fetch():
+            await asyncio.sleep(0.001)
+            return Fail("down")
+
+        result = await hedged(fetch, after=0.0, max_attempts=4)()
+        self.assertEqual(result.value.total, 4)
+        self.assertEqual(sorted(result.value.indices), [0, 1, 2, 3])
+
+    async def test_attempt_cap(self) -> None:
+        """Ensure no more than max_attempts attempts are started."""
+        attempts: list[int] = []
+
+        async def fetch():
+            attempts.append(1)
+            await asyncio.sleep(0.03)
+            return Ok(len(attempts))
+
+        self.assertTrue((await hedged(fetch, after=0.001, max_attempts=3)()).isOk())
+        self.assertEqual(len(attempts), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
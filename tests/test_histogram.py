@@ -0,0 +1,188 @@
+import asyncio
+import sys
+import threading
+import unittest
+from result.utils.helpers import as_result
+from result.utils.histogram import (
+    LatencyHistogram,
+    _BUCKETS,
+    _LOOKUP,
+    _LOOKUP_LIMIT,
+    _bucket_bounds,
+    _bucket_index,
+)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_bucket_bounds_cover_values(self) -> None:
+        """Ensure every value lands in a bucket whose bounds contain it."""
+        histogram = LatencyHistogram()
+        for value in (0, 1, 63, 64, 65, 1_000, 123_456, 10**9):
+            histogram.record(value)
+            counts = histogram.snapshot().counts
+            index = max(i for i, count in enumerate(counts) if count)
+            low, high = _bucket_bounds(index)
+            self.assertTrue(low <= value < high, (value, low, high))
+            histogram.reset()
+
+    def test_relative_error_is_bounded(self) -> None:
+        """Ensure percentiles are within ~3% of the recorded value."""
+        histogram = LatencyHistogram()
+        for value in (100, 5_000, 250_000, 7_000_000):
+            histogram.reset()
+            histogram.record(value)
+            self.assertLessEqual(
+                abs(histogram.snapshot().p50 - value), value / 32
+            )
+
+    def test_percentiles(self) -> None:
+        """Ensure p50 and p99 follow the recorded distribution."""
+        histogram = LatencyHistogram()
+        for _ in range(990):
+            histogram.record(1_000)
+        for _ in range(10):
+            histogram.record(1_000_000)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot.total, 1000)
+        self.assertLessEqual(abs(snapshot.p50 - 1_000), 1_000 / 32)
+        self.assertLessEqual(abs(snapshot.p99 - 1_000), 1_000 / 32)
+        self.assertLessEqual(abs(snapshot.p999 - 1_000_000), 1_000_000 / 32)
+        self.assertEqual(snapshot.to_dict()["count"], 1000)
+        with self.assertRaises(ValueError):
+            snapshot.percentile(101)
+
+    def test_clamps_huge_values(self) -> None:
+        """Ensure values past the range are counted in the last bucket."""
+        histogram = LatencyHistogram()
+        histogram.record(2**60)
+        self.assertEqual(histogram.snapshot().counts[_BUCKETS - 1], 1)
+
+    def test_empty(self) -> None:
+        """Ensure an empty histogram reports zeros."""
+        snapshot = LatencyHistogram().snapshot()
+        self.assertEqual((snapshot.total, snapshot.p99), (0, 0))
+
+    @unittest.skipIf(
+        not getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "concurrent increments may drop samples without the GIL",
+    )
+    def test_counts_samples_from_threads(self) -> None:
+        """Ensure samples recorded on several threads are all counted."""
+        histogram = LatencyHistogram()
+
+        def work() -> None:
+            for _ in range(1000):
+                histogram.record(500)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(histogram.snapshot().total, 4000)
+
+    def test_lookup_matches_computed_buckets(self) -> None:
+        """Ensure the lookup table agrees with the computed bucket at its edges."""
+        for value in (0, 63, 64, _LOOKUP_LIMIT - 1):
+            self.assertEqual(_LOOKUP[value], _bucket_index(value))
+        histogram = LatencyHistogram()
+        for value in (-5, _LOOKUP_LIMIT - 1, _LOOKUP_LIMIT):
+            histogram.record(value)
+        counts = histogram.snapshot().counts
+        self.assertEqual(counts[0], 1)
+        self.assertEqual(counts[_bucket_index(_LOOKUP_LIMIT)], 1)
+        self.assertEqual(histogram.snapshot().total, 3)
+
+
+class TestTimedAsResult(unittest.TestCase):
+    def test_untimed_has_no_latency(self) -> None:
+        """Ensure timing is opt-in."""
+
+        @as_result(ValueError)
+        def parse(text: str) -> int:
+            return int(text)
+
+        self.assertFalse(hasattr(parse, "latency"))
+
+    def test_ok_and_fail_are_split(self) -> None:
+        """Ensure Ok and Fail calls go into separate histograms."""
+
+        @as_result(ValueError, timed=True)
+        def parse(text: str) -> int:
+            return int(text)
+
+        self.assertTrue(parse("1").isOk())
+        self.assertTrue(parse("2").isOk())
+        self.assertTrue(parse("x").isFail())
+        snapshot = parse.latency.snapshot()
+        self.assertEqual(snapshot["ok"].total, 2)
+        self.assertEqual(snapshot["fail"].total, 1)
+        self.assertGreater(snapshot["ok"].p50, 0)
+        parse.latency.reset()
+        self.assertEqual(parse.latency.snapshot()["ok"].total, 0)
+
+    def test_uncaught_exception_is_not_recorded(self) -> None:
+        """Ensure exceptions outside the caught types propagate untimed."""
+
+        @as_result(ValueError, timed=True)
+        def lookup(key: str) -> int:
+            return {}[key]
+
+        with self.assertRaises(KeyError):
+            lookup("a")
+        snapshot = lookup.latency.snapshot()
+        self.assertEqual(snapshot["ok"].total + snapshot["fail"].total, 0)
+
+    def test_coroutine(self) -> None:
+        """Ensure coroutine functions are timed across the await."""
+
+        @as_result(KeyError, timed=True)
+        async def fetch(key: str) -> str:
+            await asyncio.sleep(0.002)
+            raise KeyError(key)
+
+        self.assertTrue(asyncio.run(fetch("a")).isFail())
+        snapshot = fetch.latency.snapshot()["fail"]
+        self.assertEqual(snapshot.total, 1)
+        self.assertGreaterEqual(snapshot.p50, 1_500_000)
+
+    def test_threads(self) -> None:
+        """Ensure calls from several threads are merged into one snapshot."""
+
+        @as_result(ValueError, timed=True)
+        def parse(text: str) -> int:
+            return int(text)
+
+        def work() -> None:
+            for _ in range(250):
+                parse("7")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(parse.latency.snapshot()["ok"].total, 1000)
+
+    def test_generators_rejected(self) -> None:
+        """Ensure timed=True refuses generator functions."""
+        with self.assertRaises(TypeError):
+
+            @as_result(ValueError, timed=True)
+            def numbers():
+                yield 1
+
+    def test_as_result_all(self) -> None:
+        """Ensure as_result_all accepts timed=True."""
+        from result.utils.helpers import as_result_all
+
+        @as_result_all(timed=True)
+        def fail() -> None:
+            raise RuntimeError("x")
+
+        fail()
+        self.assertEqual(fail.latency.snapshot()["fail"].total, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import io
+import json
+import unittest
+from result.base import Ok, Fail
+from result.json_stream import dump, dumps_result, iter_encode, iter_load, loads_result
+
+
+class TestJSONStream(unittest.TestCase):
+    RESULTS = [Ok(1), Fail("bad"), Ok({"nested": [1, 2.5, None]}), Fail(None), Ok("x" * 40)]
+
+    def test_single_result(self) -> None:
+        """Ensure one result round-trips and the keys are configurable."""
+        self.assertEqual(dumps_result(Ok([1, 2])), '{"ok":[1,2]}')
+        self.assertEqual(dumps_result(Fail("e"), err_key="error"), '{"error":"e"}')
+        self.assertEqual(loads_result(' { "ok" : 3 } '), Ok(3))
+        self.assertEqual(loads_result('{"error":"e"}', err_key="error"), Fail("e"))
+        self.assertRaises(ValueError, loads_result, '{"value":1}')
+        self.assertRaises(json.JSONDecodeError, loads_result, '{"ok":1')
+        self.assertRaises(json.JSONDecodeError, loads_result, '{"ok":1} x')
+
+    def test_encoding_matches_the_json_module(self) -> None:
+        """Ensure the streamed array is valid JSON of one-key objects."""
+        buffer = io.StringIO()
+        dump(self.RESULTS, buffer, batch=2)
+        expected = [{"ok": r.value} if r.isOk() else {"err": r.value} for r in self.RESULTS]
+        self.assertEqual(json.loads(buffer.getvalue()), expected)
+        self.assertEqual("".join(iter_encode([])), "[]")
+        chunks = list(iter_encode(self.RESULTS, batch=1))
+        self.assertEqual(len(chunks), len(self.RESULTS) + 1)
+        self.assertEqual(
+            "".join(iter_encode([Fail(ValueError("x"))], default=repr)), '[{"err":"ValueError(\'x\')"}]'
+        )
+        self.assertRaises(ValueError, iter_encode, [], batch=0)
+
+    def test_decodes_across_read_boundaries(self) -> None:
+        """Ensure elements split between reads (strings, numbers, keys) decode correctly."""
+        text = "".join(iter_encode(self.RESULTS * 3))
+        spaced = text.replace(",", " ,\n ").replace(":", " : ")
+        for source in (text, spaced):
+            for read_size in (1, 3, 7, 64, 1 << 16):
+                with self.subTest(read_size=read_size):
+                    decoded = list(iter_load(io.StringIO(source), read_size=read_size))
+                    self.assertEqual(decoded, self.RESULTS * 3)
+
+        data = "".join(iter_encode([Ok("é€"), Fail(12345)])).encode()
+        self.assertEqual(list(iter_load(io.BytesIO(data), read_size=1)), [Ok("é€"), Fail(12345)])
+        self.assertEqual(list(iter_load(io.StringIO(" [ ] "))), [])
+
+    def test_custom_keys_and_errors(self) -> None:
+        """Ensure custom keys decode and malformed streams raise."""
+        text = "".join(iter_encode(self.RESULTS, ok_key="value", err_key="error"))
+        self.assertEqual(list(iter_load(io.StringIO(text), ok_key="value", err_key="error")), self.RESULTS)
+        for bad in ('{"ok":1}', '[{"ok":1}', '[{"ok":1} {"ok":2}]', '[{"ok":1}] x', '[{"ok":12'):
+            with self.subTest(bad=bad):
+                self.assertRaises(json.JSONDecodeError, list, iter_load(io.StringIO(bad), read_size=4))
+        self.assertRaises(ValueError, list, iter_load(io.StringIO('[{"okay":1}]')))
+        mixed = '[{"ok":1},{"okay":2},{"ok":3}]'
+        self.assertRaises(ValueError, list, iter_load(io.StringIO(mixed)))
+
+    def test_batches_with_braces_in_strings(self) -> None:
+        """Ensure batched decoding is not misled by braces and separators inside strings."""
+        results = [Ok("},{"), Fail('{"ok":1}'), Ok({"a": "}"}), Fail("}")] * 50
+        text = "".join(iter_encode(results))
+        for read_size in (5, 17, 100, 1 << 16):
+            with self.subTest(read_size=read_size):
+                self.assertEqual(list(iter_load(io.StringIO(text), read_size=read_size)), results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+import pickle
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from result.base import Ok, Fail, ErrorRecord
+from result.guards.base import is_fail
+from result.utils.helpers import as_result, result_ok
+from result.utils.parallel import result_map, result_map_processes
+
+
+@as_result(ValueError)
+def _parse(text: str) -> int:
+    return int(text)
+
+
+@as_result(ZeroDivisionError)
+def _invert(value: int) -> float:
+    return 1 / value
+
+
+def _checked(value: int):
+    return Ok(value) if value % 2 else Fail(ValueError(f"{value} is even"))
+
+
+def _sleepy(delay: float):
+    time.sleep(delay)
+    return result_ok(delay)
+
+
+class TestResultMap(unittest.TestCase):
+    def test_keeps_input_order(self) -> None:
+        """Ensure results come back in input order even when later items finish first."""
+        delays = [0.03, 0.0, 0.02, 0.0, 0.01]
+        self.assertEqual(list(result_map(_sleepy, delays, max_in_flight=5)), [Ok(d) for d in delays])
+        results = list(result_map(_parse, ["1", "x", "3"]))
+        self.assertEqual(results[0], Ok(1))
+        self.assertTrue(is_fail(results[1]))
+        self.assertEqual(results[2], Ok(3))
+
+    def test_bounds_in_flight_work(self) -> None:
+        """Ensure no more than max_in_flight items are pulled ahead of the consumer."""
+        pulled: list[int] = []
+
+        def source():
+            for index in range(100):
+                pulled.append(index)
+                yield index
+
+        results = result_map(result_ok, source(), max_in_flight=4)
+        self.assertEqual(next(results), Ok(0))
+        self.assertLessEqual(len(pulled), 5)
+        results.close()
+
+    def test_fail_fast_cancels_pending(self) -> None:
+        """Ensure fail_fast stops at the first Fail and does not run queued calls."""
+        calls: list[str] = []
+        lock = threading.Lock()
+
+        @as_result(ValueError)
+        def work(text: str) -> int:
+            with lock:
+                calls.append(text)
+            time.sleep(0.01)
+            return int(text)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            inputs = ["1", "x"] + ["2"] * 50
+            results = list(result_map(work, inputs, executor, max_in_flight=10, fail_fast=True))
+        self.assertEqual(results[0], Ok(1))
+        self.assertTrue(is_fail(results[-1]))
+        self.assertEqual(len(results), 2)
+        self.assertLess(len(calls), 10)
+
+    def test_fail_fast_submits_nothing_after_the_first_fail(self) -> None:
+        """Ensure no further item is submitted once a Fail has been seen."""
+        calls: list[str] = []
+
+        @as_result(ValueError)
+        def work(text: str) -> int:
+            calls.append(text)
+            return int(text)
+
+        results = list(result_map(work, ["x", "1", "2"], max_in_flight=1, fail_fast=True))
+        self.assertEqual(len(results), 1)
+        self.assertEqual(calls, ["x"])
+
+    def test_catch_converts_exceptions(self) -> None:
+        """Ensure exceptions become Fail by default, as with as_result, unless catch=()."""
+
+        def boom(value: int):
+            raise KeyError(value)
+
+        [result] = result_map(boom, [1])
+        self.assertIsInstance(result.value, KeyError)
+        [result] = result_map(boom, [1], catch=(KeyError,), capture="none")
+        self.assertTrue(is_fail(result))
+        self.assertIsNone(result.value.__traceback__)
+        with self.assertRaises(KeyError):
+            list(result_map(boom, [1], catch=()))
+        with self.assertRaises(KeyError):
+            list(result_map(boom, [1], catch=(ValueError,)))
+
+    def test_rejects_bad_arguments(self) -> None:
+        """Ensure invalid arguments raise immediately, before any work starts."""
+        self.assertRaises(ValueError, result_map, result_ok, [], max_in_flight=0)
+        self.assertRaises(ValueError, result_map, result_ok, [], capture="bogus")
+        self.assertEqual(list(result_map(result_ok, [])), [])
+
+
+class TestResultPickling(unittest.TestCase):
+    def test_pickles_tag_and_value_only(self) -> None:
+        """Ensure Ok/Fail pickle through __reduce__ without their cached hash."""
+        ok = Ok("payload")
+        hash(ok)
+        self.assertEqual(ok.__reduce__(), (Ok, ("payload",)))
+        self.assertEqual(pickle.loads(pickle.dumps(ok, 5)), ok)
+        self.assertEqual(pickle.loads(pickle.dumps(Fail((1, 2)))), Fail((1, 2)))
+        with self.assertRaises(AttributeError):
+            pickle.loads(pickle.dumps(ok))._hash
+
+    def test_error_record(self) -> None:
+        """Ensure ErrorRecord keeps type, message, lineage and a frame summary."""
+        record = ErrorRecord.from_exception(_invert(0).value)
+        self.assertEqual(record.type_name, "builtins.ZeroDivisionError")
+        self.assertEqual(record.message, "division by zero")
+        self.assertEqual(record.trace[-1][2], "_invert")
+        self.assertTrue(record.matches(ArithmeticError))
+        self.assertFalse(record.matches(KeyError))
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+
+
+class TestResultMapProcesses(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.executor.shutdown()
+
+    def test_keeps_order_and_records_errors(self) -> None:
+        """Ensure results keep input order and exceptions come back as ErrorRecord."""
+        results = list(result_map_processes(_invert, range(-50, 50), self.executor, max_workers=2))
+        self.assertEqual(len(results), 100)
+        self.assertEqual(results[0], Ok(1 / -50))
+        self.assertEqual(results[-1], Ok(1 / 49))
+        failure = results[50]
+        self.assertTrue(is_fail(failure))
+        self.assertIsInstance(failure.value, ErrorRecord)
+        self.assertTrue(failure.value.matches(ZeroDivisionError))
+
+    def test_converts_returned_exceptions(self) -> None:
+        """Ensure a Fail holding an exception is converted, other values pass through."""
+        results = list(result_map_processes(_checked, [1, 2, 3], self.executor, chunksize=2))
+        self.assertEqual(results[0], Ok(1))
+        self.assertEqual(results[1].value.message, "2 is even")
+        self.assertEqual(results[2], Ok(3))
+
+    def test_fail_fast(self) -> None:
+        """Ensure fail_fast ends the stream at the first Fail."""
+        results = list(result_map_processes(_invert, [1, 0, 2, 3], self.executor, fail_fast=True))
+        self.assertEqual(len(results), 2)
+        self.assertTrue(is_fail(results[-1]))
+
+    def test_rejects_bad_arguments(self) -> None:
+        """Ensure invalid sizing arguments raise immediately."""
+        self.assertRaises(ValueError, result_map_processes, _invert, [], max_workers=0)
+        self.assertRaises(ValueError, result_map_processes, _invert, [], chunksize=0)
+        self.assertRaises(ValueError, result_map_processes, _invert, [], chunk_ms=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
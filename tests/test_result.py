@@ -1,14 +1,34 @@
+import asyncio
+import inspect
+import pickle
+import subprocess
+import sys
+import tracemalloc
 import unittest
+from dataclasses import dataclass
 from result.utils.helpers import (
+    _INTERNED_FAIL,
     result_ok,
     result_fail,
     result_equality,
     result_combine,
+    result_combine_iter,
+    result_combine_chunked,
+    result_combine_all,
+    result_partition,
     value_or,
     unwrap_or,
+    register_fail_sentinel,
+    as_result,
+    as_result_all,
+    traceback_summary,
+    result_do,
+    result_do_async,
 )
-from result.guards.base import is_result, is_ok, is_fail
-from result.base import Ok, Fail
+from result.guards.base import is_result, is_ok, is_fail, is_some, is_nothing
+from result.base import _RESULT_TYPES, Ok, Fail, ResultArray, ErrorBatch
+from result.nothing import Nothing, NothingClass
+from result.option import Some
 
 
 class TestResult(unittest.TestCase):
@@ -131,6 +151,636 @@ class TestResult(unittest.TestCase):
         self.assertFalse(result.isOk())
 
 
+class TestResultCombineStreaming(unittest.TestCase):
+    def _source(self, pulled: list[int], fail_at: int | None = None):
+        for index in range(10):
+            pulled.append(index)
+            yield result_fail(f"error {index}") if index == fail_at else result_ok(index)
+
+    def test_result_combine_stops_pulling_at_first_fail(self) -> None:
+        """Ensure result_combine accepts generators and stops consuming at the first Fail."""
+        pulled: list[int] = []
+        self.assertEqual(result_combine(self._source(pulled, fail_at=3)), Fail("error 3"))
+        self.assertEqual(pulled, [0, 1, 2, 3])
+        self.assertEqual(result_combine(self._source([])), Ok(tuple(range(10))))
+
+    def test_result_combine_iter(self) -> None:
+        """Ensure result_combine_iter yields Ok values and returns the first Fail."""
+        pulled: list[int] = []
+
+        def consume(results):
+            failure = yield from result_combine_iter(results)
+            return failure
+
+        values = consume(self._source(pulled, fail_at=2))
+        self.assertEqual(next(values), 0)
+        self.assertEqual(next(values), 1)
+        with self.assertRaises(StopIteration) as stop:
+            next(values)
+        self.assertEqual(stop.exception.value, Fail("error 2"))
+        self.assertEqual(pulled, [0, 1, 2])
+        self.assertEqual(list(result_combine_iter(self._source([]))), list(range(10)))
+
+    def test_result_combine_chunked(self) -> None:
+        """Ensure result_combine_chunked yields bounded Ok batches and stops at a Fail."""
+        chunks = list(result_combine_chunked(self._source([]), 4))
+        self.assertEqual(chunks, [Ok((0, 1, 2, 3)), Ok((4, 5, 6, 7)), Ok((8, 9))])
+
+        pulled: list[int] = []
+        chunks = list(result_combine_chunked(self._source(pulled, fail_at=5), 4))
+        self.assertEqual(chunks, [Ok((0, 1, 2, 3)), Fail("error 5")])
+        self.assertEqual(pulled, [0, 1, 2, 3, 4, 5])
+        self.assertEqual(list(result_combine_chunked([], 4)), [])
+        self.assertRaises(ValueError, result_combine_chunked, [], 0)
+
+
+class TestResultCombineAll(unittest.TestCase):
+    def _results(self):
+        return [result_ok(0), result_fail("a"), result_ok(2), result_fail("b"), result_fail("c")]
+
+    def test_result_combine_all_collects_every_fail(self) -> None:
+        """Ensure result_combine_all returns every error with its position."""
+        self.assertEqual(result_combine_all(iter([result_ok(1), result_ok(2)])), Ok((1, 2)))
+        self.assertEqual(result_combine_all([]), Ok(()))
+
+        combined = result_combine_all(self._results())
+        self.assertTrue(is_fail(combined))
+        batch = combined.value
+        self.assertIsInstance(batch, ErrorBatch)
+        self.assertEqual(list(batch), ["a", "b", "c"])
+        self.assertEqual(batch.indices.tolist(), [1, 3, 4])
+        self.assertEqual((len(batch), batch.total, batch.truncated), (3, 3, False))
+        self.assertEqual(hash(combined), hash(result_combine_all(self._results())))
+        self.assertIn(combined, {combined})
+
+    def test_max_errors_caps_collection(self) -> None:
+        """Ensure max_errors bounds the stored errors but still counts the rest."""
+        batch = result_combine_all(self._results(), max_errors=2).value
+        self.assertEqual(batch.errors, ("a", "b"))
+        self.assertEqual(batch.indices.tolist(), [1, 3])
+        self.assertEqual((batch.total, batch.truncated), (3, True))
+
+        batch = result_combine_all(self._results(), max_errors=0).value
+        self.assertEqual((batch.errors, batch.total), ((), 3))
+        self.assertRaises(ValueError, result_combine_all, [], -1)
+
+    def test_result_partition(self) -> None:
+        """Ensure result_partition keeps every Ok value alongside the errors."""
+        values, batch = result_partition(self._results(), max_errors=1)
+        self.assertEqual(values, (0, 2))
+        self.assertEqual((batch.errors, batch.indices.tolist(), batch.total), (("a",), [1], 3))
+
+        values, batch = result_partition(iter([result_ok("x")]))
+        self.assertEqual((values, len(batch), batch.truncated), (("x",), 0, False))
+
+
+class TestResultInterning(unittest.TestCase):
+    def test_result_ok_interns_constants(self) -> None:
+        """Ensure hot constant payloads always return the same Ok instance."""
+        for value in (None, True, False, 0, -5, 256, "", ()):
+            self.assertIs(result_ok(value), result_ok(value))
+            self.assertEqual(result_ok(value), Ok(value))
+        self.assertIs(result_ok(), result_ok(None))
+
+    def test_result_ok_keeps_variants_distinct(self) -> None:
+        """Ensure interning never conflates equal payloads of different types."""
+        self.assertIs(type(result_ok(True).value), bool)
+        self.assertIs(type(result_ok(1).value), int)
+        self.assertIsNot(result_ok(True), result_ok(1))
+        self.assertIsNot(result_ok(1000), result_ok(1000))
+        self.assertEqual(result_ok((1, [2])).value, (1, [2]))
+
+    def test_register_fail_sentinel(self) -> None:
+        """Ensure registered sentinels are returned by result_fail and still match."""
+        # Registration is process-wide: restore the table so later tests see
+        # result_fail("not_found") unshared. Cleanups run last in, first out.
+        saved = {kind: dict(entries) for kind, entries in _INTERNED_FAIL.items()}
+        self.addCleanup(_INTERNED_FAIL.update, saved)
+        self.addCleanup(_INTERNED_FAIL.clear)
+        sentinel = register_fail_sentinel("not_found")
+        self.assertIs(register_fail_sentinel("not_found"), sentinel)
+        self.assertIs(result_fail("not_found"), sentinel)
+        self.assertIsNot(result_fail("other"), result_fail("other"))
+        register_fail_sentinel(("code", 1))
+        self.assertEqual(result_fail(("unhashable", [])).value, ("unhashable", []))
+        self.assertRaises(ValueError, register_fail_sentinel, None)
+        match result_fail("not_found"):
+            case Fail(error):
+                self.assertEqual(error, "not_found")
+            case _:
+                self.fail("Expected a Fail result.")
+
+
+class TestResultHashing(unittest.TestCase):
+    def test_hash_is_variant_tagged(self) -> None:
+        """Ensure Ok and Fail with the same payload hash differently but stay usable as keys."""
+        self.assertNotEqual(hash(Ok("value")), hash(Fail("value")))
+        self.assertEqual(hash(Ok((1, 2))), hash(Ok((1, 2))))
+        keys = {Ok(1): "ok", Fail(1): "fail"}
+        self.assertEqual(keys[Ok(1)], "ok")
+        self.assertEqual(keys[Fail(1)], "fail")
+        self.assertEqual(len({Ok(1), Ok(1), Fail(1)}), 2)
+
+    def test_hash_is_cached(self) -> None:
+        """Ensure the hash is computed once and does not leak into equality or pickling."""
+        result = Ok(tuple(range(100)))
+        first = hash(result)
+        self.assertEqual(result._hash, first)
+        self.assertEqual(hash(result), first)
+        restored = pickle.loads(pickle.dumps(result))
+        self.assertEqual(restored, result)
+        self.assertEqual(hash(restored), first)
+        self.assertRaises(TypeError, hash, Ok([1]))
+
+
+class TestResultDispatch(unittest.TestCase):
+    def test_guards_accept_subclasses(self) -> None:
+        """Ensure tag based dispatch still recognises subclasses of Ok and Fail."""
+        # Unregister the throwaway subclass (and the class slots=True replaced).
+        self.addCleanup(_RESULT_TYPES.intersection_update, set(_RESULT_TYPES))
+
+        @dataclass(frozen=True, slots=True)
+        class Accepted(Ok):
+            pass
+
+        result = Accepted(1)
+        self.assertTrue(is_result(result))
+        self.assertTrue(is_ok(result))
+        self.assertFalse(is_fail(result))
+        self.assertEqual(value_or(result, 0), 1)
+        self.assertEqual(unwrap_or(result, 0), 1)
+        self.assertEqual(result, Ok(1))
+        self.assertTrue(result_equality(result, Ok(1)))
+        self.assertFalse(result_equality(result, Fail(1)))
+
+    def test_variants_never_compare_equal(self) -> None:
+        """Ensure Ok and Fail holding the same value are neither equal nor guard-equal."""
+        self.assertNotEqual(Ok(1), Fail(1))
+        self.assertNotEqual(Fail(1), Ok(1))
+        self.assertFalse(Ok(1) == 1)
+        self.assertFalse(is_result(1))
+
+
+class TestResultArray(unittest.TestCase):
+    def setUp(self) -> None:
+        self.results = [Ok(i) if i % 3 else Fail(f"error {i}") for i in range(20)]
+
+    def test_indexing_rebuilds_results(self) -> None:
+        """Ensure indexing and iteration give back equal Ok/Fail objects that match."""
+        array = ResultArray(self.results, typecode="q")
+        self.assertEqual(len(array), 20)
+        self.assertEqual(list(array), self.results)
+        self.assertEqual([array[i] for i in range(-20, 20)], self.results * 2)
+        self.assertEqual(list(array[5:12:3]), self.results[5:12:3])
+        self.assertRaises(IndexError, array.__getitem__, 20)
+        match array[3]:
+            case Fail(error):
+                self.assertEqual(error, "error 3")
+            case _:
+                self.fail("Expected a Fail result.")
+
+    def test_masks_and_counts(self) -> None:
+        """Ensure the validity masks and counts follow the bitmap."""
+        array = ResultArray(self.results)
+        self.assertEqual(array.is_ok().tolist(), [is_ok(r) for r in self.results])
+        self.assertEqual(array.is_fail().tolist(), [is_fail(r) for r in self.results])
+        self.assertEqual((array.ok_count, array.fail_count), (13, 7))
+
+    def test_whole_array_operations(self) -> None:
+        """Ensure combine, partition and value_or mirror the per-result helpers."""
+        array = ResultArray(self.results, typecode="q")
+        self.assertEqual(array.combine(), result_combine(self.results))
+        oks, fails = array.partition()
+        self.assertEqual(oks.tolist(), [r.value for r in self.results if is_ok(r)])
+        self.assertEqual(fails, tuple(r.value for r in self.results if is_fail(r)))
+        self.assertEqual(array.value_or(-1), [value_or(r, -1) for r in self.results])
+        self.assertEqual(ResultArray([Ok(1), Ok(2)]).combine(), Ok((1, 2)))
+        self.assertEqual(ResultArray([]).combine(), Ok(()))
+        self.assertRaises(TypeError, ResultArray, [1])
+        self.assertRaises(TypeError, ResultArray, [Ok("x")], typecode="q")
+        self.assertRaises(OverflowError, ResultArray, [Ok(300)], typecode="b")
+
+
+class TestAsResult(unittest.TestCase):
+    def test_sync_function(self) -> None:
+        """Ensure plain functions return Ok on success and Fail on a declared exception."""
+
+        @as_result(ValueError)
+        def parse(text: str) -> int:
+            return int(text)
+
+        self.assertEqual(parse("12"), Ok(12))
+        self.assertIsInstance(parse("x").value, ValueError)
+        self.assertRaises(ValueError, as_result)
+        self.assertRaises(ValueError, as_result, int)
+
+    def test_coroutine_function(self) -> None:
+        """Ensure async functions are awaited and their exceptions become Fail."""
+
+        @as_result(ValueError)
+        async def parse(text: str) -> int:
+            await asyncio.sleep(0)
+            return int(text)
+
+        self.assertTrue(inspect.iscoroutinefunction(parse))
+        self.assertEqual(asyncio.run(parse("12")), Ok(12))
+        self.assertIsInstance(asyncio.run(parse("x")).value, ValueError)
+
+    def test_generator_function(self) -> None:
+        """Ensure generators yield Ok items and end with a Fail if they raise."""
+
+        @as_result(ValueError)
+        def parse_all(texts: list[str]):
+            for text in texts:
+                yield int(text)
+
+        self.assertTrue(inspect.isgeneratorfunction(parse_all))
+        self.assertEqual(list(parse_all(["1", "2"])), [Ok(1), Ok(2)])
+        results = list(parse_all(["1", "x", "3"]))
+        self.assertEqual(results[0], Ok(1))
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[1].value, ValueError)
+
+    def test_generator_protocol_is_forwarded(self) -> None:
+        """Ensure send, throw, close and the return value reach the wrapped generator."""
+        events: list[str] = []
+
+        @as_result(ValueError)
+        def accumulate():
+            total = 0
+            try:
+                while True:
+                    try:
+                        total += yield total
+                    except KeyError:
+                        events.append("reset")
+                        total = 0
+                    if total > 100:
+                        return total
+            finally:
+                events.append("closed")
+
+        generator = accumulate()
+        self.assertEqual(next(generator), Ok(0))
+        self.assertEqual(generator.send(5), Ok(5))
+        self.assertEqual(generator.throw(KeyError("x")), Ok(0))
+        with self.assertRaises(StopIteration) as stop:
+            generator.send(200)
+        self.assertEqual(stop.exception.value, 200)
+        self.assertEqual(events, ["reset", "closed"])
+
+        generator = accumulate()
+        next(generator)
+        generator.close()
+        self.assertEqual(events, ["reset", "closed", "closed"])
+
+        generator = accumulate()
+        next(generator)
+        self.assertIsInstance(generator.throw(ValueError("bad")).value, ValueError)
+
+    def test_async_generator_protocol_is_forwarded(self) -> None:
+        """Ensure asend, athrow and aclose reach the wrapped async generator."""
+        events: list[str] = []
+
+        @as_result(ValueError)
+        async def echo():
+            value = None
+            try:
+                while True:
+                    try:
+                        value = yield value
+                    except KeyError:
+                        value = "reset"
+            finally:
+                events.append("closed")
+
+        async def drive() -> list:
+            generator = echo()
+            seen = [await anext(generator), await generator.asend("a")]
+            seen.append(await generator.athrow(KeyError("x")))
+            await generator.aclose()
+            return seen
+
+        self.assertEqual(asyncio.run(drive()), [Ok(None), Ok("a"), Ok("reset")])
+        self.assertEqual(events, ["closed"])
+
+    def test_async_generator_function(self) -> None:
+        """Ensure async generators yield Ok items and end with a Fail if they raise."""
+
+        @as_result(ValueError)
+        async def parse_all(texts: list[str]):
+            for text in texts:
+                yield int(text)
+
+        async def collect(texts: list[str]) -> list:
+            return [result async for result in parse_all(texts)]
+
+        self.assertTrue(inspect.isasyncgenfunction(parse_all))
+        self.assertEqual(asyncio.run(collect(["1", "2"])), [Ok(1), Ok(2)])
+        results = asyncio.run(collect(["1", "x", "3"]))
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[1].value, ValueError)
+
+
+def _fail_with_large_locals(size: int) -> None:
+    payload = bytearray(size)  # kept alive by a retained traceback
+    raise ValueError("failed")
+
+
+class TestTracebackCapture(unittest.TestCase):
+    def _retained_bytes(self, capture: str, calls: int = 500) -> float:
+        wrapped = as_result_all(capture=capture)(_fail_with_large_locals)
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            held = [wrapped(4096) for _ in range(calls)]
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(held), calls)
+        return (after - before) / calls
+
+    def test_full_capture_keeps_traceback(self) -> None:
+        """Ensure the default policy keeps the traceback and the frame locals it references."""
+        result = as_result(ValueError)(_fail_with_large_locals)(16)
+        self.assertIsNotNone(result.value.__traceback__)
+        self.assertIsNone(traceback_summary(result.value))
+        self.assertGreater(self._retained_bytes("full"), 4096)
+
+    def test_summary_capture(self) -> None:
+        """Ensure the summary policy records file, line and function, then drops the traceback."""
+        result = as_result(ValueError, capture="summary")(_fail_with_large_locals)(16)
+        self.assertIsNone(result.value.__traceback__)
+        (entry,) = traceback_summary(result.value)
+        self.assertEqual(entry[0], __file__)
+        self.assertEqual(entry[2], "_fail_with_large_locals")
+        self.assertLess(self._retained_bytes("summary"), 1024)
+
+    def test_none_capture_releases_frames(self) -> None:
+        """Ensure dropping the traceback keeps retained memory per failure flat."""
+        result = as_result(ValueError, capture="none")(_fail_with_large_locals)(16)
+        self.assertIsNone(result.value.__traceback__)
+        self.assertLess(self._retained_bytes("none"), 1024)
+        self.assertRaises(ValueError, as_result, ValueError, capture="partial")
+
+
+class TestLazyImports(unittest.TestCase):
+    def _loaded_modules(self, statement: str) -> set[str]:
+        script = f"{statement}; import sys; print(*sorted(sys.modules))"
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout
+        return set(output.split())
+
+    def test_package_import_loads_no_submodules(self) -> None:
+        """Ensure a bare package import defers every submodule."""
+        loaded = self._loaded_modules("import result")
+        self.assertNotIn("result.base", loaded)
+        self.assertNotIn("result.utils.helpers", loaded)
+
+    def test_name_import_loads_only_its_module(self) -> None:
+        """Ensure importing a type does not pull in the helpers or guards."""
+        loaded = self._loaded_modules("from result import Ok")
+        self.assertIn("result.base", loaded)
+        self.assertNotIn("result.utils.helpers", loaded)
+        self.assertNotIn("result.guards.base", loaded)
+
+    def test_lazy_names_resolve(self) -> None:
+        """Ensure every exported name resolves and unknown names still raise."""
+        import result
+
+        for name in result.__all__:
+            self.assertIsNotNone(getattr(result, name))
+        self.assertIn("as_result", dir(result))
+        self.assertRaises(AttributeError, getattr, result, "missing")
+
+    def test_submodules_reachable_as_attributes(self) -> None:
+        """Ensure submodules load on attribute access after a bare package import."""
+        loaded = self._loaded_modules(
+            "import result; result.utils.helpers; result.base; result.guards.base"
+        )
+        self.assertIn("result.utils.helpers", loaded)
+        self.assertIn("result.base", loaded)
+        self.assertIn("result.guards.base", loaded)
+
+
+class TestResultCombinators(unittest.TestCase):
+    def test_ok_combinators(self) -> None:
+        """Ensure Ok transforms its value and returns itself from the error-side combinators."""
+        result = Ok(2)
+        seen: list[int] = []
+        self.assertEqual(result.map(lambda value: value * 10), Ok(20))
+        self.assertEqual(result.and_then(lambda value: Fail(value)), Fail(2))
+        self.assertIs(result.map_err(str), result)
+        self.assertIs(result.or_else(lambda error: Ok(0)), result)
+        self.assertIs(result.inspect(seen.append), result)
+        self.assertIs(result.inspect_err(seen.append), result)
+        self.assertEqual(seen, [2])
+
+    def test_fail_combinators(self) -> None:
+        """Ensure Fail never allocates on the success-side combinators."""
+        result = Fail("error")
+        seen: list[str] = []
+        self.assertIs(result.map(str.upper), result)
+        self.assertIs(result.and_then(lambda value: Ok(value)), result)
+        self.assertEqual(result.map_err(str.upper), Fail("ERROR"))
+        self.assertEqual(result.or_else(lambda error: Ok(len(error))), Ok(5))
+        self.assertIs(result.inspect(seen.append), result)
+        self.assertIs(result.inspect_err(seen.append), result)
+        self.assertEqual(seen, ["error"])
+
+    def test_chain_short_circuits(self) -> None:
+        """Ensure a chain stops transforming after the first Fail."""
+        calls: list[str] = []
+
+        def halve(value: int):
+            calls.append("halve")
+            return Ok(value // 2) if value % 2 == 0 else Fail(f"{value} is odd")
+
+        result = Ok(12).and_then(halve).and_then(halve).and_then(halve).map(str)
+        self.assertEqual(result, Fail("3 is odd"))
+        self.assertEqual(calls, ["halve"] * 3)
+
+
+class TestResultDo(unittest.TestCase):
+    def test_result_do_threads_ok_values(self) -> None:
+        """Ensure yielded Ok values are sent back and the return value is wrapped in Ok."""
+
+        @result_do
+        def total(a: int, b: int):
+            first = yield result_ok(a)
+            second = yield result_ok(b)
+            return first + second
+
+        self.assertEqual(total(1000, 2000), Ok(3000))
+
+    def test_result_do_short_circuits(self) -> None:
+        """Ensure the first Fail is returned and the generator is closed."""
+        cleaned_up: list[bool] = []
+
+        @result_do
+        def steps():
+            try:
+                yield result_ok(1)
+                yield result_fail("error")
+                raise AssertionError("must not resume after a Fail")
+            finally:
+                cleaned_up.append(True)
+
+        self.assertEqual(steps(), Fail("error"))
+        self.assertEqual(cleaned_up, [True])
+        self.assertRaises(TypeError, result_do, lambda: None)
+
+    def test_result_do_async(self) -> None:
+        """Ensure the async flavour returns the last yielded result or the first Fail."""
+
+        async def fetch(value: int):
+            await asyncio.sleep(0)
+            return result_ok(value) if value >= 0 else result_fail("negative")
+
+        @result_do_async
+        async def total(a: int, b: int):
+            first = yield await fetch(a)
+            second = yield await fetch(b)
+            yield result_ok(first + second)
+
+        @result_do_async
+        async def empty():
+            return
+            yield
+
+        self.assertEqual(asyncio.run(total(1000, 2000)), Ok(3000))
+        self.assertEqual(asyncio.run(total(-1, 2000)), Fail("negative"))
+        self.assertEqual(asyncio.run(empty()), Ok(None))
+        self.assertRaises(TypeError, result_do_async, total)
+        self.assertTrue(inspect.iscoroutinefunction(total))
+        self.assertEqual(total.__code__.co_name, "total")
+
+    def test_result_do_is_compiled_to_early_returns(self) -> None:
+        """Ensure a rewritable body runs as a plain function keeping closures and defaults."""
+        offset = 10
+
+        @result_do
+        def total(a: int, b: int = 2, *, scale: int = 1):
+            first: int = yield result_ok(a + offset)
+            yield result_ok(None)
+            second = yield result_ok(b)
+            if second < 0:
+                return "negative"
+            return (first + second) * scale
+
+        # The rebuilt function keeps the body's code name; the generator
+        # driver's would be "wrapper".
+        self.assertEqual(total.__code__.co_name, "total")
+        self.assertEqual(total(1), Ok(13))
+        self.assertEqual(total(1, 3, scale=2), Ok(28))
+        self.assertEqual(total(1, -1), Ok("negative"))
+        self.assertEqual(total.__name__, "total")
+
+        @result_do
+        def failing(a: int):
+            yield result_fail("error")
+            raise ValueError(a)
+
+        self.assertEqual(failing(1), Fail("error"))
+
+        @result_do
+        def raising():
+            yield result_ok(1)
+            raise ValueError("boom")
+
+        try:
+            raising()
+        except ValueError as error:
+            frame = error.__traceback__.tb_next
+        self.assertEqual(frame.tb_frame.f_code.co_name, "raising")
+        self.assertEqual(
+            frame.tb_lineno, raising.__wrapped__.__code__.co_firstlineno + 3
+        )
+
+    def test_result_do_falls_back_to_the_generator(self) -> None:
+        """Ensure bodies an early return would change are still driven as generators."""
+        seen: list[type | None] = []
+
+        class Recorder:
+            def __enter__(self) -> None:
+                pass
+
+            def __exit__(self, kind: type | None, *_: object) -> None:
+                seen.append(kind)
+
+        @result_do
+        def in_with():
+            with Recorder():
+                yield result_fail("error")
+
+        @result_do
+        def nested():
+            return (yield result_ok(1)) + (yield result_ok(2))
+
+        self.assertEqual(in_with(), Fail("error"))
+        self.assertEqual(seen, [GeneratorExit])
+        self.assertEqual(nested(), Ok(3))
+        self.assertEqual(nested.__code__.co_name, "wrapper")
+
+
+class TestOption(unittest.TestCase):
+    def test_nothing_is_a_singleton(self) -> None:
+        """Ensure Nothing is never re-created, copied or given attributes."""
+        self.assertIs(NothingClass(), Nothing)
+        self.assertIs(pickle.loads(pickle.dumps(Nothing)), Nothing)
+        self.assertFalse(hasattr(Nothing, "__dict__"))
+        self.assertRaises(RuntimeError, Nothing.__nothing__)
+
+    def test_some_combinators(self) -> None:
+        """Ensure Some applies functions and converts to Ok."""
+        option = Some(2)
+        self.assertEqual(option.map(lambda value: value * 10), Some(20))
+        self.assertEqual(option.and_then(lambda value: Some(value + 1)), Some(3))
+        self.assertIs(option.and_then(lambda value: Nothing), Nothing)
+        self.assertEqual(option.unwrap_or(0), 2)
+        self.assertEqual(option.ok_or("missing"), Ok(2))
+        self.assertTrue(is_some(option))
+        self.assertFalse(is_nothing(option))
+
+    def test_nothing_combinators(self) -> None:
+        """Ensure Nothing short-circuits without calling functions or allocating."""
+
+        def unexpected(value: object) -> object:
+            raise AssertionError("Nothing must not call the function")
+
+        self.assertIs(Nothing.map(unexpected), Nothing)
+        self.assertIs(Nothing.and_then(unexpected), Nothing)
+        self.assertEqual(Nothing.unwrap_or(0), 0)
+        self.assertEqual(Nothing.ok_or("missing"), Fail("missing"))
+        self.assertTrue(is_nothing(Nothing))
+        self.assertFalse(is_some(Nothing))
+
+    def test_nothing_ok_or_uses_sentinels(self) -> None:
+        """Ensure Nothing.ok_or returns a registered sentinel instead of a new Fail."""
+        saved = {kind: dict(entries) for kind, entries in _INTERNED_FAIL.items()}
+        self.addCleanup(_INTERNED_FAIL.update, saved)
+        self.addCleanup(_INTERNED_FAIL.clear)
+        sentinel = register_fail_sentinel("absent")
+        self.assertIs(Nothing.ok_or("absent"), sentinel)
+
+    def test_guards_reject_non_options(self) -> None:
+        """Ensure is_some and is_nothing are real type guards for other values."""
+        for value in (None, Ok(1), Fail("x"), 0, "some"):
+            with self.subTest(value=value):
+                self.assertFalse(is_some(value))
+                self.assertFalse(is_nothing(value))
+
+    def test_pattern_matching_on_option(self) -> None:
+        """Ensure Some and Nothing can be told apart with class patterns."""
+        for option, expected in ((Some(1), 1), (Nothing, None)):
+            match option:
+                case Some(value):
+                    self.assertEqual(value, expected)
+                case NothingClass():
+                    self.assertIsNone(expected)
+
+
 class TestResultPatternMatching(unittest.TestCase):
     def test_pattern_matching_on_result_ok(self) -> None:
         """
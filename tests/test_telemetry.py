@@ -0,0 +1,95 @@
+import asyncio
+import sys
+import unittest
+from result import telemetry
+from result.utils.deadlines import deadline
+from result.utils.helpers import as_result
+
+
+@as_result(ValueError)
+def _parse(text: str) -> int:
+    return int(text)
+
+
+@as_result(KeyError)
+async def _fetch(key: str) -> str:
+    raise KeyError(key)
+
+
+@as_result(ZeroDivisionError)
+def _invert_all(values: list[int]):
+    for value in values:
+        yield 1 / value
+
+
+@as_result(TimeoutError, deadline=True)
+def _bounded() -> int:
+    return 1
+
+
+class TestTelemetry(unittest.TestCase):
+    def setUp(self) -> None:
+        telemetry.reset()
+
+    def tearDown(self) -> None:
+        telemetry.disable()
+        telemetry.reset()
+
+    def test_disabled_by_default(self) -> None:
+        """Ensure nothing is counted or registered until enable() is called."""
+        _parse("1")
+        self.assertFalse(telemetry.is_enabled())
+        self.assertEqual(telemetry.snapshot()["functions"], {})
+
+    def test_counts_per_function_and_exception(self) -> None:
+        """Ensure Ok/Fail are counted per function and Fail per exception class."""
+        telemetry.enable()
+        self.assertTrue(telemetry.is_enabled())
+        _parse("1"), _parse("x"), _parse("2")
+        asyncio.run(_fetch("k"))
+        list(_invert_all([1, 0]))
+        data = telemetry.snapshot()
+        functions = data["functions"]
+        self.assertEqual(functions[f"{__name__}._parse"], {"ok": 2, "fail": 1})
+        self.assertEqual(functions[f"{__name__}._fetch"], {"ok": 0, "fail": 1})
+        self.assertEqual(functions[f"{__name__}._invert_all"], {"ok": 1, "fail": 1})
+        self.assertEqual(
+            data["exceptions"],
+            {"builtins.ValueError": 1, "builtins.KeyError": 1, "builtins.ZeroDivisionError": 1},
+        )
+
+    def test_sampling_and_disable(self) -> None:
+        """Ensure sampling counts one result in N and disable stops counting."""
+        telemetry.enable(sample_rate=0.1)
+        for _ in range(100):
+            _parse("1")
+        self.assertEqual(telemetry.snapshot()["functions"][f"{__name__}._parse"]["ok"], 10)
+        self.assertEqual(telemetry.snapshot()["sample_rate"], 0.1)
+        telemetry.disable()
+        self.assertIsNone(sys.monitoring.get_tool(3))
+        _parse("1")
+        self.assertEqual(telemetry.snapshot()["functions"][f"{__name__}._parse"]["ok"], 10)
+        self.assertRaises(ValueError, telemetry.enable, 0)
+
+    def test_expired_deadline_is_not_an_exception(self) -> None:
+        """Ensure only Fails holding a caught exception are counted per exception class."""
+        telemetry.enable()
+        with deadline(0):
+            result = _bounded()
+        self.assertTrue(result.isFail())
+        data = telemetry.snapshot()
+        self.assertEqual(data["functions"][f"{__name__}._bounded"], {"ok": 0, "fail": 1})
+        self.assertEqual(data["exceptions"], {})
+
+    def test_prometheus_export(self) -> None:
+        """Ensure the Prometheus text lists outcome and failure counters."""
+        telemetry.enable()
+        _parse("x")
+        text = telemetry.to_prometheus()
+        self.assertIn(f'result_outcomes_total{{function="{__name__}._parse",outcome="fail"}} 1\n', text)
+        self.assertIn('result_failures_total{exception="builtins.ValueError"} 1\n', text)
+        self.assertIn("# TYPE result_outcomes_total counter\n", text)
+
+
+if __name__ == "__main__":
+    unittest.main()